@@ -10,6 +10,7 @@ Usage:
     python benchmarks/run_benchmarks.py --live          # + live RSS (fresh + cache hit)
     python benchmarks/run_benchmarks.py --live-csv      # + live CSV export (Chrome, ~10-15s/run)
     python benchmarks/run_benchmarks.py --live-explore  # + live Explore (Chrome, 10-90s)
+    python benchmarks/run_benchmarks.py --archive       # + keyword lookups on a 3M-row archive
 
 Results are recorded per release in benchmarks/README.md.
 
@@ -17,31 +18,46 @@ NOTE: the offline benchmarks intentionally call two *internal* helpers
 (``rss_downloader._parse_rss_xml``, ``normalize.normalize_rss``) to isolate
 parsing from network time. Internals are NOT covered by the stability contract
 (see STABILITY.md); this script lives in the repo and moves with them.
+``tree_parse_rss_xml`` below is the 1.6.0 parser kept verbatim as the baseline
+the current parser (streaming, or a whole-tree read for lean parses) is
+measured against.
 """
 
 import argparse
+import os
 import platform
 import shutil
+import sqlite3
 import statistics
 import sys
 import tempfile
 import time
 import timeit
-from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple, Union
 
 import trendspyg
 from trendspyg import (
+    archive,
     clear_rss_cache,
     diff_trends,
     download_google_trends_csv,
     download_google_trends_interest_over_time,
     download_google_trends_rss,
     filter_changes,
+    get_keyword_history,
+    rss_downloader,
 )
 from trendspyg.normalize import normalize_rss  # internal: parse-only timing
 from trendspyg.rss_downloader import _parse_rss_xml  # internal: parse-only timing
+from trendspyg.utils import TTLCache, _parse_traffic_to_min
 
 FEED_ITEMS = 20  # matches a real Trending Now RSS feed (~10-20 items)
+LARGE_FEED_ITEMS = 2000  # a batched / concatenated feed, to show scaling
+CACHE_SIZE = 100_000  # a TTLCache far larger than the RSS default, to show eviction cost
+ARCHIVE_ROWS = 3_000_000  # trend rows in the synthetic archive for --archive
+ARCHIVE_VOCABULARY = 50_000  # distinct keywords spread across those rows
 
 
 class Result(NamedTuple):
@@ -104,6 +120,66 @@ def synthetic_snapshots(n: int = FEED_ITEMS) -> Tuple[List[Dict[str, Any]], List
     return old, new
 
 
+def tree_parse_rss_xml(
+    xml_content: bytes,
+    geo: str,
+    include_images: bool,
+    include_articles: bool,
+    max_articles_per_trend: int,
+) -> List[Dict]:
+    """The 1.6.0 parser: whole tree via ``fromstring``, then ``find()`` per field."""
+    root = ET.fromstring(xml_content)
+    ns = {"ht": "https://trends.google.com/trending/rss"}
+    trends = []
+    for item in root.findall(".//item"):
+        title = item.find("title")
+        trend = title.text if title is not None else "N/A"
+        traffic_elem = item.find("ht:approx_traffic", ns)
+        traffic = traffic_elem.text if traffic_elem is not None else "N/A"
+        pub_date_elem = item.find("pubDate")
+        pub_date_str = pub_date_elem.text if pub_date_elem is not None else None
+        published: Union[datetime, str, None] = None
+        if pub_date_str:
+            try:
+                published = datetime.strptime(pub_date_str, "%a, %d %b %Y %H:%M:%S %z")
+            except ValueError:
+                published = pub_date_str
+        trend_data: Dict = {
+            "trend": trend,
+            "traffic": traffic,
+            "traffic_min": _parse_traffic_to_min(traffic),
+            "published": published,
+            "explore_link": (
+                f"https://trends.google.com/trends/explore?q={trend}&geo={geo}&hl=en-US"
+            ),
+        }
+        if include_images:
+            picture_elem = item.find("ht:picture", ns)
+            picture_source_elem = item.find("ht:picture_source", ns)
+            trend_data["image"] = {
+                "url": picture_elem.text if picture_elem is not None else None,
+                "source": picture_source_elem.text if picture_source_elem is not None else None,
+            }
+        if include_articles:
+            articles = []
+            for news in item.findall("ht:news_item", ns)[:max_articles_per_trend]:
+                headline_elem = news.find("ht:news_item_title", ns)
+                url_elem = news.find("ht:news_item_url", ns)
+                source_elem = news.find("ht:news_item_source", ns)
+                image_elem = news.find("ht:news_item_picture", ns)
+                articles.append(
+                    {
+                        "headline": headline_elem.text if headline_elem is not None else None,
+                        "url": url_elem.text if url_elem is not None else None,
+                        "source": source_elem.text if source_elem is not None else None,
+                        "image": image_elem.text if image_elem is not None else None,
+                    }
+                )
+            trend_data["news_articles"] = articles
+        trends.append(trend_data)
+    return trends
+
+
 # ---------------------------------------------------------------------------
 # Harness
 # ---------------------------------------------------------------------------
@@ -156,6 +232,159 @@ def print_table(results: List[Result]) -> None:
 # ---------------------------------------------------------------------------
 
 
+def run_parsers() -> List[Result]:
+    """Current parser (stdlib, and lxml when installed) vs the 1.6.0 tree parser.
+
+    The full cases stream; the lean case takes the whole-tree path.
+    """
+    full = dict(include_images=True, include_articles=True, max_articles_per_trend=5)
+    lean = dict(include_images=False, include_articles=False, max_articles_per_trend=0)
+    cases = [
+        ("{} trends".format(FEED_ITEMS), synthetic_feed(), full, 200),
+        ("{} trends, lean".format(FEED_ITEMS), synthetic_feed(), lean, 200),
+        ("{} trends".format(LARGE_FEED_ITEMS), synthetic_feed(LARGE_FEED_ITEMS), full, 3),
+    ]
+    backends = [("stdlib", None)]
+    try:
+        from lxml import etree
+
+        backends.append(("lxml", etree))
+    except ImportError:
+        pass
+
+    results = []
+    installed = rss_downloader._lxml_etree
+    try:
+        for label, feed, options, number in cases:
+            results.append(
+                bench_micro(
+                    "parse RSS XML, 1.6.0 tree ({})".format(label),
+                    lambda: tree_parse_rss_xml(feed, geo="US", **options),
+                    number=number,
+                )
+            )
+            for backend, module in backends:
+                rss_downloader._lxml_etree = module
+                results.append(
+                    bench_micro(
+                        "parse RSS XML, 1.7.0 {} ({})".format(backend, label),
+                        lambda: _parse_rss_xml(feed, geo="US", **options),
+                        number=number,
+                    )
+                )
+    finally:
+        rss_downloader._lxml_etree = installed
+    return results
+
+
+def run_cache() -> List[Result]:
+    """A full cache taking one-off keys: every set has to evict something."""
+    cache: TTLCache = TTLCache(ttl=300.0, max_size=CACHE_SIZE)
+    for i in range(CACHE_SIZE):
+        cache.set("warm-{}".format(i), i)
+    keys = iter(range(10**9))
+
+    return [
+        bench_micro(
+            "TTLCache.set at capacity ({:,} entries)".format(CACHE_SIZE),
+            lambda: cache.set("new-{}".format(next(keys)), 0),
+            number=5000,
+        ),
+        bench_micro(
+            "TTLCache.get hit ({:,} entries)".format(CACHE_SIZE),
+            lambda: cache.get("new-0"),
+            number=5000,
+        ),
+    ]
+
+
+def build_pre_1_7_archive(path: str, rows: int) -> None:
+    """A synthetic archive in the pre-1.7 layout: keyword indexed BINARY only."""
+    schema = archive._SCHEMA.replace("DROP INDEX IF EXISTS idx_trends_keyword;", "").replace(
+        "idx_trends_keyword_nocase ON trends(keyword COLLATE NOCASE)",
+        "idx_trends_keyword ON trends(keyword)",
+    )
+    snapshots = rows // FEED_ITEMS
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(schema)
+        conn.execute("INSERT INTO meta VALUES ('db_schema_version', '1')")
+        conn.executemany(
+            "INSERT INTO snapshots (id, source, geo, fetched_at, schema_version, trend_count,"
+            " payload_json) VALUES (?, 'rss', 'US', ?, '1.0', ?, '{}')",
+            (
+                (i, "2026-01-01T00:00:00+00:00#{:08d}".format(i), FEED_ITEMS)
+                for i in range(snapshots)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO trends (snapshot_id, keyword, rank, volume_min) VALUES (?, ?, ?, 1000)",
+            (
+                (i // FEED_ITEMS, "Topic {}".format(i % ARCHIVE_VOCABULARY), i % FEED_ITEMS + 1)
+                for i in range(snapshots * FEED_ITEMS)
+            ),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_archive(rows: int) -> List[Result]:
+    """Case-insensitive keyword history before/after the NOCASE keyword index."""
+    sql = (
+        "SELECT s.fetched_at, s.geo, s.source, t.rank, t.volume_min"
+        " FROM trends t JOIN snapshots s ON s.id = t.snapshot_id"
+        " WHERE t.keyword = ? COLLATE NOCASE ORDER BY s.fetched_at ASC"
+    )
+    keyword = "topic 4242"
+    workdir = tempfile.mkdtemp(prefix="trendspyg_bench_")
+    path = os.path.join(workdir, "archive.db")
+    try:
+        start = time.perf_counter()
+        build_pre_1_7_archive(path, rows)
+        print(
+            "Built a {:,}-row archive in {}".format(rows, fmt_seconds(time.perf_counter() - start))
+        )
+
+        conn = sqlite3.connect(path)
+        try:
+            plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, (keyword,))]
+            before = bench_micro(
+                "keyword history, BINARY index ({:,} rows)".format(rows),
+                lambda: conn.execute(sql, (keyword,)).fetchall(),
+                number=1,
+                repeats=3,
+            )
+        finally:
+            conn.close()
+        print("  pre-1.7 plan:  " + " | ".join(plan))
+
+        start = time.perf_counter()
+        archive._connect(path).close()  # first touch by this version builds the NOCASE index
+        upgrade = time.perf_counter() - start
+        conn = sqlite3.connect(path)
+        try:
+            plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, (keyword,))]
+        finally:
+            conn.close()
+        print("  1.7 plan:      " + " | ".join(plan))
+        print()
+
+        after = bench_micro(
+            "keyword history, NOCASE index ({:,} rows)".format(rows),
+            lambda: get_keyword_history(keyword, db_path=path),
+            number=20,
+        )
+        return [
+            before,
+            Result("one-off index upgrade ({:,} rows)".format(rows), 1, upgrade, upgrade, upgrade),
+            after,
+        ]
+    finally:
+        archive._close_connections()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
 def run_offline() -> List[Result]:
     feed = synthetic_feed()
     parsed = _parse_rss_xml(
@@ -164,36 +393,29 @@ def run_offline() -> List[Result]:
     old, new = synthetic_snapshots()
     changes = diff_trends(old, new)
 
-    return [
-        bench_micro(
-            "parse RSS XML ({} trends)".format(FEED_ITEMS),
-            lambda: _parse_rss_xml(
-                feed,
-                geo="US",
-                include_images=True,
-                include_articles=True,
-                max_articles_per_trend=5,
+    return (
+        run_parsers()
+        + run_cache()
+        + [
+            bench_micro(
+                "normalize_rss ({} trends)".format(FEED_ITEMS),
+                lambda: normalize_rss(parsed, "US"),
+                number=200,
             ),
-            number=200,
-        ),
-        bench_micro(
-            "normalize_rss ({} trends)".format(FEED_ITEMS),
-            lambda: normalize_rss(parsed, "US"),
-            number=200,
-        ),
-        bench_micro(
-            "diff_trends ({} vs {} trends)".format(FEED_ITEMS, FEED_ITEMS),
-            lambda: diff_trends(old, new),
-            number=2000,
-        ),
-        bench_micro(
-            "filter_changes ({} changes)".format(len(changes)),
-            lambda: filter_changes(
-                changes, min_volume=150_000, events=("new", "volume_up"), keywords=["topic"]
+            bench_micro(
+                "diff_trends ({} vs {} trends)".format(FEED_ITEMS, FEED_ITEMS),
+                lambda: diff_trends(old, new),
+                number=2000,
             ),
-            number=2000,
-        ),
-    ]
+            bench_micro(
+                "filter_changes ({} changes)".format(len(changes)),
+                lambda: filter_changes(
+                    changes, min_volume=150_000, events=("new", "volume_up"), keywords=["topic"]
+                ),
+                number=2000,
+            ),
+        ]
+    )
 
 
 def run_live_rss(repeats: int) -> List[Result]:
@@ -245,6 +467,17 @@ def main() -> int:
         action="store_true",
         help="run the live Explore benchmark (Chrome, 10-90s)",
     )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="run keyword lookups on a synthetic multi-million-row archive (~1 min, ~300 MB temp)",
+    )
+    parser.add_argument(
+        "--archive-rows",
+        type=int,
+        default=ARCHIVE_ROWS,
+        help="trend rows in the --archive benchmark (default {:,})".format(ARCHIVE_ROWS),
+    )
     parser.add_argument(
         "--repeats", type=int, default=5, help="repeats for live RSS runs (default 5)"
     )
@@ -258,6 +491,8 @@ def main() -> int:
     print()
 
     results = run_offline()
+    if args.archive:
+        results.extend(run_archive(args.archive_rows))
     if args.live:
         results.extend(run_live_rss(args.repeats))
     if args.live_csv:
@@ -266,7 +501,7 @@ def main() -> int:
         results.extend(run_live_explore())
 
     print_table(results)
-    if not (args.live or args.live_csv or args.live_explore):
+    if not (args.live or args.live_csv or args.live_explore or args.archive):
         print()
         print("Offline suite only. Add --live / --live-csv / --live-explore for end-to-end runs.")
     return 0
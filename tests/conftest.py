@@ -4,6 +4,37 @@ Pytest configuration and fixtures
 
 import pytest
 
+from trendspyg.archive import (
+    _close_connections,
+    configure_archive_storage,
+    configure_archive_writer,
+)
+from trendspyg.utils import configure_rss_cache, get_rss_governor
+
+
+@pytest.fixture(autouse=True)
+def _reset_rss_governor():
+    """Tests that simulate 429s must not slow down the rest of the suite"""
+    get_rss_governor().reset()
+    yield
+    get_rss_governor().reset()
+
+
+@pytest.fixture(autouse=True)
+def _reset_rss_cache_config():
+    """Stale serving and byte budgets are opt-in; a test that sets them must not leak them"""
+    yield
+    configure_rss_cache(stale_while_revalidate=0, stale_if_error=0, max_bytes=0)
+
+
+@pytest.fixture(autouse=True)
+def _close_archive_connections():
+    """Pooled SQLite connections and a test's writer/storage settings must not outlive it"""
+    yield
+    configure_archive_writer(enabled=False)
+    configure_archive_storage()
+    _close_connections()
+
 
 @pytest.fixture
 def sample_rss_trends():
@@ -5,7 +5,10 @@ _default_db_path are exercised in EVERY cell via monkeypatch, so per-module
 coverage stays identical across the CI matrix.
 """
 
+import hashlib
+import itertools
 import json
+import os
 import sqlite3
 import sys
 from datetime import datetime, timezone
@@ -26,6 +29,7 @@ from trendspyg.archive import (
     get_keyword_history,
     prune_archive,
     read_archive,
+    store_snapshots,
 )
 from trendspyg.exceptions import ArchiveError, InvalidParameterError
 
@@ -126,6 +130,28 @@ class TestConnect:
         assert "999" in str(exc_info.value)
         assert "Upgrade trendspyg" in str(exc_info.value)
 
+    def test_pre_1_7_file_gains_validator_columns_in_place(self, tmp_path):
+        db = str(tmp_path / "old.db")
+        raw = sqlite3.connect(db)
+        raw.executescript(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+            "INSERT INTO meta VALUES ('db_schema_version', '1');"
+            "CREATE TABLE cache (key TEXT PRIMARY KEY, stored_at REAL NOT NULL,"
+            " payload_json TEXT NOT NULL);"
+            "INSERT INTO cache VALUES ('rss:US', 1.0, '[]');"
+        )
+        raw.commit()
+        raw.close()
+
+        conn = _connect(db)
+        try:
+            columns = {r[1] for r in conn.execute("PRAGMA table_info(cache)")}
+            row = conn.execute("SELECT payload_json, etag FROM cache").fetchone()
+        finally:
+            conn.close()
+        assert {"etag", "last_modified", "content_hash"} <= columns
+        assert tuple(row) == ("[]", None)  # existing rows survive the upgrade
+
     def test_unwritable_parent_raises_archive_error(self, tmp_path):
         blocker = tmp_path / "file"
         blocker.write_text("x")
@@ -135,6 +161,105 @@ class TestConnect:
         assert "Cannot open trends archive" in str(exc_info.value)
 
 
+class TestConnectionPool:
+    def test_same_thread_reuses_one_connection(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        with archive._connection(db) as first:
+            pass
+        _store_snapshot(make_envelope(), db_path=db)
+        with archive._connection(db) as second:
+            assert second is first
+
+    def test_threads_get_their_own_connection(self, tmp_path):
+        import threading
+
+        db = str(tmp_path / "a.db")
+        seen = []
+
+        def borrow():
+            with archive._connection(db) as conn:
+                seen.append(conn)
+
+        borrow()
+        worker = threading.Thread(target=borrow)
+        worker.start()
+        worker.join()
+        assert len(seen) == 2 and seen[0] is not seen[1]
+
+    def test_schema_verified_once_per_process(self, tmp_path, monkeypatch):
+        import threading
+
+        db = str(tmp_path / "a.db")
+        calls = []
+        real_ensure = archive._ensure_schema
+
+        def counting_ensure(conn, path):
+            calls.append(path)
+            real_ensure(conn, path)
+
+        monkeypatch.setattr(archive, "_ensure_schema", counting_ensure)
+        _store_snapshot(make_envelope(), db_path=db)
+        worker = threading.Thread(target=get_archive_stats, kwargs={"db_path": db})
+        worker.start()
+        worker.join()
+        read_archive(db_path=db)
+        assert len(calls) == 1
+
+    def test_replaced_file_is_reopened(self, tmp_path):
+        db = tmp_path / "a.db"
+        _store_snapshot(make_envelope(), db_path=str(db))
+        with archive._connection(str(db)) as before:
+            pass
+        for suffix in ("", "-wal", "-shm"):
+            (tmp_path / ("a.db" + suffix)).unlink(missing_ok=True)
+
+        assert get_archive_stats(db_path=str(db))["snapshot_count"] == 0
+        with archive._connection(str(db)) as after:
+            assert after is not before
+
+    def test_sqlite_error_discards_connection(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        with pytest.raises(sqlite3.OperationalError):
+            with archive._connection(db) as broken:
+                broken.execute("SELECT * FROM no_such_table")
+        with archive._connection(db) as conn:
+            assert conn is not broken
+
+    def test_close_connections_closes_every_thread(self, tmp_path):
+        import threading
+
+        db = str(tmp_path / "a.db")
+        seen = []
+        borrowed, closed = threading.Event(), threading.Event()
+
+        def borrow_and_wait():
+            with archive._connection(db) as conn:
+                seen.append(conn)
+            borrowed.set()
+            closed.wait(5)  # stay alive: a live thread's pool must be closed too
+
+        with archive._connection(db) as conn:
+            seen.append(conn)
+        worker = threading.Thread(target=borrow_and_wait)
+        worker.start()
+        borrowed.wait(5)
+        archive._close_connections()
+        closed.set()
+        worker.join()
+        for conn in seen:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_forked_child_abandons_inherited_connections(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        with archive._connection(db) as parent_conn:
+            pass
+        monkeypatch.setattr(archive._connections, "_pid", -1)  # as seen from a child
+        with archive._connection(db) as child_conn:
+            assert child_conn is not parent_conn
+        parent_conn.execute("SELECT 1")  # left open for the parent
+
+
 class TestStoreSnapshot:
     def test_roundtrip_payload_verbatim_and_trend_rows(self, tmp_path):
         db = str(tmp_path / "a.db")
@@ -145,7 +270,8 @@ class TestStoreSnapshot:
         conn = _connect(db)
         try:
             snap = conn.execute("SELECT * FROM snapshots WHERE id=?", (sid,)).fetchone()
-            assert json.loads(snap["payload_json"]) == env  # nothing lost, nothing changed
+            # nothing lost, nothing changed
+            assert json.loads(archive._unpack_payload(snap["payload_json"])) == env
             assert snap["source"] == "rss"
             assert snap["geo"] == "US"
             assert snap["trend_count"] == 2
@@ -186,6 +312,584 @@ class TestStoreSnapshot:
             conn.close()
 
 
+class TestStoreSnapshots:
+    def test_ids_in_input_order_and_rows_indexed(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        ids = store_snapshots([make_envelope(geo=geo) for geo in ("US", "GB", "DE")], db_path=db)
+
+        assert len(set(ids)) == 3 and ids == sorted(ids)
+        # Same fetched_at: newest first means the last inserted first.
+        assert [e["geo"] for e in read_archive(db_path=db)] == ["DE", "GB", "US"]
+        assert len(get_keyword_history("bitcoin", db_path=db)) == 3
+
+    def test_duplicates_report_the_existing_id(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        first = _store_snapshot(make_envelope(), db_path=db)
+        ids = store_snapshots(
+            [make_envelope(), make_envelope(geo="GB"), make_envelope()], db_path=db
+        )
+
+        assert ids[0] == ids[2] == first
+        assert get_archive_stats(db_path=db)["trend_row_count"] == 4
+
+    def test_one_transaction_for_the_batch(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        with archive._connection(db) as conn:
+            total_changes = conn.total_changes
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            store_snapshots([make_envelope(geo=geo) for geo in ("US", "GB", "DE")], db_path=db)
+        finally:
+            conn.set_trace_callback(None)
+
+        assert conn.total_changes - total_changes == 9  # 3 snapshots + 6 trend rows
+        verbs = [sql.split()[0].upper() for sql in statements]
+        assert (verbs.count("BEGIN"), verbs.count("COMMIT")) == (1, 1)
+
+    def test_all_or_nothing(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        broken = make_envelope(geo="GB")
+        broken["unserializable"] = object()
+        with pytest.raises(TypeError):
+            store_snapshots([make_envelope(), broken], db_path=db)
+        assert read_archive(db_path=db) == []
+
+    def test_accepts_a_generator_and_empty_input(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        assert store_snapshots((make_envelope(geo=g) for g in ("US", "GB")), db_path=db)
+        assert store_snapshots([], db_path=db) == []
+
+    @pytest.mark.parametrize(
+        "bad", [None, "envelope", {"geo": "US"}, {**make_envelope(), "geo": 1}]
+    )
+    def test_malformed_envelope_rejected_before_writing(self, tmp_path, bad):
+        db = str(tmp_path / "a.db")
+        with pytest.raises(InvalidParameterError):
+            store_snapshots([make_envelope(), bad], db_path=db)
+        assert read_archive(db_path=db) == []
+
+
+class TestArchiveWriter:
+    """The opt-in write-behind writer: queued, group-committed, flushed on demand."""
+
+    def _blocked_writer(self, monkeypatch, **kwargs):
+        """Enable the writer with its commits held until the returned event is set."""
+        import threading
+
+        release = threading.Event()
+        real_apply = archive._apply_queued
+
+        def held_apply(conn, item):
+            release.wait(5)
+            real_apply(conn, item)
+
+        monkeypatch.setattr(archive, "_apply_queued", held_apply)
+        archive.configure_archive_writer(**kwargs)
+        return release
+
+    def test_archive_hook_returns_before_the_commit(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        release = self._blocked_writer(monkeypatch)
+
+        archive._store_snapshot_safely(make_envelope(), db_path=db)
+        assert archive.get_archive_writer_stats()["written"] == 0  # still queued
+        release.set()
+
+        assert archive.flush_archive_writer(timeout=5)
+        assert [e["geo"] for e in read_archive(db_path=db)] == ["US"]
+
+    def test_queued_writes_share_commits(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        release = self._blocked_writer(monkeypatch, max_batch=50)
+        for hour in range(10):
+            archive._store_snapshot_safely(
+                make_envelope(fetched_at="2026-08-05T%02d:00:00+00:00" % hour), db_path=db
+            )
+        archive._disk_cache_set_safely("rss:US", [{"trend": "x"}], 300.0, db_path=db)
+        release.set()
+        archive.flush_archive_writer(timeout=5)
+
+        stats = archive.get_archive_writer_stats()
+        assert stats["written"] == 11 and stats["failed"] == 0
+        assert stats["commits"] <= 2  # the first item alone, then everything queued behind it
+        assert stats["queue_depth"] == 0 and stats["max_commit_ms"] >= stats["avg_commit_ms"] > 0
+        assert archive._disk_cache_get("rss:US", 300.0, db_path=db) == [{"trend": "x"}]
+
+    def test_full_queue_applies_back_pressure(self, tmp_path, monkeypatch):
+        import threading
+
+        db = str(tmp_path / "a.db")
+        release = self._blocked_writer(monkeypatch, max_queue=1, max_batch=1)
+        producer = threading.Thread(
+            target=lambda: [
+                archive._store_snapshot_safely(
+                    make_envelope(fetched_at="2026-08-05T0%d:00:00+00:00" % i), db_path=db
+                )
+                for i in range(4)
+            ]
+        )
+        producer.start()
+        producer.join(0.5)
+        assert producer.is_alive()  # waiting for room, not dropping writes
+        release.set()
+        producer.join(5)
+
+        archive.flush_archive_writer(timeout=5)
+        assert archive.get_archive_writer_stats()["blocked"] >= 1
+        assert len(read_archive(db_path=db)) == 4
+
+    def test_write_failure_warns_and_counts(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        archive.configure_archive_writer()
+
+        with pytest.warns(RuntimeWarning, match="archive write failed"):
+            archive._store_snapshot_safely(make_envelope(), db_path=str(blocker / "a.db"))
+            archive.flush_archive_writer(timeout=5)
+        assert archive.get_archive_writer_stats()["failed"] == 1
+
+    def test_reads_see_queued_snapshots(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.configure_archive_writer()
+        archive._store_snapshot_safely(make_envelope(), db_path=db)
+
+        assert len(get_keyword_history("bitcoin", db_path=db)) == 1
+        assert get_archive_stats(db_path=db)["snapshot_count"] == 1
+
+    def test_disabling_flushes_and_writes_synchronously_again(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        release = self._blocked_writer(monkeypatch)
+        archive._store_snapshot_safely(make_envelope(), db_path=db)
+        release.set()
+        archive.configure_archive_writer(enabled=False)
+
+        stats = archive.get_archive_writer_stats()
+        assert stats["enabled"] is False and stats["written"] == 0
+        assert len(read_archive(db_path=db)) == 1
+        archive._store_snapshot_safely(make_envelope(geo="GB"), db_path=db)
+        assert len(read_archive(db_path=db)) == 2
+
+    def test_queued_writes_flushed_at_exit(self, tmp_path):
+        import subprocess
+
+        db = str(tmp_path / "a.db")
+        script = (
+            "import trendspyg.archive as a\n"
+            "a.configure_archive_writer()\n"
+            "a._store_snapshot_safely({'source': 'rss', 'geo': 'US',"
+            " 'fetched_at': 'x', 'trends': []}, db_path=%r)\n" % db
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=60, cwd=repo_root)
+        assert [e["geo"] for e in read_archive(db_path=db)] == ["US"]
+
+    def test_rss_download_writes_behind(self, tmp_path, monkeypatch):
+        from unittest.mock import patch
+
+        from trendspyg import download_google_trends_rss
+
+        db = str(tmp_path / "a.db")
+        release = self._blocked_writer(monkeypatch)
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
+            result = download_google_trends_rss(geo="US", archive=True, cache="disk", db_path=db)
+        assert result[0]["trend"] == "bitcoin"
+        assert archive.get_archive_writer_stats()["enqueued"] == 2  # cache row + snapshot
+        release.set()
+
+        assert len(read_archive(db_path=db)) == 1
+        assert archive._disk_cache_get("US:full", 300.0, db_path=db) is not None
+
+    @pytest.mark.parametrize("kwargs", [{"max_queue": 0}, {"max_batch": True}, {"max_batch": 1.5}])
+    def test_bad_limits_rejected(self, kwargs):
+        with pytest.raises(InvalidParameterError):
+            archive.configure_archive_writer(**kwargs)
+        assert archive.get_archive_writer_stats()["enabled"] is False
+
+
+def _big_envelope(**kwargs):
+    """An envelope well over the compression threshold, with RSS-like repetition."""
+    env = make_envelope(keywords=["keyword %d" % i for i in range(20)], **kwargs)
+    for trend in env["trends"]:
+        trend["news"] = [
+            {
+                "headline": "Headline about %s" % trend["keyword"],
+                "url": "https://news.example.com/a",
+            }
+        ] * 5
+    return env
+
+
+class TestPayloadCompression:
+    def _stored(self, db, table="snapshots"):
+        conn = _connect(db)
+        try:
+            return conn.execute("SELECT payload_json, payload_size FROM %s" % table).fetchone()
+        finally:
+            conn.close()
+
+    def test_large_snapshot_stored_compressed_and_read_back(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        env = _big_envelope()
+        _store_snapshot(env, db_path=db)
+
+        payload, size = self._stored(db)
+        assert isinstance(payload, bytes) and payload[:1] in (b"z", b"s")
+        assert size == len(json.dumps(env).encode("utf-8")) > len(payload)
+        assert read_archive(db_path=db) == [env]
+
+    def test_small_payload_stays_plain_text(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db)
+        payload, size = self._stored(db, "cache")
+        assert (payload, size) == ('["us"]', 6)
+
+    def test_zlib_when_zstandard_is_missing(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(archive, "_zstd", None)
+        db = str(tmp_path / "a.db")
+        env = _big_envelope()
+        _store_snapshot(env, db_path=db)
+
+        assert self._stored(db)[0][:1] == b"z"
+        assert read_archive(db_path=db) == [env]
+
+    def test_zstd_row_without_zstandard_raises_actionable_error(self, monkeypatch):
+        monkeypatch.setattr(archive, "_zstd", None)
+        with pytest.raises(ArchiveError, match="pip install zstandard"):
+            archive._unpack_payload(b"s\x28\xb5\x2f\xfd")
+
+    def test_corrupt_or_unknown_payload_raises_archive_error(self):
+        with pytest.raises(ArchiveError, match="Corrupt"):
+            archive._unpack_payload(b"znot zlib")
+        with pytest.raises(ArchiveError, match="Unknown payload codec"):
+            archive._unpack_payload(b"?whatever")
+
+    def test_caches_round_trip_compressed(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        trends = [
+            {"trend": "t%d" % i, "published": datetime(2026, 8, 5, tzinfo=timezone.utc)}
+            for i in range(50)
+        ]
+        _disk_cache_set("rss:US", trends, ttl=300, db_path=db)
+        archive._explore_cache_set("k", {"data": ["x" * 40] * 50}, db_path=db)
+
+        assert isinstance(self._stored(db, "cache")[0], bytes)
+        assert isinstance(self._stored(db, "explore_cache")[0], bytes)
+        assert _disk_cache_get("rss:US", ttl=300, db_path=db) == trends
+        assert archive._explore_cache_get("k", ttl=300, db_path=db) == {"data": ["x" * 40] * 50}
+
+    def test_version_1_file_upgraded_and_old_rows_readable(self, tmp_path):
+        db = str(tmp_path / "old.db")
+        env = _big_envelope()
+        raw = sqlite3.connect(db)
+        raw.executescript(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+            "INSERT INTO meta VALUES ('db_schema_version', '1');"
+            "CREATE TABLE snapshots (id INTEGER PRIMARY KEY, source TEXT NOT NULL,"
+            " geo TEXT NOT NULL, fetched_at TEXT NOT NULL, schema_version TEXT NOT NULL,"
+            " trend_count INTEGER NOT NULL, payload_json TEXT NOT NULL,"
+            " UNIQUE(source, geo, fetched_at));"
+        )
+        raw.execute(
+            "INSERT INTO snapshots VALUES (1, 'rss', 'US', ?, '1.0', 20, ?)",
+            (env["fetched_at"], json.dumps(env)),
+        )
+        raw.commit()
+        raw.close()
+
+        assert read_archive(db_path=db) == [env]
+        _store_snapshot(_big_envelope(fetched_at="2026-08-06T09:00:00+00:00"), db_path=db)
+        assert len(read_archive(db_path=db)) == 2
+        conn = _connect(db)
+        try:
+            version = conn.execute("SELECT value FROM meta WHERE key='db_schema_version'")
+            assert version.fetchone()[0] == str(DB_SCHEMA_VERSION) == "2"
+        finally:
+            conn.close()
+
+    def test_reading_a_version_1_file_keeps_it_version_1(self, tmp_path):
+        db = str(tmp_path / "old.db")
+        env = _big_envelope()
+        raw = sqlite3.connect(db)
+        raw.executescript(
+            "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);"
+            "INSERT INTO meta VALUES ('db_schema_version', '1');"
+            "CREATE TABLE snapshots (id INTEGER PRIMARY KEY, source TEXT NOT NULL,"
+            " geo TEXT NOT NULL, fetched_at TEXT NOT NULL, schema_version TEXT NOT NULL,"
+            " trend_count INTEGER NOT NULL, payload_json TEXT NOT NULL,"
+            " UNIQUE(source, geo, fetched_at));"
+        )
+        raw.execute(
+            "INSERT INTO snapshots VALUES (1, 'rss', 'US', ?, '1.0', 20, ?)",
+            (env["fetched_at"], json.dumps(env)),
+        )
+        raw.commit()
+        raw.close()
+
+        assert read_archive(db_path=db) == [env]
+        get_archive_stats(db_path=db)
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db)  # small: stays plain text
+        archive._close_connections()
+
+        raw = sqlite3.connect(db)
+        try:
+            version = raw.execute("SELECT value FROM meta WHERE key='db_schema_version'")
+            assert version.fetchone()[0] == "1"
+        finally:
+            raw.close()
+
+    def test_stats_report_the_compression_ratio(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        assert get_archive_stats(db_path=db)["compression_ratio"] == 1.0
+        for day in range(1, 4):
+            _store_snapshot(
+                _big_envelope(fetched_at="2026-08-0%dT09:00:00+00:00" % day), db_path=db
+            )
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db)
+
+        stats = get_archive_stats(db_path=db)
+        assert stats["payload_raw_bytes"] > stats["payload_bytes"] > 0
+        assert (
+            stats["compression_ratio"]
+            == round(stats["payload_raw_bytes"] / stats["payload_bytes"], 2)
+            > 2
+        )
+
+    def test_revalidation_entry_decodes_trends_lazily(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        validators = {"etag": '"v1"', "last_modified": None, "content_hash": "abc"}
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db, validators=validators)
+        decoded = []
+        real_decode = archive._decode_payload
+        monkeypatch.setattr(
+            archive, "_decode_payload", lambda t: decoded.append(t) or real_decode(t)
+        )
+
+        entry = archive._disk_cache_get_validators("rss:US", db_path=db)
+        assert entry.get("content_hash") == "abc" and decoded == []
+        assert entry["trends"] == ["us"] and entry["trends"] == ["us"]
+        assert len(decoded) == 1
+
+
+class TestSnapshotDedup:
+    """An unchanged poll is stored as a reference to the snapshot it repeats."""
+
+    TIMES = ["2026-08-05T%02d:00:00+00:00" % h for h in (9, 10, 11)]
+
+    def _rows(self, db):
+        conn = _connect(db)
+        try:
+            return conn.execute(
+                "SELECT id, fetched_at, ref_id, length(payload_json) AS size FROM snapshots"
+                " ORDER BY fetched_at"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def _store_unchanged(self, db):
+        for fetched_at in self.TIMES:
+            _store_snapshot(_big_envelope(fetched_at=fetched_at), db_path=db)
+
+    def test_repeat_stored_as_reference(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        self._store_unchanged(db)
+
+        base, *refs = self._rows(db)
+        assert base["ref_id"] is None and base["size"] > 0
+        assert [(r["ref_id"], r["size"]) for r in refs] == [(base["id"], 0)] * 2
+        stats = get_archive_stats(db_path=db)
+        assert stats["snapshot_count"] == 3 and stats["deduplicated_snapshots"] == 2
+        assert stats["trend_row_count"] == 20
+
+    def test_reads_stay_exact(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        self._store_unchanged(db)
+
+        expected = [_big_envelope(fetched_at=t) for t in reversed(self.TIMES)]
+        assert read_archive(db_path=db) == expected
+        assert read_archive(keyword="KEYWORD 3", db_path=db) == expected
+        history = get_keyword_history("keyword 3", db_path=db)
+        assert [(h["fetched_at"], h["rank"]) for h in history] == [(t, 4) for t in self.TIMES]
+
+    def test_changed_feed_is_stored_in_full(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        _store_snapshot(make_envelope(fetched_at=self.TIMES[0]), db_path=db)
+        _store_snapshot(make_envelope(fetched_at=self.TIMES[1], keywords=["x"]), db_path=db)
+        _store_snapshot(make_envelope(fetched_at=self.TIMES[2]), db_path=db)
+        _store_snapshot(make_envelope(geo="GB", fetched_at=self.TIMES[2]), db_path=db)
+
+        assert [r["ref_id"] for r in self._rows(db)] == [None] * 4
+
+    def test_store_snapshots_dedups_within_the_batch(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        store_snapshots([_big_envelope(fetched_at=t) for t in self.TIMES], db_path=db)
+        assert get_archive_stats(db_path=db)["deduplicated_snapshots"] == 2
+
+    def test_prune_of_the_base_keeps_references_readable(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        self._store_unchanged(db)
+
+        assert prune_archive(self.TIMES[1], db_path=db) == 1
+        heir, ref = self._rows(db)
+        assert heir["ref_id"] is None and heir["size"] > 0
+        assert ref["ref_id"] == heir["id"]
+        expected = [_big_envelope(fetched_at=t) for t in reversed(self.TIMES[1:])]
+        assert read_archive(db_path=db) == expected
+        assert len(get_keyword_history("keyword 0", db_path=db)) == 2
+
+        assert prune_archive("2026-08-06", db_path=db) == 2
+        assert get_archive_stats(db_path=db)["trend_row_count"] == 0
+
+    def test_unchanged_polls_take_far_less_space(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        for hour in range(24):
+            _store_snapshot(
+                _big_envelope(fetched_at="2026-08-05T%02d:00:00+00:00" % hour), db_path=db
+            )
+        stats = get_archive_stats(db_path=db)
+        assert stats["deduplicated_snapshots"] == 23
+        assert stats["payload_bytes"] == self._rows(db)[0]["size"]
+
+
+def _poll(hour):
+    """The hour-th poll of a feed where one trend rotates and one article changes per poll."""
+    env = make_envelope(
+        fetched_at="2026-08-05T%02d:00:00+00:00" % hour,
+        keywords=["keyword %d" % i for i in range(20)],
+    )
+    for trend in env["trends"]:
+        trend["news"] = [
+            {
+                "headline": hashlib.sha1(("%s %d" % (trend["keyword"], i)).encode()).hexdigest(),
+                "url": "https://news.example.com/%s/%d" % (trend["keyword"], i),
+            }
+            for i in range(4)
+        ]
+    env["trends"][hour % 20] = dict(env["trends"][hour % 20], keyword="new story %d" % hour)
+    env["trends"][0]["news"] = env["trends"][0]["news"] + [
+        {"headline": "Update %d" % hour, "url": "https://news.example.com/%d" % hour}
+    ]
+    return env
+
+
+class TestDeltaStorage:
+    def _rows(self, db):
+        conn = _connect(db)
+        try:
+            return conn.execute(
+                "SELECT delta_of, delta_depth FROM snapshots ORDER BY fetched_at"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    def test_reads_are_exact(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        configure_archive_storage("delta")
+        db = str(tmp_path / "a.db")
+        polls = [_poll(hour) for hour in range(6)]
+        polls[3]["trends"].reverse()
+        del polls[4]["trends"][5:9]
+        polls[4]["count"] = len(polls[4]["trends"])
+        polls[5]["trends"][2]["news"] = []
+        for env in polls:
+            _store_snapshot(env, db_path=db)
+
+        assert [r["delta_of"] is not None for r in self._rows(db)] == [False] + [True] * 5
+        assert read_archive(db_path=db) == polls[::-1]
+        assert read_archive(db_path=db)[0]["trends"] is not read_archive(db_path=db)[1]["trends"]
+        history = get_keyword_history("keyword 10", db_path=db)
+        assert [h["fetched_at"] for h in history] == [p["fetched_at"] for p in polls]
+        assert get_archive_stats(db_path=db)["delta_snapshots"] == 5
+
+    def test_keyframe_every_interval(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        configure_archive_storage("delta", keyframe_interval=3)
+        db = str(tmp_path / "a.db")
+        store_snapshots([_poll(hour) for hour in range(7)], db_path=db)
+
+        assert [r["delta_depth"] for r in self._rows(db)] == [0, 1, 2, 0, 1, 2, 0]
+        assert read_archive(limit=1, db_path=db) == [_poll(6)]
+
+    def test_far_smaller_than_full_storage(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        full, delta = str(tmp_path / "full.db"), str(tmp_path / "delta.db")
+        store_snapshots([_poll(hour) for hour in range(24)], db_path=full)
+        configure_archive_storage("delta")
+        store_snapshots([_poll(hour) for hour in range(24)], db_path=delta)
+
+        assert read_archive(db_path=delta) == read_archive(db_path=full)
+        full_bytes = get_archive_stats(db_path=full)["payload_bytes"]
+        assert get_archive_stats(db_path=delta)["payload_bytes"] * 3 < full_bytes
+
+    def test_unchanged_poll_still_deduplicated(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        configure_archive_storage("delta")
+        db = str(tmp_path / "a.db")
+        store_snapshots(
+            [_poll(0), _poll(1), dict(_poll(1), fetched_at="2026-08-05T01:30:00+00:00"), _poll(2)],
+            db_path=db,
+        )
+        stats = get_archive_stats(db_path=db)
+        assert (stats["deduplicated_snapshots"], stats["delta_snapshots"]) == (1, 2)
+        assert [e["fetched_at"] for e in read_archive(db_path=db)] == [
+            "2026-08-05T02:00:00+00:00",
+            "2026-08-05T01:30:00+00:00",
+            "2026-08-05T01:00:00+00:00",
+            "2026-08-05T00:00:00+00:00",
+        ]
+        assert read_archive(db_path=db)[0] == _poll(2)
+
+    def test_prune_rewrites_kept_deltas_as_keyframes(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        configure_archive_storage("delta")
+        db = str(tmp_path / "a.db")
+        store_snapshots([_poll(hour) for hour in range(5)], db_path=db)
+
+        assert prune_archive("2026-08-05T02:00:00+00:00", db_path=db) == 2
+        assert [r["delta_of"] is None for r in self._rows(db)] == [True, False, False]
+        assert read_archive(db_path=db) == [_poll(hour) for hour in (4, 3, 2)]
+
+    def test_full_mode_archive_reads_in_delta_mode_and_back(self, tmp_path):
+        from trendspyg import configure_archive_storage
+
+        db = str(tmp_path / "a.db")
+        _store_snapshot(_poll(0), db_path=db)
+        configure_archive_storage("delta")
+        _store_snapshot(_poll(1), db_path=db)
+        configure_archive_storage("full")
+        _store_snapshot(_poll(2), db_path=db)
+
+        assert [r["delta_of"] is not None for r in self._rows(db)] == [False, True, False]
+        assert read_archive(db_path=db) == [_poll(2), _poll(1), _poll(0)]
+
+    def test_diff_round_trips_awkward_shapes(self):
+        old = {"a": 1, "trends": [{"keyword": "x", "n": 1}, {"keyword": "x", "n": 2}, "odd", 3]}
+        for new in (
+            {"trends": [3, {"keyword": "x", "n": 2}, {"keyword": "y"}], "a": 1},
+            {"a": 2, "trends": None},
+            {"a": 1, "trends": [{"keyword": "x", "n": 1, "news": [{"url": "u"}]}], "b": [1]},
+            {},
+        ):
+            assert archive._apply_dict(old, archive._diff_dict(old, new)) == new
+            assert list(archive._apply_dict(old, archive._diff_dict(old, new))) == list(new)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"mode": "zstd"}, {"keyframe_interval": 0}, {"keyframe_interval": True}]
+    )
+    def test_bad_options_raise(self, kwargs):
+        from trendspyg import configure_archive_storage
+
+        with pytest.raises(InvalidParameterError):
+            configure_archive_storage(**kwargs)
+
+
 class TestPayloadCodec:
     def test_datetime_roundtrips_exactly(self):
         published = datetime(2026, 8, 5, 7, 30, tzinfo=timezone.utc)
@@ -230,6 +934,31 @@ class TestDiskCache:
             conn.close()
         assert keys == ["new"]
 
+    def test_rows_with_validators_outlive_the_ttl_for_revalidation(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        validators = {"etag": '"v1"', "last_modified": None, "content_hash": "abc"}
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db, validators=validators)
+
+        real_time = archive.time.time()
+        monkeypatch.setattr(archive.time, "time", lambda: real_time + 301)
+        _disk_cache_set("rss:GB", ["gb"], ttl=300, db_path=db)  # triggers the GC
+
+        assert _disk_cache_get("rss:US", ttl=300, db_path=db) is None  # expired...
+        entry = archive._disk_cache_get_validators("rss:US", db_path=db)
+        assert {k: entry[k] for k in validators} == validators  # ...but still revalidatable
+        assert entry["trends"] == ["us"]
+
+        monkeypatch.setattr(
+            archive.time, "time", lambda: real_time + archive._REVALIDATE_SECONDS + 1
+        )
+        _disk_cache_set("rss:GB", ["gb"], ttl=300, db_path=db)
+        assert archive._disk_cache_get_validators("rss:US", db_path=db) is None
+
+    def test_rows_without_validators_are_not_revalidatable(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db)
+        assert archive._disk_cache_get_validators("rss:US", db_path=db) is None
+
     def test_keys_are_isolated(self, tmp_path):
         db = str(tmp_path / "a.db")
         _disk_cache_set("rss:US", ["us"], ttl=300, db_path=db)
@@ -362,6 +1091,337 @@ class TestReadArchive:
         assert "trendspyg[analysis]" in str(exc_info.value)
 
 
+class TestCompactRead:
+    def test_compact_matches_the_full_envelopes(self, populated_db):
+        full = read_archive(db_path=populated_db)
+        compact = read_archive(output_format="compact", db_path=populated_db)
+
+        assert compact == [
+            {
+                "fetched_at": env["fetched_at"],
+                "geo": env["geo"],
+                "source": env["source"],
+                "trend_count": env["count"],
+                "trends": [
+                    {"keyword": t["keyword"], "rank": t["rank"], "volume_min": t["volume_min"]}
+                    for t in env["trends"]
+                ],
+            }
+            for env in full
+        ]
+
+    def test_fields_select_trend_columns_and_combine_with_filters(self, populated_db):
+        hits = read_archive(keyword="bitcoin", fields=("keyword",), db_path=populated_db)
+        assert [s["trends"] for s in hits] == [
+            [{"keyword": "bitcoin"}],
+            [{"keyword": "bitcoin"}, {"keyword": "cpap"}],
+        ]
+        text = read_archive(geo="GB", fields="rank", output_format="json", db_path=populated_db)
+        assert json.loads(text)[0]["trends"] == [{"rank": 1}]
+
+    def test_never_loads_a_payload(self, populated_db, monkeypatch):
+        def boom(value):
+            raise AssertionError("payload loaded")
+
+        monkeypatch.setattr(archive, "_unpack_payload", boom)
+        assert len(read_archive(output_format="compact", db_path=populated_db)) == 4
+
+    def test_deduplicated_snapshots_read_their_base_trends(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        for hour in (9, 10):
+            _store_snapshot(
+                make_envelope(fetched_at="2026-08-05T%02d:00:00+00:00" % hour), db_path=db
+            )
+        newest, oldest = read_archive(output_format="compact", db_path=db)
+        assert newest["trends"] == oldest["trends"] and newest["trends"] is not oldest["trends"]
+        assert newest["trend_count"] == 2
+
+    def test_dataframe_has_only_the_requested_fields(self, populated_db):
+        pytest.importorskip("pandas")
+        df = read_archive(
+            fields=("keyword", "rank"), output_format="dataframe", db_path=populated_db
+        )
+        assert list(df.columns) == ["fetched_at", "geo", "source", "keyword", "rank"]
+        assert len(df) == 5
+
+    @pytest.mark.parametrize("fields", [(), ("keyword", "news"), ["payload_json"]])
+    def test_unknown_fields_rejected(self, populated_db, fields):
+        with pytest.raises(InvalidParameterError):
+            read_archive(fields=fields, db_path=populated_db)
+
+
+class TestIterArchive:
+    @pytest.fixture()
+    def db(self, tmp_path):
+        """25 US snapshots, two of them sharing one fetched_at across sources."""
+        db = str(tmp_path / "a.db")
+        envelopes = [
+            make_envelope(fetched_at="2026-08-05T%02d:00:00+00:00" % hour, keywords=["k%d" % hour])
+            for hour in range(24)
+        ]
+        envelopes.append(
+            make_envelope(source="csv", fetched_at="2026-08-05T12:00:00+00:00", keywords=["c"])
+        )
+        store_snapshots(envelopes, db_path=db)
+        return db
+
+    def test_streams_what_read_archive_returns(self, db):
+        streamed = list(archive.iter_archive(page_size=4, db_path=db))
+        assert len(streamed) == 25
+        assert streamed == read_archive(db_path=db)
+        assert [e["fetched_at"] for e in streamed] == sorted(
+            (e["fetched_at"] for e in streamed), reverse=True
+        )
+
+    def test_filters_limit_and_fields(self, db):
+        hits = archive.iter_archive(source="rss", keyword="K3", fields="keyword", db_path=db)
+        assert [s["trends"] for s in hits] == [[{"keyword": "k3"}]]
+        assert len(list(archive.iter_archive(limit=7, page_size=3, db_path=db))) == 7
+
+    def test_cursor_resumes_exactly_after_the_last_snapshot(self, db):
+        first = list(itertools.islice(archive.iter_archive(with_cursor=True, db_path=db), 12))
+        cursor = json.loads(json.dumps(first[-1][0]))  # survives a round trip
+        rest = list(archive.iter_archive(after=cursor, page_size=5, db_path=db))
+
+        assert [e for _, e in first] + rest == list(archive.iter_archive(db_path=db))
+
+    def test_reads_page_by_page(self, db, monkeypatch):
+        pages = []
+        real = archive._snapshot_rows
+        monkeypatch.setattr(
+            archive,
+            "_snapshot_rows",
+            lambda conn, rows, fields: pages.append(len(rows)) or real(conn, rows, fields),
+        )
+        iterator = archive.iter_archive(page_size=10, db_path=db)
+        next(iterator)
+        assert pages == [10]
+        list(iterator)
+        assert pages == [10, 10, 5]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"after": "2026-08-05"},
+            {"after": ("2026-08-05", "3")},
+            {"page_size": 0},
+            {"fields": ()},
+            {"start": " "},
+            {"source": []},
+        ],
+    )
+    def test_bad_arguments_raise_at_the_call(self, db, kwargs):
+        with pytest.raises(InvalidParameterError):
+            archive.iter_archive(db_path=db, **kwargs)  # not iterated
+
+
+class TestReadArchiveFrame:
+    def test_matches_read_archive_with_typed_columns(self, populated_db):
+        pd = pytest.importorskip("pandas")
+
+        frame = archive.read_archive_frame(db_path=populated_db)
+        slow = read_archive(output_format="dataframe", db_path=populated_db)
+
+        assert list(frame.columns) == [
+            "fetched_at",
+            "geo",
+            "source",
+            "keyword",
+            "rank",
+            "volume_min",
+        ]
+        assert isinstance(frame["geo"].dtype, pd.CategoricalDtype)
+        assert isinstance(frame["source"].dtype, pd.CategoricalDtype)
+        assert (
+            str(frame["fetched_at"].dtype).startswith("datetime64")
+            and str(frame["fetched_at"].dt.tz) == "UTC"
+        )
+        assert str(frame["rank"].dtype) == str(frame["volume_min"].dtype) == "Int64"
+        assert frame["keyword"].tolist() == slow["keyword"].tolist()
+        assert frame["rank"].tolist() == slow["rank"].tolist()
+        assert frame["geo"].tolist() == slow["geo"].tolist()
+        assert frame["fetched_at"].tolist() == pd.to_datetime(slow["fetched_at"], utc=True).tolist()
+
+    def test_filters_nulls_and_deduplicated_snapshots(self, tmp_path):
+        pytest.importorskip("pandas")
+        db = str(tmp_path / "a.db")
+        _store_snapshot(make_envelope(fetched_at="2026-08-05T09:00:00+00:00"), db_path=db)
+        _store_snapshot(make_envelope(fetched_at="2026-08-05T10:00:00+00:00"), db_path=db)
+        _store_snapshot(make_explore_envelope(), db_path=db)
+
+        frame = archive.read_archive_frame(source="rss", keyword="BITCOIN", db_path=db)
+        assert len(frame) == 4  # the repeat poll reads its base's trend rows
+        explore = archive.read_archive_frame(source="explore", db_path=db)
+        assert explore["rank"].isna().all() and explore["keyword"].tolist() == ["bitcoin"]
+
+    def test_empty_archive_keeps_the_dtypes(self, tmp_path):
+        pytest.importorskip("pandas")
+        frame = archive.read_archive_frame(db_path=str(tmp_path / "new.db"))
+        assert len(frame) == 0
+        assert str(frame["rank"].dtype) == "Int64" and str(frame["geo"].dtype) == "category"
+
+    def test_chunks_concatenate_to_the_full_frame(self, populated_db):
+        pd = pytest.importorskip("pandas")
+        chunks = list(archive.read_archive_frame(chunk_size=3, db_path=populated_db))
+
+        assert [len(c) for c in chunks] == [3, 2]  # three 1-trend snapshots, then a 2-trend one
+        whole = archive.read_archive_frame(db_path=populated_db)
+        joined = pd.concat([c.astype({"geo": str, "source": str}) for c in chunks])
+        pd.testing.assert_frame_equal(
+            joined.reset_index(drop=True), whole.astype({"geo": str, "source": str})
+        )
+
+    def test_arrow_table(self, populated_db):
+        pa = pytest.importorskip("pyarrow")
+        table = archive.read_archive_frame(output_format="arrow", db_path=populated_db)
+
+        assert isinstance(table, pa.Table) and table.num_rows == 5
+        assert pa.types.is_dictionary(table.schema.field("geo").type)
+        assert pa.types.is_timestamp(table.schema.field("fetched_at").type)
+        assert table.schema.field("rank").type == pa.int64()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"output_format": "dict"}, {"chunk_size": 0}, {"chunk_size": True}]
+    )
+    def test_bad_arguments_raise(self, populated_db, kwargs):
+        with pytest.raises(InvalidParameterError):
+            archive.read_archive_frame(db_path=populated_db, **kwargs)
+
+    def test_without_pandas_raises_actionable_error(self, populated_db, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pandas", None)
+        with pytest.raises(ImportError, match=r"trendspyg\[analysis\]"):
+            archive.read_archive_frame(db_path=populated_db)
+
+
+class TestRollups:
+    def _store(self, db, fetched_at, keywords, **kwargs):
+        _store_snapshot(
+            make_envelope(fetched_at=fetched_at, keywords=keywords, **kwargs), db_path=db
+        )
+
+    def test_refresh_aggregates_existing_snapshots_then_stays_incremental(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        self._store(db, "2026-08-05T09:10:00+00:00", ["bitcoin", "cpap"])
+        self._store(db, "2026-08-05T09:40:00+00:00", ["cpap", "Bitcoin"])
+        assert archive.refresh_archive_rollups(db_path=db) == 2
+        self._store(db, "2026-08-05T11:00:00+02:00", ["bitcoin"])  # 09:00 UTC
+
+        hours = archive.get_archive_rollups("hour", keyword="BITCOIN", db_path=db)
+        assert len(hours) == 1
+        assert hours[0]["bucket_start"] == "2026-08-05T09:00:00+00:00"
+        assert (hours[0]["appearances"], hours[0]["best_rank"]) == (3, 1)
+        assert hours[0]["first_seen"] == "2026-08-05T09:10:00+00:00"
+        assert archive.refresh_archive_rollups(db_path=db) == 0  # already current
+
+    def test_top_keywords_per_geo_per_day(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        store_snapshots(
+            [
+                make_envelope(fetched_at="2026-08-05T09:00:00+00:00", keywords=["a", "b"]),
+                make_envelope(fetched_at="2026-08-05T10:00:00+00:00", keywords=["b", "c"]),
+                make_envelope(fetched_at="2026-08-06T09:00:00+00:00", keywords=["c"]),
+                make_envelope(geo="GB", fetched_at="2026-08-05T09:00:00+00:00", keywords=["d"]),
+                make_envelope(source="csv", fetched_at="2026-08-05T09:00:00+00:00", keywords=["a"]),
+            ],
+            db_path=db,
+        )
+
+        top = archive.get_archive_rollups("day", top=1, db_path=db)
+        assert [(r["bucket_start"], r["geo"], r["keyword"], r["appearances"]) for r in top] == [
+            ("2026-08-05", "GB", "d", 1),
+            ("2026-08-05", "US", "a", 2),  # rss + csv combined; ties go to the better rank
+            ("2026-08-06", "US", "c", 1),
+        ]
+        rss = archive.get_archive_rollups(
+            "day", geo="US", source="rss", end="2026-08-05", db_path=db
+        )
+        assert {r["keyword"]: r["appearances"] for r in rss} == {"a": 1, "b": 2, "c": 1}
+
+    def test_incremental_and_rebuilt_rollups_agree_on_casing(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        self._store(db, "2026-08-05T09:00:00+00:00", ["bitcoin"])
+        self._store(db, "2026-08-05T09:30:00+00:00", ["Bitcoin"])
+        self._store(db, "2026-08-05T09:45:00+00:00", ["BitCoin"], source="csv")
+        incremental = archive.get_archive_rollups("hour", db_path=db)
+
+        archive.refresh_archive_rollups(rebuild=True, db_path=db)
+        rebuilt = archive.get_archive_rollups("hour", db_path=db)
+
+        assert incremental == rebuilt
+        assert [(r["keyword"], r["appearances"]) for r in rebuilt] == [("BitCoin", 3)]
+
+    def test_top_is_applied_in_sql(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        self._store(db, "2026-08-05T09:00:00+00:00", ["k%d" % i for i in range(20)])
+        statements = []
+        with archive._connection(db) as conn:
+            conn.set_trace_callback(statements.append)
+        try:
+            top = archive.get_archive_rollups("day", top=3, db_path=db)
+        finally:
+            with archive._connection(db) as conn:
+                conn.set_trace_callback(None)
+
+        assert [r["keyword"] for r in top] == ["k0", "k1", "k2"]
+        assert any("position <=" in sql for sql in statements)
+
+    def test_hours_a_keyword_spent_trending(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        for hour in range(6):
+            self._store(db, "2026-08-05T%02d:00:00+00:00" % hour, ["bitcoin"])  # deduplicated
+        self._store(db, "2026-08-05T06:00:00+00:00", ["other"])
+
+        hours = archive.get_archive_rollups(
+            "hour", keyword="bitcoin", start="2026-08-05T02:30:00+00:00", db_path=db
+        )
+        assert len(hours) == 4
+
+    def test_prune_keeps_history_until_rebuilt(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        self._store(db, "2026-08-05T09:00:00+00:00", ["old"])
+        self._store(db, "2026-08-06T09:00:00+00:00", ["new"])
+
+        assert prune_archive("2026-08-06", db_path=db) == 1
+        assert len(archive.get_archive_rollups(db_path=db)) == 2
+        assert archive.refresh_archive_rollups(rebuild=True, db_path=db) == 1
+        assert [r["keyword"] for r in archive.get_archive_rollups(db_path=db)] == ["new"]
+
+    def test_reused_ids_after_a_full_prune_are_rolled_up(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        self._store(db, "2026-08-05T09:00:00+00:00", ["a"])
+        self._store(db, "2026-08-05T10:00:00+00:00", ["b"])
+        prune_archive("2026-09-01", db_path=db)
+        self._store(db, "2026-08-07T09:00:00+00:00", ["c"])
+
+        assert "c" in [r["keyword"] for r in archive.get_archive_rollups(db_path=db)]
+
+    def test_not_enabled_raises_and_costs_writes_nothing(self, tmp_path):
+        db = str(tmp_path / "a.db")
+        self._store(db, "2026-08-05T09:00:00+00:00", ["a"])
+        with pytest.raises(ArchiveError, match="refresh_archive_rollups"):
+            archive.get_archive_rollups(db_path=db)
+        conn = _connect(db)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM rollups").fetchone()[0] == 0
+        finally:
+            conn.close()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"bucket": "week"}, {"top": 0}, {"keyword": " "}, {"start": "   "}]
+    )
+    def test_bad_arguments_raise(self, tmp_path, kwargs):
+        db = str(tmp_path / "a.db")
+        archive.refresh_archive_rollups(db_path=db)
+        with pytest.raises(InvalidParameterError):
+            archive.get_archive_rollups(db_path=db, **kwargs)
+
+
 class TestGetKeywordHistory:
     def test_oldest_first_with_all_fields(self, populated_db):
         history = get_keyword_history("bitcoin", db_path=populated_db)
@@ -400,6 +1460,62 @@ class TestGetKeywordHistory:
             get_keyword_history("   ", db_path=populated_db)
 
 
+class TestKeywordIndex:
+    def _plans(self, db, call):
+        """EXPLAIN QUERY PLAN details of every SELECT ``call`` runs."""
+        statements = []
+        with archive._connection(db) as conn:
+            conn.set_trace_callback(statements.append)
+        try:
+            call()
+        finally:
+            conn.set_trace_callback(None)
+        selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+        assert selects
+        return [
+            " | ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+            for sql in selects
+        ]
+
+    def test_keyword_history_searches_the_nocase_index(self, populated_db):
+        (plan,) = self._plans(
+            populated_db, lambda: get_keyword_history("BITCOIN", db_path=populated_db)
+        )
+        assert "idx_trends_keyword_nocase" in plan
+        assert "SCAN t" not in plan
+
+    def test_read_archive_keyword_filter_searches_the_nocase_index(self, populated_db):
+        (plan,) = self._plans(
+            populated_db, lambda: read_archive(keyword="Bitcoin", db_path=populated_db)
+        )
+        assert "idx_trends_keyword_nocase" in plan
+        assert "SCAN t" not in plan
+
+    def test_older_file_swaps_binary_index_in_place(self, tmp_path):
+        db = str(tmp_path / "old.db")
+        raw = sqlite3.connect(db)
+        raw.executescript(
+            archive._SCHEMA.replace("DROP INDEX IF EXISTS idx_trends_keyword;", "").replace(
+                "idx_trends_keyword_nocase ON trends(keyword COLLATE NOCASE)",
+                "idx_trends_keyword ON trends(keyword)",
+            )
+        )
+        raw.close()
+
+        _store_snapshot(make_envelope(), db_path=db)
+
+        conn = sqlite3.connect(db)
+        try:
+            indexes = {
+                r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+        finally:
+            conn.close()
+        assert "idx_trends_keyword_nocase" in indexes
+        assert "idx_trends_keyword" not in indexes
+        assert len(get_keyword_history("Bitcoin", db_path=db)) == 1
+
+
 class TestGetArchiveStats:
     def test_fresh_archive_stats(self, tmp_path):
         db = str(tmp_path / "new.db")
@@ -470,7 +1586,9 @@ class TestRssArchiveHook:
         from trendspyg import download_google_trends_rss
 
         db = str(tmp_path / "a.db")
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             result = download_google_trends_rss(geo="US", cache=False, archive=True, db_path=db)
 
         assert result[0]["trend"] == "bitcoin"  # returned output unchanged by archiving
@@ -485,7 +1603,9 @@ class TestRssArchiveHook:
         from trendspyg import download_google_trends_rss
 
         db = str(tmp_path / "a.db")
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             envelope = download_google_trends_rss(
                 geo="US", cache=False, normalize=True, archive=True, db_path=db
             )
@@ -498,7 +1618,9 @@ class TestRssArchiveHook:
         from trendspyg import download_google_trends_rss
 
         db = str(tmp_path / "a.db")
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             download_google_trends_rss(geo="US", cache=True)  # populate the memory cache
             download_google_trends_rss(geo="US", cache=True, archive=True, db_path=db)
 
@@ -513,7 +1635,9 @@ class TestRssArchiveHook:
             raise RuntimeError("disk full")
 
         monkeypatch.setattr(archive, "_store_snapshot", boom)
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             with pytest.warns(RuntimeWarning, match="archive write failed"):
                 result = download_google_trends_rss(
                     geo="US", cache=False, archive=True, db_path=str(tmp_path / "a.db")
@@ -526,7 +1650,7 @@ class TestRssArchiveHook:
 
         from trendspyg import download_google_trends_rss
 
-        with patch("trendspyg.rss_downloader.requests.get") as mock_get:
+        with patch("trendspyg.rss_downloader.requests.Session.get") as mock_get:
             with pytest.raises(InvalidParameterError) as exc_info:
                 download_google_trends_rss(geo="US", cache="dsik")
 
@@ -541,11 +1665,13 @@ class TestRssDiskCache:
         from trendspyg import clear_rss_cache, download_google_trends_rss
 
         db = str(tmp_path / "a.db")
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             fresh = download_google_trends_rss(geo="US", cache="disk", db_path=db)
 
         clear_rss_cache()  # a new process would start with an empty memory cache
-        with patch("trendspyg.rss_downloader.requests.get") as mock_get:
+        with patch("trendspyg.rss_downloader.requests.Session.get") as mock_get:
             cached = download_google_trends_rss(geo="US", cache="disk", db_path=db)
 
         mock_get.assert_not_called()  # served from disk, no network
@@ -557,11 +1683,13 @@ class TestRssDiskCache:
 
         from trendspyg import download_google_trends_rss
 
-        def boom(key, ttl, db_path=None):
+        def boom(key, ttl, grace=0.0, db_path=None):
             raise RuntimeError("corrupt")
 
-        monkeypatch.setattr(archive, "_disk_cache_get", boom)
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        monkeypatch.setattr(archive, "_disk_cache_get_entry", boom)
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             with pytest.warns(RuntimeWarning, match="disk cache read failed"):
                 result = download_google_trends_rss(
                     geo="US", cache="disk", db_path=str(tmp_path / "a.db")
@@ -575,24 +1703,139 @@ class TestRssDiskCache:
         from trendspyg import clear_rss_cache, download_google_trends_rss
 
         db = str(tmp_path / "a.db")
-        with patch("trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()):
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
             download_google_trends_rss(geo="US", cache="disk", db_path=db)
 
         clear_rss_cache()
         real_time = archive.time.time()
         monkeypatch.setattr(archive.time, "time", lambda: real_time + 301)  # default TTL is 300
         with patch(
-            "trendspyg.rss_downloader.requests.get", return_value=_mock_rss_response()
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
         ) as mock_get:
             download_google_trends_rss(geo="US", cache="disk", db_path=db)
 
         mock_get.assert_called_once()  # stale entry -> real fetch
 
+    def test_expired_disk_entry_is_revalidated_across_processes(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock, patch
+
+        from trendspyg import clear_rss_cache, download_google_trends_rss
+
+        db = str(tmp_path / "a.db")
+        first = _mock_rss_response()
+        first.status_code = 200
+        first.headers = {"ETag": '"v1"'}
+        with patch("trendspyg.rss_downloader.requests.Session.get", return_value=first):
+            fresh = download_google_trends_rss(geo="US", cache="disk", db_path=db)
+
+        clear_rss_cache()  # a new cron run: nothing in memory
+        real_time = archive.time.time()
+        monkeypatch.setattr(archive.time, "time", lambda: real_time + 301)
+        not_modified = MagicMock(status_code=304, content=b"", headers={})
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=not_modified
+        ) as mock_get:
+            revalidated = download_google_trends_rss(geo="US", cache="disk", db_path=db)
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert revalidated == fresh
+        # the 304 refreshed the row: the next call is a plain hit
+        assert _disk_cache_get("US:full", ttl=300, db_path=db) == fresh
+
+
+class TestRssDiskCacheL1:
+    """cache='disk' reads through an in-process L1 that expires with the row"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def teardown_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def _fetch(self, db, **kwargs):
+        from unittest.mock import patch
+
+        from trendspyg import download_google_trends_rss
+
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ) as mock_get:
+            result = download_google_trends_rss(geo="US", cache="disk", db_path=db, **kwargs)
+        return result, mock_get.call_count
+
+    def test_hot_key_skips_sqlite(self, tmp_path, monkeypatch):
+        db = str(tmp_path / "a.db")
+        fresh, _ = self._fetch(db)  # write-through fills L1
+
+        def no_sqlite(db_path=None):
+            raise AssertionError("L1 hit must not open the archive")
+
+        monkeypatch.setattr(archive, "_connection", no_sqlite)
+        cached, fetches = self._fetch(db)
+
+        assert (cached, fetches) == (fresh, 0)
+
+    def test_first_disk_read_warms_l1(self, tmp_path, monkeypatch):
+        from trendspyg import clear_rss_cache
+
+        db = str(tmp_path / "a.db")
+        self._fetch(db)
+        clear_rss_cache()  # a new process: only the row is left
+        reads = []
+        real_get_entry = archive._disk_cache_get_entry
+
+        def counting_get_entry(*args, **kwargs):
+            reads.append(args)
+            return real_get_entry(*args, **kwargs)
+
+        monkeypatch.setattr(archive, "_disk_cache_get_entry", counting_get_entry)
+        self._fetch(db)
+        self._fetch(db, include_articles=False)
+
+        assert len(reads) == 1
+
+    def test_l1_copy_expires_with_the_row(self, tmp_path, monkeypatch):
+        from trendspyg import clear_rss_cache
+
+        db = str(tmp_path / "a.db")
+        self._fetch(db)
+        clear_rss_cache()
+        real_time = archive.time.time()
+        monkeypatch.setattr(archive.time, "time", lambda: real_time + 200)
+        assert self._fetch(db)[1] == 0  # warmed from a row with ~100s left
+
+        monkeypatch.setattr(archive.time, "time", lambda: real_time + 301)
+        assert self._fetch(db)[1] == 1  # L1 did not outlive the row
+
+    def test_lowered_ttl_applies_to_l1_copies(self, tmp_path):
+        from trendspyg import set_rss_cache_ttl
+
+        db = str(tmp_path / "a.db")
+        self._fetch(db)  # L1 copy made under the 300s TTL
+        try:
+            set_rss_cache_ttl(0)
+            assert self._fetch(db)[1] == 1
+            assert self._fetch(db)[1] == 1
+        finally:
+            set_rss_cache_ttl(300)
+
+    def test_archive_files_do_not_share_l1_entries(self, tmp_path):
+        self._fetch(str(tmp_path / "a.db"))
+
+        assert self._fetch(str(tmp_path / "b.db"))[1] == 1
+
 
 class _FakeAioResponse:
     def __init__(self, content):
         self._content = content
         self.status = 200
+        self.headers = {}
 
     async def read(self):
         return self._content
@@ -605,7 +1848,7 @@ class _FakeAioResponse:
 
 
 class _FakeAioSession:
-    def get(self, url, timeout=None):
+    def get(self, url, timeout=None, headers=None):
         return _FakeAioResponse(SAMPLE_RSS_XML)
 
 
@@ -632,7 +1875,7 @@ class TestAsyncArchiveHook:
         clear_rss_cache()
 
         class _ExplodingSession:
-            def get(self, url, timeout=None):  # pragma: no cover - must never run
+            def get(self, url, timeout=None, headers=None):  # pragma: no cover - must never run
                 raise AssertionError("disk hit expected; network was touched")
 
         cached = await download_google_trends_rss_async(
@@ -675,6 +1918,95 @@ class TestBatchArchiveHooks:
         assert mock_single.call_args.kwargs["archive"] is True
         assert mock_single.call_args.kwargs["db_path"] == "X"
 
+    @pytest.mark.parametrize("max_workers", [None, 3])
+    def test_sync_batch_archives_in_one_write(self, tmp_path, monkeypatch, max_workers):
+        from unittest.mock import patch
+
+        from trendspyg import download_google_trends_rss_batch
+
+        db = str(tmp_path / "a.db")
+        writes = []
+        real_store = archive.store_snapshots
+        monkeypatch.setattr(
+            archive,
+            "store_snapshots",
+            lambda envs, db_path=None: writes.append(envs) or real_store(envs, db_path),
+        )
+        monkeypatch.setattr(archive, "_store_snapshot", None)  # no per-geo commits
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
+            download_google_trends_rss_batch(
+                ["US", "GB", "DE"],
+                show_progress=False,
+                archive=True,
+                db_path=db,
+                max_workers=max_workers,
+            )
+
+        assert len(writes) == 1
+        assert sorted(e["geo"] for e in writes[0]) == ["DE", "GB", "US"]
+        assert len(read_archive(db_path=db)) == 3
+
+    def test_sync_batch_failure_still_archives_earlier_geos(self, tmp_path):
+        from unittest.mock import patch
+
+        import requests
+
+        from trendspyg import download_google_trends_rss_batch
+        from trendspyg.exceptions import DownloadError
+        from trendspyg.utils import RetryPolicy
+
+        db = str(tmp_path / "a.db")
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get",
+            side_effect=[_mock_rss_response(), requests.ConnectionError("down")],
+        ):
+            with pytest.raises(DownloadError):
+                download_google_trends_rss_batch(
+                    ["US", "GB"],
+                    show_progress=False,
+                    archive=True,
+                    db_path=db,
+                    retry=RetryPolicy(max_attempts=1),
+                )
+
+        assert [e["geo"] for e in read_archive(db_path=db)] == ["US"]
+
+    async def test_async_batch_archives_in_one_write(self, tmp_path, monkeypatch):
+        from trendspyg import iter_google_trends_rss_batch_async
+
+        db = str(tmp_path / "a.db")
+        writes = []
+        real_store = archive.store_snapshots
+        monkeypatch.setattr(
+            archive,
+            "store_snapshots",
+            lambda envs, db_path=None: writes.append(envs) or real_store(envs, db_path),
+        )
+        monkeypatch.setattr(archive, "_store_snapshot", None)
+        results = [
+            item
+            async for item in iter_google_trends_rss_batch_async(
+                ["US", "GB"], session=_FakeAioSession(), archive=True, db_path=db
+            )
+        ]
+
+        assert len(results) == 2 and len(writes) == 1
+        assert sorted(e["geo"] for e in read_archive(db_path=db)) == ["GB", "US"]
+
+    def test_single_call_outside_a_batch_still_writes_immediately(self, tmp_path):
+        from unittest.mock import patch
+
+        from trendspyg import download_google_trends_rss
+
+        db = str(tmp_path / "a.db")
+        with patch(
+            "trendspyg.rss_downloader.requests.Session.get", return_value=_mock_rss_response()
+        ):
+            download_google_trends_rss(geo="US", archive=True, db_path=db)
+        assert len(read_archive(db_path=db)) == 1
+
 
 class TestCsvArchiveHook:
     def _run_csv(self, tmp_path, **kwargs):
@@ -739,6 +2071,58 @@ class TestPruneArchive:
         with pytest.raises(InvalidParameterError):
             prune_archive(None, db_path=populated_db)
 
+    def test_batches_report_progress(self, populated_db):
+        calls = []
+        deleted = prune_archive(
+            "2026-08-06",
+            batch_size=3,
+            progress=lambda done, total: calls.append((done, total)),
+            db_path=populated_db,
+        )
+        assert deleted == 4
+        assert calls == [(3, 4), (4, 4)]
+
+    def test_time_budget_leaves_the_rest_for_the_next_call(self, populated_db):
+        first = prune_archive("2026-08-06", batch_size=1, max_seconds=0, db_path=populated_db)
+        assert first == 1
+        assert len(read_archive(db_path=populated_db)) == 3
+        assert prune_archive("2026-08-06", batch_size=1, db_path=populated_db) == 3
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"batch_size": 0}, {"batch_size": True}, {"max_seconds": -1}]
+    )
+    def test_bad_batch_options_rejected(self, populated_db, kwargs):
+        with pytest.raises(InvalidParameterError):
+            prune_archive("2026-08-06", db_path=populated_db, **kwargs)
+
+    def test_cascade_uses_the_snapshot_index(self, populated_db):
+        with archive._connection(populated_db) as conn:
+            plan = " | ".join(
+                row[3]
+                for row in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT 1 FROM trends WHERE snapshot_id = ?", (1,)
+                )
+            )
+        assert "idx_trends_snapshot" in plan
+
+    def test_file_shrinks_after_prune(self, tmp_path):
+        db = tmp_path / "big.db"
+        for hour in range(200):
+            _store_snapshot(
+                make_envelope(
+                    fetched_at="2026-08-05T%02d:%02d:00+00:00" % (hour // 60, hour % 60),
+                    keywords=["keyword %d %d %s" % (hour, i, "x" * 200) for i in range(20)],
+                ),
+                db_path=str(db),
+            )
+        archive._close_connections()  # checkpoint so the main file holds the data
+        before = db.stat().st_size
+
+        assert prune_archive("2026-08-06", db_path=str(db)) == 200
+        wal = tmp_path / "big.db-wal"
+        assert db.stat().st_size < before / 4
+        assert not wal.exists() or wal.stat().st_size == 0
+
 
 def make_explore_envelope(keyword="bitcoin", geo="US", fetched_at="2026-08-11T10:00:00+00:00"):
     return {
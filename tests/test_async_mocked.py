@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from trendspyg.exceptions import DownloadError, InvalidParameterError, RateLimitError
+from trendspyg.exceptions import (
+    DownloadError,
+    InvalidParameterError,
+    RateLimitError,
+    StaleDataWarning,
+)
 
 
 class TestAsyncImportError:
@@ -262,9 +267,10 @@ SAMPLE_ASYNC_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
 class _FakeResponse:
     """Async context manager standing in for an aiohttp response."""
 
-    def __init__(self, status=200, body=SAMPLE_ASYNC_XML):
+    def __init__(self, status=200, body=SAMPLE_ASYNC_XML, headers=None):
         self.status = status
         self._body = body
+        self.headers = headers if headers is not None else {}
 
     async def __aenter__(self):
         return self
@@ -472,3 +478,467 @@ class TestAsyncImportGuards:
 
         assert set(results) == {"US"}
         assert "Install tqdm" in capsys.readouterr().err
+
+
+@pytest.mark.asyncio
+class TestAsyncConditionalGet:
+    """The async path revalidates exactly like the sync one"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def teardown_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    async def test_304_serves_the_last_parse(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        class _RecordingSession(_FakeSession):
+            def __init__(self, responses):
+                super().__init__()
+                self._responses = list(responses)
+                self.sent_headers = []
+
+            def get(self, url, **kwargs):
+                self.sent_headers.append(kwargs.get("headers"))
+                return self._responses.pop(0)
+
+        session = _RecordingSession(
+            [_FakeResponse(headers={"ETag": '"v1"'}), _FakeResponse(status=304, body=b"")]
+        )
+
+        first = await download_google_trends_rss_async(geo="US", cache=False, session=session)
+        second = await download_google_trends_rss_async(geo="US", cache=False, session=session)
+
+        assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+        assert second == first
+
+    async def test_unsolicited_304_is_refetched_unconditionally(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        class _RecordingSession(_FakeSession):
+            def __init__(self, responses):
+                super().__init__()
+                self._responses = responses
+                self.sent_headers = []
+
+            def get(self, url, **kwargs):
+                self.sent_headers.append(kwargs.get("headers"))
+                return self._responses.pop(0)
+
+        session = _RecordingSession([_FakeResponse(status=304, body=b""), _FakeResponse()])
+
+        trends = await download_google_trends_rss_async(geo="US", cache=False, session=session)
+
+        assert trends[0]["trend"] == "bitcoin"
+        assert session.sent_headers == [{}, {"Cache-Control": "no-cache"}]
+
+    async def test_repeated_unsolicited_304_raises(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        fake = _FakeSession(response=_FakeResponse(status=304, body=b""))
+
+        with pytest.raises(DownloadError):
+            await download_google_trends_rss_async(geo="US", cache=False, session=fake)
+
+    async def test_any_2xx_is_accepted(self):
+        """Matches raise_for_status() on the sync path: only 4xx/5xx are errors"""
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        fake = _FakeSession(response=_FakeResponse(status=203))
+
+        trends = await download_google_trends_rss_async(geo="US", cache=False, session=fake)
+
+        assert trends[0]["trend"] == "bitcoin"
+
+
+class _GatedSession(_FakeSession):
+    """Counts get() calls; every response body is held until ``release`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        session = self
+
+        class _Held(_FakeResponse):
+            async def read(self):
+                await session.release.wait()
+                return await super().read()
+
+        return _Held()
+
+
+@pytest.mark.asyncio
+class TestAsyncSingleFlight:
+    """Concurrent async misses on one key await a single shared future"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def teardown_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    async def test_gathered_misses_share_one_fetch(self):
+        from trendspyg import rss_downloader
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        session = _GatedSession()
+        tasks = [
+            asyncio.ensure_future(
+                download_google_trends_rss_async(geo="US", cache=False, session=session)
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)  # let every caller reach the shared future
+        session.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert session.calls == 1
+        assert all(r == results[0] for r in results)
+        assert rss_downloader._async_flights == {}
+
+    async def test_cancelling_the_first_caller_keeps_the_fetch_alive(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        session = _GatedSession()
+        first = asyncio.ensure_future(
+            download_google_trends_rss_async(geo="US", cache=False, session=session)
+        )
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(
+            download_google_trends_rss_async(geo="US", cache=False, session=session)
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        session.release.set()
+
+        trends = await second
+
+        assert first.cancelled()
+        assert trends[0]["trend"] == "bitcoin"
+        assert session.calls == 1
+
+    async def test_error_reaches_every_waiter(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        fake = _FakeSession(response=_FakeResponse(status=304, body=b""))
+
+        results = await asyncio.gather(
+            *[
+                download_google_trends_rss_async(geo="US", cache=False, session=fake)
+                for _ in range(3)
+            ],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, DownloadError) for r in results)
+
+
+@pytest.mark.asyncio
+class TestIterBatchAsync:
+    """iter_google_trends_rss_batch_async: streaming, failure-tolerant sweeps"""
+
+    async def _collect(self, single, geos, **kwargs):
+        from trendspyg import iter_google_trends_rss_batch_async
+
+        with patch("trendspyg.rss_downloader.download_google_trends_rss_async", side_effect=single):
+            return [
+                item
+                async for item in iter_google_trends_rss_batch_async(
+                    geos, session=_FakeSession(), **kwargs
+                )
+            ]
+
+    async def test_yields_in_completion_order(self):
+        delays = {"US": 0.05, "GB": 0.0, "CA": 0.02}
+
+        async def single(**kwargs):
+            await asyncio.sleep(delays[kwargs["geo"]])
+            return [{"trend": kwargs["geo"]}]
+
+        items = await self._collect(single, ["US", "GB", "CA"])
+
+        assert [geo for geo, _ in items] == ["GB", "CA", "US"]
+        assert dict(items)["US"] == [{"trend": "US"}]
+
+    async def test_a_failing_geo_does_not_lose_the_others(self):
+        async def single(**kwargs):
+            if kwargs["geo"] == "XX":
+                raise InvalidParameterError("bad geo")
+            return [{"trend": kwargs["geo"]}]
+
+        results = dict(await self._collect(single, ["US", "XX", "GB"]))
+
+        assert isinstance(results["XX"], InvalidParameterError)
+        assert results["US"] == [{"trend": "US"}]
+        assert results["GB"] == [{"trend": "GB"}]
+
+    async def test_in_flight_work_is_bounded(self):
+        active, peak = 0, 0
+
+        async def single(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return []
+
+        items = await self._collect(single, [f"G{i}" for i in range(9)], max_concurrent=2)
+
+        assert len(items) == 9
+        assert peak == 2
+
+    async def test_per_geo_timeout_yields_download_error(self):
+        async def single(**kwargs):
+            if kwargs["geo"] == "US":
+                await asyncio.sleep(5)
+            return []
+
+        results = dict(await self._collect(single, ["US", "GB"], timeout=0.05))
+
+        assert isinstance(results["US"], DownloadError)
+        assert "Timed out" in str(results["US"])
+        assert results["GB"] == []
+
+    async def test_deadline_fails_unfinished_and_unstarted_geos(self):
+        started = []
+
+        async def single(**kwargs):
+            started.append(kwargs["geo"])
+            await asyncio.sleep(0 if kwargs["geo"] == "US" else 5)
+            return []
+
+        items = await self._collect(
+            single, ["US", "GB", "CA", "AU"], max_concurrent=2, deadline=0.1
+        )
+
+        results = dict(items)
+        assert len(items) == 4
+        assert results["US"] == []
+        assert all(isinstance(results[g], DownloadError) for g in ("GB", "CA", "AU"))
+        assert "deadline" in str(results["AU"])
+        assert "AU" not in started  # never started once the deadline passed
+
+    async def test_breaking_early_cancels_running_fetches(self):
+        from trendspyg import iter_google_trends_rss_batch_async
+
+        cancelled = []
+
+        async def single(**kwargs):
+            if kwargs["geo"] == "US":
+                return []
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["geo"])
+                raise
+
+        with patch("trendspyg.rss_downloader.download_google_trends_rss_async", side_effect=single):
+            stream = iter_google_trends_rss_batch_async(["US", "GB"], session=_FakeSession())
+            async for geo, _ in stream:
+                break
+            await stream.aclose()
+
+        assert geo == "US"
+        assert cancelled == ["GB"]
+
+    async def test_own_session_is_closed(self, monkeypatch):
+        import aiohttp
+
+        fake = _FakeSession()
+        monkeypatch.setattr(aiohttp, "ClientSession", lambda: fake)
+
+        async def single(**kwargs):
+            assert kwargs["session"] is fake
+            return []
+
+        from trendspyg import iter_google_trends_rss_batch_async
+
+        with patch("trendspyg.rss_downloader.download_google_trends_rss_async", side_effect=single):
+            items = [item async for item in iter_google_trends_rss_batch_async(["US"])]
+
+        assert items == [("US", [])]
+        assert fake.closed is True
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_concurrent": 0}, {"timeout": 0}, {"deadline": -1}, {"timeout": True}]
+    )
+    async def test_invalid_limits_raise(self, kwargs):
+        from trendspyg import iter_google_trends_rss_batch_async
+
+        with pytest.raises(InvalidParameterError):
+            async for _ in iter_google_trends_rss_batch_async(["US"], **kwargs):
+                pass
+
+    async def test_batch_raises_the_first_failure(self):
+        from trendspyg import download_google_trends_rss_batch_async
+
+        async def single(**kwargs):
+            raise RateLimitError("slow down")
+
+        with patch("trendspyg.rss_downloader.download_google_trends_rss_async", side_effect=single):
+            with pytest.raises(RateLimitError):
+                await download_google_trends_rss_batch_async(["US", "GB"], show_progress=False)
+
+
+@pytest.mark.asyncio
+class TestAsyncRateGovernor:
+    """The async path shares the process-wide governor"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    async def test_429_from_async_fetch_backs_off(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+        from trendspyg.utils import get_rss_governor_stats
+
+        fake = _FakeSession(response=_FakeResponse(status=429, headers={"Retry-After": "5"}))
+
+        with pytest.raises(RateLimitError):
+            await download_google_trends_rss_async(geo="US", cache=False, session=fake)
+
+        stats = get_rss_governor_stats()
+        assert stats["throttles"] == 1
+        assert stats["state"] == "paused"
+        assert stats["in_flight"] == 0
+
+    async def test_success_is_recorded(self):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+        from trendspyg.utils import get_rss_governor_stats
+
+        await download_google_trends_rss_async(geo="US", cache=False, session=_FakeSession())
+
+        assert get_rss_governor_stats()["successes"] == 1
+
+
+@pytest.mark.asyncio
+class TestAsyncRetry:
+    """The async path retries transient failures with the same policy"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    async def test_transient_failures_are_retried(self, monkeypatch):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        async def no_sleep(seconds):
+            return None
+
+        monkeypatch.setattr("trendspyg.rss_downloader.asyncio.sleep", no_sleep)
+
+        class _Flaky(_FakeSession):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def get(self, url, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise asyncio.TimeoutError()
+                if self.calls == 2:
+                    return _FakeResponse(status=502)
+                return _FakeResponse()
+
+        session = _Flaky()
+
+        trends = await download_google_trends_rss_async(geo="US", cache=False, session=session)
+
+        assert trends[0]["trend"] == "bitcoin"
+        assert session.calls == 3
+
+    async def test_exhausted_retries_carry_the_attempt_log(self, monkeypatch):
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+        from trendspyg.utils import RetryPolicy
+
+        async def no_sleep(seconds):
+            return None
+
+        monkeypatch.setattr("trendspyg.rss_downloader.asyncio.sleep", no_sleep)
+        fake = _FakeSession(get_error=asyncio.TimeoutError())
+
+        with pytest.raises(DownloadError) as exc_info:
+            await download_google_trends_rss_async(
+                geo="US", cache=False, session=fake, retry=RetryPolicy(max_attempts=2)
+            )
+
+        assert "timed out" in str(exc_info.value).lower()
+        assert [a["error"] for a in exc_info.value.attempts] == ["TimeoutError"] * 2
+
+
+@pytest.mark.asyncio
+class TestAsyncStaleServing:
+    """stale-while-revalidate / stale-if-error on the async path"""
+
+    def setup_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def teardown_method(self):
+        from trendspyg import clear_rss_cache
+
+        clear_rss_cache()
+
+    def _expire(self, monkeypatch):
+        import time
+
+        real_time = time.time()
+        monkeypatch.setattr(time, "time", lambda: real_time + 310)
+
+    async def test_stale_while_revalidate_refreshes_in_a_task(self, monkeypatch):
+        import aiohttp
+
+        from trendspyg import configure_rss_cache, rss_downloader
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+
+        configure_rss_cache(stale_while_revalidate=60)
+        await download_google_trends_rss_async(geo="US", session=_FakeSession())
+        self._expire(monkeypatch)
+        changed = _FakeResponse(body=SAMPLE_ASYNC_XML.replace(b"bitcoin", b"dogecoin"))
+        monkeypatch.setattr(aiohttp, "ClientSession", lambda: _FakeSession(response=changed))
+
+        with pytest.warns(StaleDataWarning):
+            stale = await download_google_trends_rss_async(
+                geo="US", session=_FakeSession(), normalize=True
+            )
+        await asyncio.gather(*rss_downloader._refresh_tasks)
+        fresh = await download_google_trends_rss_async(geo="US", session=_FakeSession())
+
+        assert stale["stale"] is True
+        assert stale["trends"][0]["keyword"] == "bitcoin"
+        assert fresh[0]["trend"] == "dogecoin"
+
+    async def test_stale_if_error(self, monkeypatch):
+        from trendspyg import configure_rss_cache
+        from trendspyg.rss_downloader import download_google_trends_rss_async
+        from trendspyg.utils import RetryPolicy
+
+        configure_rss_cache(stale_if_error=60)
+        await download_google_trends_rss_async(geo="US", session=_FakeSession())
+        self._expire(monkeypatch)
+
+        with pytest.warns(RuntimeWarning, match="serving cached trends"):
+            trends = await download_google_trends_rss_async(
+                geo="US",
+                session=_FakeSession(get_error=asyncio.TimeoutError()),
+                retry=RetryPolicy(max_attempts=1),
+            )
+
+        assert trends[0]["trend"] == "bitcoin"
@@ -1165,6 +1165,26 @@ class TestCLIHistory:
         check = CliRunner().invoke(cli, ["history", "--db", db, "--quiet"])
         assert json.loads(check.output) == []
 
+    def test_history_ndjson_streams_one_snapshot_per_line(self, db):
+        from trendspyg.archive import _store_snapshot
+
+        _store_snapshot(
+            {
+                "schema_version": "1.0",
+                "source": "rss",
+                "geo": "GB",
+                "fetched_at": "2026-08-02T09:00:00+00:00",
+                "count": 0,
+                "trends": [],
+            },
+            db_path=db,
+        )
+        result = CliRunner().invoke(cli, ["history", "--ndjson", "--db", db, "--quiet"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert [json.loads(line)["geo"] for line in lines] == ["GB", "US"]
+
     def test_history_error_exits_nonzero(self, db):
         result = CliRunner().invoke(cli, ["history", "--since", "   ", "--db", db])
 
@@ -71,6 +71,7 @@ class TestCompareTrending:
         result = compare_trending(["US", "GB"])
 
         assert set(result) == {"US", "GB"}
+        assert mock_batch.call_args.kwargs["max_workers"] == 5  # geos fetched in parallel
         args, kwargs = mock_batch.call_args
         assert args[0] == ["US", "GB"]
         assert kwargs["normalize"] is True
@@ -271,19 +272,32 @@ ARCHIVED_ENVELOPE = {
 
 
 class TestGetTrendingHistory:
-    @patch("trendspyg.mcp_server.read_archive")
-    def test_returns_compact_snapshots(self, mock_read):
-        mock_read.return_value = [ARCHIVED_ENVELOPE]
+    def test_returns_compact_snapshots(self, tmp_path, monkeypatch):
+        from trendspyg.archive import _store_snapshot
+
+        db = str(tmp_path / "mcp.db")
+        monkeypatch.setenv("TRENDSPYG_DB", db)
+        _store_snapshot(ARCHIVED_ENVELOPE, db_path=db)
 
         result = get_trending_history(geo="US", limit=5)
 
         assert result["snapshot_count"] == 1
         snap = result["snapshots"][0]
         assert snap["fetched_at"] == "2026-08-01T09:00:00+00:00"
+        assert snap["trend_count"] == 1
         # Compact: keyword/rank/volume only — no news payload into agent context.
         assert snap["trends"] == [{"keyword": "bitcoin", "rank": 1, "volume_min": 500000}]
         assert "appearances" not in result
+
+    @patch("trendspyg.mcp_server.read_archive")
+    def test_reads_the_compact_projection(self, mock_read):
+        mock_read.return_value = []
+
+        get_trending_history(geo="US", limit=5)
+
         assert mock_read.call_args.kwargs["limit"] == 5
+        # Answered from the indexed tables — no payload is loaded.
+        assert mock_read.call_args.kwargs["output_format"] == "compact"
         # Trending-Now sources only — Explore research snapshots stay out.
         assert mock_read.call_args.kwargs["source"] == ("rss", "csv")
 
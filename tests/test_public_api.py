@@ -36,11 +36,26 @@ EXPECTED_PUBLIC_API = {
     "clear_rss_cache",
     "get_rss_cache_stats",
     "set_rss_cache_ttl",
+    "configure_rss_session",  # new in 1.7.0
+    "iter_google_trends_rss_batch_async",  # new in 1.7.0
+    "get_rss_governor_stats",  # new in 1.7.0
+    "configure_rss_governor",  # new in 1.7.0
+    "RetryPolicy",  # new in 1.7.0
+    "configure_rss_cache",  # new in 1.7.0
     # Local archive + disk cache (new in 1.3.0)
     "read_archive",
     "get_keyword_history",
     "get_archive_stats",
     "prune_archive",
+    "store_snapshots",  # new in 1.7.0
+    "configure_archive_writer",  # new in 1.7.0
+    "flush_archive_writer",  # new in 1.7.0
+    "get_archive_writer_stats",  # new in 1.7.0
+    "configure_archive_storage",  # new in 1.7.0
+    "iter_archive",  # new in 1.7.0
+    "read_archive_frame",  # new in 1.7.0
+    "refresh_archive_rollups",  # new in 1.7.0
+    "get_archive_rollups",  # new in 1.7.0
     # Exceptions
     "TrendspygException",
     "DownloadError",
@@ -49,6 +64,7 @@ EXPECTED_PUBLIC_API = {
     "BrowserError",
     "ParseError",
     "ArchiveError",  # new in 1.3.0
+    "StaleDataWarning",  # new in 1.7.0
     # Schema-version constants
     "SCHEMA_VERSION",
     "EXPLORE_SCHEMA_VERSION",
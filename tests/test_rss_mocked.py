@@ -2,12 +2,19 @@
 Tests for RSS downloader with mocked network calls
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from trendspyg import clear_rss_cache
-from trendspyg.exceptions import DownloadError, InvalidParameterError, RateLimitError
+from trendspyg import clear_rss_cache, rss_downloader
+from trendspyg.exceptions import (
+    DownloadError,
+    InvalidParameterError,
+    RateLimitError,
+    StaleDataWarning,
+)
 from trendspyg.rss_downloader import (
     _format_output,
     _handle_http_error,
@@ -227,6 +234,114 @@ class TestParseRssXml:
             pass  # pandas optional
 
 
+@pytest.fixture(params=["stdlib", "lxml"])
+def xml_backend(request, monkeypatch):
+    """Run a parser test once per backend (lxml only where it is installed)."""
+    from trendspyg import rss_downloader
+
+    if request.param == "lxml":
+        etree = pytest.importorskip("lxml.etree")
+        monkeypatch.setattr(rss_downloader, "_lxml_etree", etree)
+    else:
+        monkeypatch.setattr(rss_downloader, "_lxml_etree", None)
+    return request.param
+
+
+class TestStreamingParser:
+    """Single-pass parser: same output on both backends, options applied while streaming"""
+
+    def _parse(self, xml=SAMPLE_RSS_XML, **kwargs):
+        options = dict(include_images=True, include_articles=True, max_articles_per_trend=5)
+        options.update(kwargs)
+        return _parse_rss_xml(xml, geo="US", **options)
+
+    def test_full_fidelity_fields(self, xml_backend):
+        trends = self._parse()
+
+        assert [t["trend"] for t in trends] == ["bitcoin", "ethereum"]
+        assert list(trends[0]) == [
+            "trend",
+            "traffic",
+            "traffic_min",
+            "published",
+            "explore_link",
+            "image",
+            "news_articles",
+        ]
+        assert trends[0]["image"] == {
+            "url": "https://example.com/image.jpg",
+            "source": "Reuters",
+        }
+        assert trends[0]["news_articles"][1] == {
+            "headline": "Crypto markets rally",
+            "url": "https://example.com/article2",
+            "source": "BBC",
+            "image": None,
+        }
+        assert trends[1]["image"] == {"url": None, "source": None}
+        assert trends[1]["news_articles"] == []
+
+    def test_backends_agree(self, monkeypatch):
+        from trendspyg import rss_downloader
+
+        etree = pytest.importorskip("lxml.etree")
+        monkeypatch.setattr(rss_downloader, "_lxml_etree", None)
+        stdlib = self._parse()
+        monkeypatch.setattr(rss_downloader, "_lxml_etree", etree)
+        assert self._parse() == stdlib
+
+    def test_options_are_applied_while_parsing(self, xml_backend):
+        lean = self._parse(include_images=False, include_articles=False)
+        assert "image" not in lean[0] and "news_articles" not in lean[0]
+
+        capped = self._parse(max_articles_per_trend=1)
+        assert [a["headline"] for a in capped[0]["news_articles"]] == ["Bitcoin surges past $50K"]
+        assert self._parse(max_articles_per_trend=0)[0]["news_articles"] == []
+
+    def test_channel_title_and_nested_fields_are_not_trend_fields(self, xml_backend):
+        """Only direct children of <item> count; the first match wins"""
+        xml = b"""<rss xmlns:ht="https://trends.google.com/trending/rss"><channel>
+          <title>Trending Now - US</title>
+          <item>
+            <ht:news_item><title>not the trend</title></ht:news_item>
+            <title>first</title>
+            <title>second</title>
+          </item>
+        </channel></rss>"""
+
+        trends = self._parse(xml)
+
+        assert len(trends) == 1
+        assert trends[0]["trend"] == "first"
+        assert trends[0]["traffic"] == "N/A"
+        assert trends[0]["news_articles"] == [
+            {"headline": None, "url": None, "source": None, "image": None}
+        ]
+
+    @pytest.mark.parametrize("lean", [False, True])
+    def test_invalid_xml_raises_download_error(self, xml_backend, lean):
+        with pytest.raises(DownloadError, match="Failed to parse RSS XML"):
+            self._parse(b"<rss><channel><item>", include_images=not lean, include_articles=not lean)
+
+    def test_lean_tree_parse_matches_the_streamed_one(self, xml_backend):
+        lean = dict(include_images=False, include_articles=False)
+        streamed = [
+            {k: v for k, v in t.items() if k not in ("image", "news_articles")}
+            for t in self._parse()
+        ]
+
+        assert self._parse(**lean) == streamed
+
+    def test_streaming_frees_finished_items(self, monkeypatch):
+        from trendspyg import rss_downloader
+
+        monkeypatch.setattr(rss_downloader, "_lxml_etree", pytest.importorskip("lxml.etree"))
+        items = list(rss_downloader._rss_items(SAMPLE_RSS_XML, stream=True))
+
+        assert all(len(item) == 0 for item in items)  # every subtree cleared
+        assert list(items[-1].getparent()) == [items[-1]]  # earlier siblings detached
+
+
 class TestParseTrafficToMin:
     """Unit tests for the traffic -> int parser."""
 
@@ -342,17 +457,12 @@ class TestMakeCacheKey:
 
     def test_cache_key_format(self):
         """Test cache key format"""
-        key = _make_cache_key("US", True, True, 5)
-        assert key == "US:True:True:5"
+        key = _make_cache_key("US")
+        assert key == "US:full"
 
-    def test_cache_key_different_params(self):
-        """Test different params create different keys"""
-        key1 = _make_cache_key("US", True, True, 5)
-        key2 = _make_cache_key("GB", True, True, 5)
-        key3 = _make_cache_key("US", False, True, 5)
-
-        assert key1 != key2
-        assert key1 != key3
+    def test_cache_key_different_geos(self):
+        """Test different geos create different keys"""
+        assert _make_cache_key("US") != _make_cache_key("GB")
 
 
 class TestHandleHttpError:
@@ -395,7 +505,7 @@ class TestDownloadWithMock:
         """Clear cache before each test"""
         clear_rss_cache()
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_success(self, mock_get):
         """Test successful download"""
         mock_response = MagicMock()
@@ -409,7 +519,7 @@ class TestDownloadWithMock:
         assert trends[0]["trend"] == "bitcoin"
         mock_get.assert_called_once()
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_uses_cache(self, mock_get):
         """Test that cache is used on second call"""
         mock_response = MagicMock()
@@ -425,7 +535,7 @@ class TestDownloadWithMock:
         # Should only call network once
         assert mock_get.call_count == 1
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_bypass_cache(self, mock_get):
         """Test that cache=False bypasses cache"""
         mock_response = MagicMock()
@@ -440,7 +550,7 @@ class TestDownloadWithMock:
         # Should call network twice
         assert mock_get.call_count == 2
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_connection_error(self, mock_get):
         """Test connection error handling"""
         import requests
@@ -452,7 +562,7 @@ class TestDownloadWithMock:
 
         assert "Connection failed" in str(exc_info.value)
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_timeout(self, mock_get):
         """Test timeout error handling"""
         import requests
@@ -464,7 +574,7 @@ class TestDownloadWithMock:
 
         assert "timed out" in str(exc_info.value)
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_http_error(self, mock_get):
         """Test HTTP error handling"""
         import requests
@@ -476,7 +586,7 @@ class TestDownloadWithMock:
         with pytest.raises(RateLimitError):
             download_google_trends_rss(geo="US", cache=False)
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_download_different_output_formats(self, mock_get):
         """Test different output formats"""
         mock_response = MagicMock()
@@ -506,7 +616,7 @@ class TestSyncDownloadBranches:
         """Clear cache before each test"""
         clear_rss_cache()
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_normalize_fresh_fetch_returns_envelope(self, mock_get):
         """normalize=True on a fresh fetch returns a NormalizedEnvelope"""
         mock_response = MagicMock()
@@ -522,7 +632,7 @@ class TestSyncDownloadBranches:
         assert envelope["trends"][0]["keyword"] == "bitcoin"
         assert envelope["trends"][0]["volume_min"] == 500000
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_normalize_served_from_cache(self, mock_get):
         """normalize=True on a cache hit normalizes the cached trends, no refetch"""
         mock_response = MagicMock()
@@ -537,7 +647,7 @@ class TestSyncDownloadBranches:
         assert envelope["source"] == "rss"
         assert envelope["count"] == 2
 
-    @patch("trendspyg.rss_downloader.requests.get")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
     def test_generic_request_exception_maps_to_download_error(self, mock_get):
         """Any other requests failure maps to DownloadError with context"""
         import requests
@@ -606,3 +716,873 @@ class TestBatchProgressAndDelay:
         download_google_trends_rss_batch(["US", "GB"], show_progress=False, delay=0.5)
 
         assert sleeps == [0.5, 0.5]
+
+
+class TestPooledSession:
+    """Sync path: one pooled keep-alive session per process, injectable per call"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        from trendspyg.rss_downloader import configure_rss_session
+
+        configure_rss_session()  # restore defaults for the rest of the suite
+
+    def test_default_session_is_shared_across_calls(self):
+        from trendspyg import rss_downloader
+
+        assert rss_downloader._get_session() is rss_downloader._get_session()
+
+    def test_injected_session_is_used_instead_of_the_shared_one(self, monkeypatch):
+        """A caller-provided session carries the request; the pool is never built"""
+        from trendspyg import rss_downloader
+
+        session = MagicMock()
+        session.get.return_value.content = SAMPLE_RSS_XML
+        monkeypatch.setattr(rss_downloader, "_get_session", MagicMock(side_effect=AssertionError))
+
+        trends = download_google_trends_rss(geo="US", cache=False, session=session)
+
+        assert trends[0]["trend"] == "bitcoin"
+        session.get.assert_called_once()
+
+    def test_configure_rebuilds_pool_with_new_size(self):
+        from trendspyg import rss_downloader
+        from trendspyg.rss_downloader import configure_rss_session
+
+        before = rss_downloader._get_session()
+        configure_rss_session(pool_size=32, max_retries=0)
+        after = rss_downloader._get_session()
+
+        adapter = after.get_adapter("https://trends.google.com/trending/rss")
+        assert after is not before
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 0
+
+    def test_configure_rejects_bad_values(self):
+        from trendspyg.rss_downloader import configure_rss_session
+
+        with pytest.raises(InvalidParameterError):
+            configure_rss_session(pool_size=0)
+        with pytest.raises(InvalidParameterError):
+            configure_rss_session(max_retries=-1)
+
+    def test_session_is_rebuilt_in_a_forked_child(self, monkeypatch):
+        """Sockets are never shared across fork(): a new pid gets a new session"""
+        import os
+
+        from trendspyg import rss_downloader
+
+        parent = rss_downloader._get_session()
+        child_pid = os.getpid() + 1
+        monkeypatch.setattr(rss_downloader.os, "getpid", lambda: child_pid)
+
+        assert rss_downloader._get_session() is not parent
+
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_batch_forwards_session(self, mock_single):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        mock_single.return_value = []
+        session = MagicMock()
+
+        download_google_trends_rss_batch(["US", "GB"], show_progress=False, session=session)
+
+        assert all(c.kwargs["session"] is session for c in mock_single.call_args_list)
+
+
+def _response(status=200, content=SAMPLE_RSS_XML, headers=None):
+    response = MagicMock()
+    response.status_code = status
+    response.content = content
+    response.headers = headers if headers is not None else {}
+    return response
+
+
+class TestConditionalGet:
+    """ETag / Last-Modified revalidation and the 304 short-circuit"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_validators_are_sent_on_the_next_poll(self, mock_get):
+        """cache=False pollers (watch) still revalidate instead of re-downloading"""
+        validators = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"}
+        mock_get.side_effect = [_response(headers=validators), _response(status=304, content=b"")]
+
+        first = download_google_trends_rss(geo="US", cache=False)
+        with patch("trendspyg.rss_downloader._parse_rss_xml") as mock_parse:
+            second = download_google_trends_rss(geo="US", cache=False)
+
+        assert mock_get.call_args_list[0].kwargs["headers"] == {}
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+        }
+        mock_parse.assert_not_called()  # 304 -> served the last parse
+        assert second == first
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_identical_body_without_validators_skips_the_parse(self, mock_get):
+        """No ETag from the server: the content hash still detects an unchanged feed"""
+        mock_get.return_value = _response()
+
+        first = download_google_trends_rss(geo="US", cache=False)
+        with patch("trendspyg.rss_downloader._parse_rss_xml") as mock_parse:
+            second = download_google_trends_rss(geo="US", cache=False)
+
+        assert mock_get.call_args.kwargs["headers"] == {}  # nothing to send
+        mock_parse.assert_not_called()
+        assert second == first
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_changed_body_is_parsed(self, mock_get):
+        changed = SAMPLE_RSS_XML.replace(b"bitcoin", b"dogecoin")
+        mock_get.side_effect = [_response(), _response(content=changed)]
+
+        download_google_trends_rss(geo="US", cache=False)
+        trends = download_google_trends_rss(geo="US", cache=False)
+
+        assert trends[0]["trend"] == "dogecoin"
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_expired_memory_entry_is_revalidated(self, mock_get):
+        from trendspyg.utils import get_rss_cache
+
+        mock_get.side_effect = [_response(headers={"ETag": '"v1"'}), _response(status=304)]
+        download_google_trends_rss(geo="US", cache=True)
+        get_rss_cache().clear()  # the 5-minute entry expired
+
+        trends = download_google_trends_rss(geo="US", cache=True)
+
+        assert trends[0]["trend"] == "bitcoin"
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert get_rss_cache().get(_make_cache_key("US")) == trends
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_unsolicited_304_is_refetched_unconditionally(self, mock_get):
+        mock_get.side_effect = [_response(status=304, content=b""), _response()]
+
+        trends = download_google_trends_rss(geo="US", cache=False)
+
+        assert trends[0]["trend"] == "bitcoin"
+        sent = [call.kwargs["headers"] for call in mock_get.call_args_list]
+        assert sent == [{}, {"Cache-Control": "no-cache"}]
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_repeated_unsolicited_304_is_a_download_error(self, mock_get):
+        mock_get.return_value = _response(status=304, content=b"")
+
+        with pytest.raises(DownloadError):
+            download_google_trends_rss(geo="US", cache=False)
+
+        assert mock_get.call_count == 2
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_validators_are_shared_across_parse_options(self, mock_get):
+        """The stored parse is full fidelity, so a lean poll revalidates a rich one"""
+        mock_get.side_effect = [
+            _response(headers={"ETag": '"v1"'}),
+            _response(status=304, content=b""),
+        ]
+
+        download_google_trends_rss(geo="US", cache=False, include_articles=False)
+        trends = download_google_trends_rss(geo="US", cache=False)
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert "news_articles" in trends[0]
+
+
+class TestSupersetCache:
+    """One full-fidelity parse per geo serves every projection"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            dict(include_images=False, include_articles=False),
+            dict(include_images=False, include_articles=True, max_articles_per_trend=1),
+            dict(include_articles=True, max_articles_per_trend=0),
+            dict(include_articles=True, max_articles_per_trend=-1),
+            dict(include_articles=True, max_articles_per_trend=5),
+        ],
+    )
+    def test_projection_matches_a_direct_parse(self, options):
+        options = dict(dict(include_images=True, max_articles_per_trend=5), **options)
+        full = _parse_rss_xml(
+            SAMPLE_RSS_XML,
+            geo="US",
+            include_images=True,
+            include_articles=True,
+            max_articles_per_trend=None,
+        )
+
+        projected = rss_downloader._project_trends(full, **options)
+
+        assert projected == _parse_rss_xml(SAMPLE_RSS_XML, geo="US", **options)
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_mixed_callers_share_one_fetch(self, mock_get):
+        mock_get.return_value = _response()
+
+        full = download_google_trends_rss(geo="US")
+        lean = download_google_trends_rss(geo="US", include_images=False, include_articles=False)
+        capped = download_google_trends_rss(geo="US", max_articles_per_trend=1)
+
+        assert mock_get.call_count == 1
+        assert "news_articles" in full[0] and "image" in full[0]
+        assert "news_articles" not in lean[0] and "image" not in lean[0]
+        assert len(capped[0]["news_articles"]) == 1
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_lean_first_caller_still_caches_the_full_parse(self, mock_get):
+        mock_get.return_value = _response()
+
+        download_google_trends_rss(geo="US", include_articles=False)
+        trends = download_google_trends_rss(geo="US")
+
+        assert mock_get.call_count == 1
+        assert trends[0]["news_articles"][1]["headline"] == "Crypto markets rally"
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_disk_cache_serves_projections(self, mock_get, tmp_path):
+        mock_get.return_value = _response()
+        db = str(tmp_path / "cache.db")
+
+        download_google_trends_rss(geo="US", cache="disk", db_path=db)
+        clear_rss_cache()  # a new process: nothing in memory
+        lean = download_google_trends_rss(
+            geo="US", cache="disk", db_path=db, include_articles=False
+        )
+
+        assert mock_get.call_count == 1
+        assert "news_articles" not in lean[0]
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_byte_budget_keeps_the_rss_cache_bounded(self, mock_get):
+        from trendspyg import configure_rss_cache, get_rss_cache_stats
+
+        mock_get.return_value = _response()
+        download_google_trends_rss(geo="US")
+        one_feed = get_rss_cache_stats()["bytes"]
+        configure_rss_cache(max_bytes=one_feed + one_feed // 2)
+
+        download_google_trends_rss(geo="GB")
+
+        stats = get_rss_cache_stats()
+        assert one_feed > 0
+        assert stats["size"] == 1
+        assert stats["bytes"] <= stats["max_bytes"]
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_callers_cannot_corrupt_the_cached_parse(self, mock_get):
+        mock_get.return_value = _response()
+
+        download_google_trends_rss(geo="US", include_articles=False)[0]["trend"] = "changed"
+
+        assert download_google_trends_rss(geo="US")[0]["trend"] == "bitcoin"
+
+
+class TestStaleServing:
+    """stale-while-revalidate and stale-if-error on the RSS caches"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    def _expire(self, monkeypatch, seconds=10):
+        """Move the clock past the 5-minute TTL by ``seconds``."""
+        real_time = time.time()
+        monkeypatch.setattr(time, "time", lambda: real_time + 300 + seconds)
+
+    def _join_refreshes(self):
+        for thread in threading.enumerate():
+            if thread.name == "trendspyg-rss-refresh":
+                thread.join(5)
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_stale_while_revalidate_answers_now_and_refreshes(self, mock_get, monkeypatch):
+        from trendspyg import configure_rss_cache
+
+        configure_rss_cache(stale_while_revalidate=60)
+        changed = SAMPLE_RSS_XML.replace(b"bitcoin", b"dogecoin")
+        mock_get.side_effect = [_response(), _response(content=changed)]
+        download_google_trends_rss(geo="US")
+        self._expire(monkeypatch)
+
+        with pytest.warns(StaleDataWarning, match="expired 10s ago"):
+            stale = download_google_trends_rss(geo="US", normalize=True)
+        self._join_refreshes()
+        fresh = download_google_trends_rss(geo="US", normalize=True)
+
+        assert stale["stale"] is True
+        assert stale["trends"][0]["keyword"] == "bitcoin"
+        assert "stale" not in fresh
+        assert fresh["trends"][0]["keyword"] == "dogecoin"
+        assert mock_get.call_count == 2
+
+    @patch("trendspyg.rss_downloader._store_snapshot_safely")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_background_refresh_archives(self, mock_get, mock_store, monkeypatch):
+        from trendspyg import configure_rss_cache
+
+        configure_rss_cache(stale_while_revalidate=60)
+        mock_get.return_value = _response()
+        download_google_trends_rss(geo="US")
+        self._expire(monkeypatch)
+
+        with pytest.warns(StaleDataWarning):
+            download_google_trends_rss(geo="US", archive=True)
+        self._join_refreshes()
+
+        assert mock_store.call_count == 1
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_stale_if_error_serves_the_last_feed(self, mock_get, monkeypatch):
+        import requests
+
+        from trendspyg import configure_rss_cache
+        from trendspyg.utils import RetryPolicy
+
+        configure_rss_cache(stale_if_error=600)
+        mock_get.side_effect = [_response(), requests.ConnectionError("down")]
+        download_google_trends_rss(geo="US")
+        self._expire(monkeypatch)
+
+        with pytest.warns(StaleDataWarning, match="expired 10s ago"):
+            df = download_google_trends_rss(
+                geo="US", output_format="dataframe", retry=RetryPolicy(max_attempts=1)
+            )
+
+        assert df.attrs["stale"] is True
+        assert df["trend"].iloc[0] == "bitcoin"
+
+    @pytest.mark.parametrize("output_format", ["dict", "json", "csv"])
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_unmarked_formats_warn_when_stale(
+        self, mock_get, mock_sleep, monkeypatch, output_format
+    ):
+        import requests
+
+        from trendspyg import configure_rss_cache
+        from trendspyg.utils import RetryPolicy
+
+        configure_rss_cache(stale_while_revalidate=60, stale_if_error=600)
+        mock_get.return_value = _response()
+        download_google_trends_rss(geo="US")
+        mock_get.side_effect = requests.ConnectionError("down")
+        self._expire(monkeypatch)
+
+        with pytest.warns(StaleDataWarning, match="background fetch"):
+            result = download_google_trends_rss(geo="US", output_format=output_format)
+        self._join_refreshes()  # the refresh fails; the entry stays stale
+        configure_rss_cache(stale_while_revalidate=0)
+        with pytest.warns(StaleDataWarning, match="failed"):
+            download_google_trends_rss(
+                geo="US", output_format=output_format, retry=RetryPolicy(max_attempts=1)
+            )
+
+        assert "bitcoin" in str(result)
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_error_past_the_window_is_raised(self, mock_get, monkeypatch):
+        import requests
+
+        from trendspyg import configure_rss_cache
+        from trendspyg.utils import RetryPolicy
+
+        configure_rss_cache(stale_if_error=5)
+        mock_get.side_effect = [_response(), requests.ConnectionError("down")]
+        download_google_trends_rss(geo="US")
+        self._expire(monkeypatch, seconds=10)
+
+        with pytest.raises(DownloadError):
+            download_google_trends_rss(geo="US", retry=RetryPolicy(max_attempts=1))
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_disk_cache_serves_stale_on_error(self, mock_get, monkeypatch, tmp_path):
+        import requests
+
+        from trendspyg import configure_rss_cache
+        from trendspyg.utils import RetryPolicy
+
+        configure_rss_cache(stale_if_error=600)
+        db = str(tmp_path / "cache.db")
+        mock_get.side_effect = [_response(), requests.ConnectionError("down")]
+        download_google_trends_rss(geo="US", cache="disk", db_path=db)
+        self._expire(monkeypatch)
+
+        with pytest.warns(RuntimeWarning):
+            envelope = download_google_trends_rss(
+                geo="US",
+                cache="disk",
+                db_path=db,
+                normalize=True,
+                retry=RetryPolicy(max_attempts=1),
+            )
+
+        assert envelope["stale"] is True
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_windows_are_off_by_default(self, mock_get, monkeypatch):
+        import requests
+
+        from trendspyg.utils import RetryPolicy
+
+        mock_get.side_effect = [_response(), requests.ConnectionError("down")]
+        download_google_trends_rss(geo="US")
+        self._expire(monkeypatch)
+
+        with pytest.raises(DownloadError):
+            download_google_trends_rss(geo="US", retry=RetryPolicy(max_attempts=1))
+
+
+class _CountingEvent(threading.Event):
+    """threading.Event that counts the threads blocked in wait()"""
+
+    def __init__(self):
+        super().__init__()
+        self.waiters = 0
+
+    def wait(self, timeout=None):
+        self.waiters += 1
+        return super().wait(timeout)
+
+
+class TestSingleFlight:
+    """Concurrent misses on the same key share one upstream fetch"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    def _burst(self, mock_get, followers=4, **kwargs):
+        """Block the first fetch until ``followers`` more callers wait on it."""
+        fetching, release = threading.Event(), threading.Event()
+        outcome = mock_get.side_effect
+
+        def slow_get(*args, **kw):
+            fetching.set()
+            release.wait(5)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return _response()
+
+        mock_get.side_effect = slow_get
+        results = []
+
+        def call():
+            try:
+                results.append(download_google_trends_rss(geo="US", **kwargs))
+            except Exception as e:
+                results.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        assert fetching.wait(5)
+        (flight,) = rss_downloader._flights.values()
+        flight.done = done = _CountingEvent()
+        threads = [threading.Thread(target=call) for _ in range(followers)]
+        for t in threads:
+            t.start()
+        while done.waiters < followers:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader] + threads:
+            t.join(5)
+        return results
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_concurrent_misses_share_one_fetch(self, mock_get):
+        results = self._burst(mock_get, cache=False)
+
+        assert mock_get.call_count == 1
+        assert len(results) == 5
+        assert all(r == results[0] for r in results)
+        assert results[0][0]["trend"] == "bitcoin"
+        assert rss_downloader._flights == {}
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_error_is_shared_by_every_waiter(self, mock_get):
+        import requests
+
+        from trendspyg.utils import RetryPolicy
+
+        mock_get.side_effect = requests.ConnectionError()
+
+        results = self._burst(mock_get, cache=False, retry=RetryPolicy(max_attempts=1))
+
+        assert mock_get.call_count == 1
+        assert len(results) == 5
+        assert all(isinstance(r, DownloadError) for r in results)
+        assert rss_downloader._flights == {}
+
+    @patch("trendspyg.rss_downloader._store_snapshot_safely")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_shared_fetch_is_archived_once(self, mock_get, mock_store):
+        self._burst(mock_get, cache=False, archive=True)
+
+        assert mock_get.call_count == 1
+        assert mock_store.call_count == 1
+
+    def test_flight_key_separates_cache_modes_and_archiving(self):
+        key = _make_cache_key("US")
+
+        assert rss_downloader._flight_key(key, True, False, None) == rss_downloader._flight_key(
+            key, 1, False, None
+        )
+        assert (
+            len(
+                {
+                    rss_downloader._flight_key(key, True, False, None),
+                    rss_downloader._flight_key(key, False, False, None),
+                    rss_downloader._flight_key(key, "disk", False, None),
+                    rss_downloader._flight_key(key, True, True, None),
+                    rss_downloader._flight_key(key, "disk", False, "other.db"),
+                }
+            )
+            == 5
+        )
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_cache_filled_while_waiting_skips_the_fetch(self, mock_get):
+        """A caller elected after another fetch filled the cache does not refetch"""
+        from trendspyg.utils import get_rss_cache
+
+        key = _make_cache_key("US")
+        get_rss_cache().set(key, [{"trend": "cached"}])
+
+        trends, fetched = rss_downloader._fetch_rss("US", key, True, None, None)
+
+        assert (trends, fetched) == ([{"trend": "cached"}], False)
+        mock_get.assert_not_called()
+
+
+class TestThreadedBatch:
+    """Sync batch with max_workers: a thread pool over the shared pooled session"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_fetches_run_in_parallel(self, mock_single):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def single(**kwargs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return [{"trend": kwargs["geo"]}]
+
+        mock_single.side_effect = single
+        geos = ["US", "GB", "CA", "AU", "DE", "FR"]
+
+        results = download_google_trends_rss_batch(geos, show_progress=False, max_workers=3)
+
+        assert peak[0] == 3
+        assert list(results) == geos  # ordered by default
+        assert results["DE"] == [{"trend": "DE"}]
+
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_unordered_results_follow_completion(self, mock_single):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        delays = {"US": 0.1, "GB": 0.0}
+
+        def single(**kwargs):
+            time.sleep(delays[kwargs["geo"]])
+            return []
+
+        mock_single.side_effect = single
+
+        results = download_google_trends_rss_batch(
+            ["US", "GB"], show_progress=False, max_workers=2, ordered=False
+        )
+
+        assert list(results) == ["GB", "US"]
+
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_first_failure_is_raised_and_the_rest_cancelled(self, mock_single):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        mock_single.side_effect = DownloadError("boom")
+
+        with pytest.raises(DownloadError):
+            download_google_trends_rss_batch(
+                ["US", "GB", "CA", "AU"], show_progress=False, max_workers=1
+            )
+
+        assert mock_single.call_count < 4
+
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_progress_bar_and_delay_between_starts(self, mock_single, monkeypatch):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        sleeps = []
+        monkeypatch.setattr("time.sleep", lambda seconds: sleeps.append(seconds))
+        mock_single.return_value = []
+
+        results = download_google_trends_rss_batch(
+            ["US", "GB", "CA"], show_progress=True, delay=0.5, max_workers=2
+        )
+
+        assert set(results) == {"US", "GB", "CA"}
+        assert sleeps == [0.5, 0.5]  # between starts, not after the last
+
+    def test_workers_share_the_pooled_session(self):
+        import requests
+
+        seen = []
+
+        def get(self, url, **kwargs):
+            seen.append(self)
+            return _response()
+
+        with patch.object(requests.Session, "get", autospec=True, side_effect=get):
+            rss_downloader.download_google_trends_rss_batch(
+                ["US", "GB", "CA"], show_progress=False, max_workers=3
+            )
+
+        assert len(seen) == 3
+        assert all(s is rss_downloader._get_session() for s in seen)
+
+    @pytest.mark.parametrize("workers", [0, -2, 2.5, True])
+    def test_invalid_max_workers(self, workers):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+
+        with pytest.raises(InvalidParameterError):
+            download_google_trends_rss_batch(["US"], show_progress=False, max_workers=workers)
+
+
+class TestRateGovernorIntegration:
+    """Every RSS fetch goes through the shared governor and reports back to it"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_healthy_fetch_raises_the_rate(self, mock_get):
+        from trendspyg.utils import get_rss_governor_stats
+
+        mock_get.return_value = _response()
+        before = get_rss_governor_stats()["rate"]
+
+        download_google_trends_rss(geo="US", cache=False)
+
+        stats = get_rss_governor_stats()
+        assert stats["successes"] == 1
+        assert stats["rate"] > before
+        assert stats["in_flight"] == 0
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_429_backs_off_and_honors_retry_after(self, mock_get):
+        import requests
+
+        from trendspyg.utils import get_rss_governor_stats
+
+        response = _response(status=429, headers={"Retry-After": "45"})
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        mock_get.return_value = response
+        before = get_rss_governor_stats()["rate"]
+
+        with pytest.raises(RateLimitError) as exc_info:
+            download_google_trends_rss(geo="US", cache=False)
+
+        stats = get_rss_governor_stats()
+        assert stats["rate"] == before / 2
+        assert stats["state"] == "paused"
+        assert 40 < stats["paused_for"] <= 45
+        assert "wait 45s" in str(exc_info.value)
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_paused_governor_fails_fast_on_long_retry_after(self, mock_get):
+        from trendspyg.utils import get_rss_governor
+
+        get_rss_governor().on_throttle(retry_after=600)
+
+        with pytest.raises(RateLimitError):
+            download_google_trends_rss(geo="US", cache=False)
+
+        mock_get.assert_not_called()
+
+    def test_cache_hits_bypass_the_governor(self):
+        from trendspyg.utils import get_rss_cache, get_rss_governor
+
+        get_rss_cache().set(_make_cache_key("US"), [])
+        get_rss_governor().on_throttle(retry_after=600)
+
+        assert download_google_trends_rss(geo="US") == []
+
+
+class TestRssRetry:
+    """Jittered exponential backoff for transient RSS failures"""
+
+    def setup_method(self):
+        clear_rss_cache()
+
+    def teardown_method(self):
+        clear_rss_cache()
+
+    @staticmethod
+    def _status(status, headers=None):
+        import requests
+
+        response = _response(status=status, headers=headers)
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        return response
+
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_transient_error_is_retried(self, mock_get, mock_sleep):
+        import requests
+
+        mock_get.side_effect = [requests.ConnectionError(), requests.Timeout(), _response()]
+
+        trends = download_google_trends_rss(geo="US", cache=False)
+
+        assert trends[0]["trend"] == "bitcoin"
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_exhausted_retries_report_every_attempt(self, mock_get, mock_sleep):
+        from trendspyg.utils import RetryPolicy
+
+        mock_get.return_value = self._status(503)
+
+        with pytest.raises(DownloadError) as exc_info:
+            download_google_trends_rss(
+                geo="US", cache=False, retry=RetryPolicy(max_attempts=4, jitter=0.0)
+            )
+
+        error = exc_info.value
+        assert mock_get.call_count == 4
+        assert [a["attempt"] for a in error.attempts] == [1, 2, 3, 4]
+        assert [a["wait"] for a in error.attempts] == [0.5, 1.0, 2.0, 0.0]
+        assert all(a["error"] == "HTTP 503" for a in error.attempts)
+        assert "server error" in str(error).lower()
+        assert "Attempts:" in str(error) and "4. HTTP 503" in str(error)
+
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_non_transient_status_is_not_retried(self, mock_get, mock_sleep):
+        mock_get.return_value = self._status(404)
+
+        with pytest.raises(DownloadError) as exc_info:
+            download_google_trends_rss(geo="US", cache=False)
+
+        assert mock_get.call_count == 1
+        assert exc_info.value.attempts is None  # nothing was retried
+        mock_sleep.assert_not_called()
+
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_429_is_retried_only_when_listed_and_waits_for_retry_after(
+        self, mock_get, mock_sleep, monkeypatch
+    ):
+        from trendspyg.utils import RetryPolicy, get_rss_governor
+
+        # the governor's own Retry-After pause is covered in TestRateGovernorIntegration
+        monkeypatch.setattr(get_rss_governor(), "enabled", False)
+        mock_get.side_effect = [self._status(429, {"Retry-After": "3"}), _response()]
+
+        with pytest.raises(RateLimitError):
+            download_google_trends_rss(geo="US", cache=False)
+        assert mock_get.call_count == 1
+
+        mock_get.side_effect = [self._status(429, {"Retry-After": "3"}), _response()]
+        policy = RetryPolicy(retry_statuses=(429, 503), backoff_base=0.1, jitter=0.0)
+        trends = download_google_trends_rss(geo="US", cache=False, retry=policy)
+
+        assert trends[0]["trend"] == "bitcoin"
+        mock_sleep.assert_called_once_with(3.0)
+
+    @patch("trendspyg.rss_downloader.requests.Session.get")
+    def test_deadline_stops_retrying(self, mock_get, monkeypatch):
+        import requests
+
+        from trendspyg.utils import RetryPolicy
+
+        clock = [time.monotonic()]
+        monkeypatch.setattr("time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("time.sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+        mock_get.side_effect = requests.ConnectionError()
+        policy = RetryPolicy(max_attempts=10, backoff_base=1.0, jitter=0.0, deadline=2.5)
+
+        with pytest.raises(DownloadError) as exc_info:
+            download_google_trends_rss(geo="US", cache=False, retry=policy)
+
+        # waits 1s then 2s would overrun 2.5s: two attempts only
+        assert mock_get.call_count == 2
+        assert len(exc_info.value.attempts) == 2
+
+    @patch("trendspyg.rss_downloader.time.sleep")
+    @patch("trendspyg.rss_downloader.download_google_trends_rss")
+    def test_batch_forwards_retry(self, mock_single, mock_sleep):
+        from trendspyg.rss_downloader import download_google_trends_rss_batch
+        from trendspyg.utils import RetryPolicy
+
+        policy = RetryPolicy(max_attempts=5)
+        mock_single.return_value = []
+
+        download_google_trends_rss_batch(["US", "GB"], show_progress=False, retry=policy)
+
+        assert all(c.kwargs["retry"] is policy for c in mock_single.call_args_list)
+
+    def test_retry_must_be_a_policy(self):
+        with pytest.raises(InvalidParameterError):
+            download_google_trends_rss(geo="US", retry=3)
+
+    def test_attempt_log_is_added_to_the_original_error(self):
+        from trendspyg.rss_downloader import _with_attempts
+
+        class CodedError(DownloadError):
+            def __init__(self, message, code):
+                super().__init__(message)
+                self.code = code
+
+        error = CodedError("boom", 503)
+        attempts = [
+            {"attempt": n, "error": "HTTP 503", "elapsed": 0.1, "wait": 0.0} for n in (1, 2)
+        ]
+
+        retried = _with_attempts(error, attempts)
+
+        assert retried is error
+        assert retried.code == 503 and retried.attempts == attempts
+        assert str(retried).startswith("boom\n\nAttempts:")
+
+    def test_pooled_session_leaves_retrying_to_the_policy(self):
+        from trendspyg import rss_downloader
+
+        adapter = rss_downloader._get_session().get_adapter("https://trends.google.com/")
+
+        assert adapter.max_retries.total == 0 and adapter.max_retries.connect == 0
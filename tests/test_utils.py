@@ -6,12 +6,21 @@ import time
 
 import pytest
 
+from trendspyg.exceptions import InvalidParameterError, RateLimitError
 from trendspyg.utils import (
+    RateGovernor,
+    RetryPolicy,
     TTLCache,
+    _approx_size,
+    _retry_after_seconds,
     clear_rss_cache,
+    configure_rss_cache,
+    configure_rss_governor,
     ensure_dir,
     get_rss_cache,
     get_rss_cache_stats,
+    get_rss_governor,
+    get_rss_governor_stats,
     get_timestamp,
     rate_limit,
     set_rss_cache_ttl,
@@ -89,6 +98,80 @@ class TestTTLCacheAdvanced:
         assert cache.get("c") == 3
         assert cache.get("d") == 4
 
+    def test_per_entry_ttl(self):
+        """set(ttl=...) overrides the cache-wide TTL for one entry"""
+        cache = TTLCache(ttl=300.0)
+
+        cache.set("short", 1, ttl=0.05)
+        cache.set("long", 2)
+        time.sleep(0.1)
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_recently_read_entries_survive_eviction(self):
+        """LRU, not FIFO: a hot key outlives a burst of one-off keys"""
+        cache = TTLCache(ttl=300.0, max_size=3)
+        cache.set("hot", 0)
+
+        for i in range(10):
+            assert cache.get("hot") == 0
+            cache.set(f"once-{i}", i)
+
+        assert cache.get("hot") == 0
+        assert cache.stats()["size"] == 3
+
+    def test_expired_entries_are_evicted_before_live_ones(self):
+        cache = TTLCache(ttl=300.0, max_size=3)
+        cache.set("a", 1)
+        cache.set("short", 2, ttl=0.01)
+        cache.set("c", 3)
+        time.sleep(0.05)
+
+        cache.set("d", 4)
+
+        assert [cache.get(k) for k in ("a", "short", "c", "d")] == [1, None, 3, 4]
+
+    def test_rewriting_a_key_does_not_grow_the_expiry_heap(self):
+        cache = TTLCache(ttl=300.0, max_size=10)
+
+        for i in range(1000):
+            cache.set("key", i)
+
+        assert cache.get("key") == 999
+        assert len(cache._shards[0].expiries) < 100
+
+    def test_striped_cache(self):
+        import threading
+
+        cache = TTLCache(ttl=300.0, max_size=64, stripes=8)
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(200):
+                    cache.set(f"{n}-{i % 20}", i)
+                    cache.get(f"{n}-{i % 20}")
+            except Exception as e:  # pragma: no cover - surfaced below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats()
+        assert errors == []
+        assert stats["stripes"] == 8
+        assert stats["size"] <= 64
+        assert stats["hits"] == 8 * 200
+
+    @pytest.mark.parametrize("stripes", [0, -1, 1.5, True])
+    def test_invalid_stripes(self, stripes):
+        with pytest.raises(InvalidParameterError):
+            TTLCache(stripes=stripes)
+
     def test_cache_update_existing_key(self):
         """Test updating an existing key"""
         cache = TTLCache(ttl=300.0, max_size=10)
@@ -122,6 +205,103 @@ class TestTTLCacheAdvanced:
         assert cache.get("key3") == "value3"
 
 
+class TestTTLCacheBytes:
+    """max_bytes bounds the approximate size of the cached values"""
+
+    def test_resident_bytes_are_reported(self):
+        cache = TTLCache(ttl=300.0, sizeof=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "xx")
+        cache.set("a", "x")  # replacing releases the old size
+
+        assert cache.stats()["bytes"] == 3
+        cache.clear()
+        assert cache.stats()["bytes"] == 0
+
+    def test_budget_evicts_least_recently_used(self):
+        cache = TTLCache(ttl=300.0, max_bytes=10, sizeof=len)
+        cache.set("a", "xxxx")
+        cache.set("b", "xxxx")
+        cache.get("a")
+
+        cache.set("c", "xxxx")
+
+        assert [cache.get(k) for k in ("a", "b", "c")] == ["xxxx", None, "xxxx"]
+        assert cache.stats()["bytes"] == 8
+
+    def test_value_larger_than_the_budget_is_not_cached(self):
+        cache = TTLCache(ttl=300.0, max_bytes=10, sizeof=len)
+        cache.set("small", "xxxx")
+        cache.set("big", "x" * 11)
+
+        assert cache.get("big") is None
+        assert cache.get("small") == "xxxx"  # not flushed for nothing
+
+    def test_lowering_the_budget_evicts(self):
+        cache = TTLCache(ttl=300.0, sizeof=len)
+        for key in "abcd":
+            cache.set(key, "xxxx")
+
+        cache.max_bytes = 8
+
+        assert cache.stats()["size"] == 2
+        assert cache.get("d") == "xxxx"
+
+    @pytest.mark.parametrize("max_bytes", [0, -5, 1.5, True])
+    def test_invalid_budget(self, max_bytes):
+        with pytest.raises(InvalidParameterError):
+            TTLCache(max_bytes=max_bytes)
+
+    def test_default_estimator_sees_nested_payloads(self):
+        article = {"headline": "h" * 100, "url": "https://example.com/a", "source": "s"}
+        lean = [{"trend": "bitcoin", "traffic": "500K+"}]
+        full = [{"trend": "bitcoin", "traffic": "500K+", "news_articles": [article] * 5}]
+
+        assert _approx_size(full) > _approx_size(lean)
+        # the same article object five times is counted once
+        assert _approx_size(full) < _approx_size(lean) + 2 * _approx_size(article) + 200
+
+
+class TestTTLCacheStale:
+    """Grace windows keep expired values readable through get_stale()"""
+
+    def _expired(self, monkeypatch, cache, seconds):
+        real_time = time.time()
+        cache.set("key", "value")
+        monkeypatch.setattr(time, "time", lambda: real_time + cache.ttl + seconds)
+
+    def test_fresh_value_is_not_stale(self):
+        cache = TTLCache(ttl=300.0, stale_while_revalidate=60.0)
+        cache.set("key", "value")
+
+        assert cache.get_stale("key") == ("value", 0.0)
+        assert cache.stats()["stale_hits"] == 0
+
+    def test_expired_value_inside_the_grace_window(self, monkeypatch):
+        cache = TTLCache(ttl=300.0, stale_if_error=60.0)
+        self._expired(monkeypatch, cache, 10)
+
+        assert cache.get("key") is None  # get() never serves stale values
+        value, expired_for = cache.get_stale("key")
+
+        assert value == "value"
+        assert expired_for == pytest.approx(10, abs=1)
+        assert cache.stats()["stale_hits"] == 1
+
+    def test_expired_value_past_the_grace_window_is_dropped(self, monkeypatch):
+        cache = TTLCache(ttl=300.0, stale_while_revalidate=5.0, stale_if_error=30.0)
+        self._expired(monkeypatch, cache, 31)
+
+        assert cache.get_stale("key") is None
+        assert cache.stats()["size"] == 0
+
+    def test_no_grace_by_default(self, monkeypatch):
+        cache = TTLCache(ttl=300.0)
+        self._expired(monkeypatch, cache, 1)
+
+        assert cache.get_stale("key") is None
+
+
 class TestGlobalCache:
     """Test global cache functions"""
 
@@ -157,6 +337,36 @@ class TestGlobalCache:
         assert "ttl" in stats
         assert "hit_rate" in stats
 
+    def test_configure_rss_cache_sets_the_windows(self):
+        configure_rss_cache(stale_while_revalidate=30, stale_if_error=600)
+
+        stats = get_rss_cache_stats()
+        assert (stats["stale_while_revalidate"], stats["stale_if_error"]) == (30.0, 600.0)
+
+        configure_rss_cache(stale_if_error=0)  # None leaves the other window alone
+        assert get_rss_cache().stale_while_revalidate == 30.0
+        assert get_rss_cache().stale_if_error == 0.0
+
+    def test_configure_rss_cache_sets_a_byte_budget(self):
+        from trendspyg.utils import get_rss_disk_l1, get_rss_validator_cache
+
+        configure_rss_cache(max_bytes=1_000_000)
+        caches = (get_rss_cache(), get_rss_validator_cache(), get_rss_disk_l1())
+        assert [c.max_bytes for c in caches] == [1_000_000] * 3
+        assert get_rss_cache_stats()["max_bytes"] == 1_000_000
+
+        configure_rss_cache(max_bytes=0)
+        assert [c.max_bytes for c in caches] == [None] * 3
+
+    def test_configure_rss_cache_rejects_a_bad_budget(self):
+        with pytest.raises(InvalidParameterError):
+            configure_rss_cache(max_bytes=-1)
+
+    @pytest.mark.parametrize("value", [-1, "60", True])
+    def test_configure_rss_cache_rejects_bad_windows(self, value):
+        with pytest.raises(InvalidParameterError):
+            configure_rss_cache(stale_while_revalidate=value)
+
     def test_set_rss_cache_ttl_changes_ttl(self):
         """Test set_rss_cache_ttl changes TTL"""
         original_ttl = get_rss_cache().ttl
@@ -248,3 +458,225 @@ class TestRateLimitDecorator:
 
         assert my_function.__name__ == "my_function"
         assert my_function.__doc__ == "My docstring"
+
+
+class TestRateGovernor:
+    """AIMD token bucket + concurrency cap shared by every RSS entry point"""
+
+    def test_success_increases_additively(self):
+        governor = RateGovernor(rate=2.0, increase=0.5, max_rate=3.0)
+
+        governor.on_success()
+        governor.on_success()
+        governor.on_success()
+
+        assert governor.stats()["rate"] == 3.0  # capped at max_rate
+        assert governor.stats()["successes"] == 3
+
+    def test_throttle_decreases_multiplicatively(self):
+        governor = RateGovernor(rate=8.0, concurrency=8, min_rate=1.5)
+
+        governor.on_throttle()
+        assert governor.stats()["rate"] == 4.0
+        assert governor.stats()["concurrency"] == 4
+        assert governor.stats()["state"] == "recovering"
+
+        governor.on_throttle()
+        governor.on_throttle()
+        assert governor.stats()["rate"] == 1.5  # floor
+        assert governor.stats()["throttles"] == 3
+
+    def test_concurrency_grows_one_slot_per_window(self):
+        governor = RateGovernor(concurrency=2, max_concurrency=4)
+
+        governor.on_success()
+        governor.on_success()
+        assert governor.stats()["concurrency"] == 2  # 2.9: not a whole slot yet
+
+        governor.on_success()
+        assert governor.stats()["concurrency"] == 3
+
+    def test_token_bucket_paces_requests(self):
+        governor = RateGovernor(rate=20.0, min_rate=1.0)
+        governor._tokens = 0.0
+
+        start = time.monotonic()
+        with governor.slot():
+            pass
+        with governor.slot():
+            pass
+
+        assert time.monotonic() - start >= 0.09  # 2 tokens at 20/s
+
+    def test_concurrency_cap_blocks_until_release(self):
+        import threading
+
+        governor = RateGovernor(rate=50.0, concurrency=1, max_concurrency=1)
+        order = []
+
+        def second():
+            with governor.slot():
+                order.append("second")
+
+        with governor.slot():
+            t = threading.Thread(target=second)
+            t.start()
+            time.sleep(0.05)
+            order.append("first done")
+        t.join(2)
+
+        assert order == ["first done", "second"]
+        assert governor.stats()["in_flight"] == 0
+
+    def test_retry_after_pauses_then_resumes(self):
+        governor = RateGovernor()
+
+        governor.on_throttle(retry_after=0.1)
+        assert governor.stats()["state"] == "paused"
+        start = time.monotonic()
+        with governor.slot():
+            pass
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_long_retry_after_raises_instead_of_blocking(self):
+        governor = RateGovernor(max_wait=1.0)
+        governor.on_throttle(retry_after=120)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            with governor.slot():
+                pass
+
+        assert "Retry-After" in str(exc_info.value)
+
+    def test_disabled_governor_never_waits(self):
+        governor = RateGovernor(concurrency=1, max_concurrency=1, enabled=False)
+        governor.on_throttle(retry_after=120)
+
+        with governor.slot():
+            with governor.slot():
+                pass
+
+    def test_async_slot(self):
+        import asyncio
+
+        governor = RateGovernor(rate=20.0, min_rate=1.0)
+        governor._tokens = 0.0
+
+        async def run():
+            async with governor.slot_async():
+                return governor.stats()["in_flight"]
+
+        assert asyncio.run(run()) == 1
+        assert governor.stats()["in_flight"] == 0
+
+    def test_reset_restores_starting_limits(self):
+        governor = RateGovernor(rate=4.0, concurrency=4)
+        governor.on_throttle(retry_after=30)
+
+        governor.reset()
+
+        stats = governor.stats()
+        assert (stats["rate"], stats["concurrency"], stats["state"]) == (4.0, 4, "healthy")
+        assert stats["throttles"] == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"rate": 0.05}, {"rate": 100.0}, {"concurrency": 0}, {"decrease": 1.0}],
+    )
+    def test_invalid_limits(self, kwargs):
+        with pytest.raises(InvalidParameterError):
+            RateGovernor(**kwargs)
+
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"Retry-After": "30"}, 30.0),
+            ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),  # in the past
+            ({"Retry-After": "soon"}, None),
+            ({}, None),
+            (None, None),
+        ],
+    )
+    def test_retry_after_parsing(self, headers, expected):
+        assert _retry_after_seconds(headers) == expected
+
+
+class TestGlobalRateGovernor:
+    """Process-wide governor: stats and reconfiguration"""
+
+    def teardown_method(self):
+        configure_rss_governor()
+
+    def test_stats_shape(self):
+        stats = get_rss_governor_stats()
+
+        assert stats["state"] == "healthy"
+        for key in ("rate", "concurrency", "in_flight", "paused_for", "successes", "throttles"):
+            assert key in stats
+
+    def test_configure_replaces_the_governor(self):
+        configure_rss_governor(rate=2.0, max_rate=4.0, concurrency=3, max_concurrency=6)
+
+        stats = get_rss_governor_stats()
+        assert (stats["rate"], stats["max_rate"], stats["concurrency"]) == (2.0, 4.0, 3)
+        assert get_rss_governor().max_concurrency == 6
+
+    def test_configure_rejects_inconsistent_limits(self):
+        with pytest.raises(InvalidParameterError):
+            configure_rss_governor(rate=5.0, max_rate=1.0)
+
+
+class TestRetryPolicy:
+    """Jittered, capped exponential backoff"""
+
+    def test_backoff_doubles_up_to_the_cap(self):
+        policy = RetryPolicy(backoff_base=0.5, backoff_cap=3.0, jitter=0.0)
+
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [0.5, 1.0, 2.0, 3.0]
+
+    def test_full_jitter_stays_within_the_window(self):
+        policy = RetryPolicy(backoff_base=1.0, jitter=1.0)
+
+        waits = [policy.backoff(2) for _ in range(200)]
+
+        assert all(0.0 <= w <= 2.0 for w in waits)
+        assert len(set(waits)) > 1
+
+    def test_partial_jitter_keeps_a_floor(self):
+        policy = RetryPolicy(backoff_base=1.0, jitter=0.25)
+
+        assert all(0.75 <= policy.backoff(1) <= 1.0 for _ in range(100))
+
+    def test_retry_after_is_a_floor(self):
+        policy = RetryPolicy(backoff_base=0.1, jitter=0.0)
+
+        assert policy.backoff(1, retry_after=7.0) == 7.0
+
+    def test_should_retry_respects_attempts_and_deadline(self):
+        policy = RetryPolicy(max_attempts=3, deadline=5.0)
+
+        assert policy.should_retry(1, elapsed=0.0, wait=1.0)
+        assert not policy.should_retry(3, elapsed=0.0, wait=1.0)
+        assert not policy.should_retry(1, elapsed=4.5, wait=1.0)
+
+    def test_defaults(self):
+        policy = RetryPolicy()
+
+        assert policy.max_attempts == 3
+        assert policy.retry_statuses == frozenset({500, 502, 503, 504})
+        assert "max_attempts=3" in repr(policy)
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_attempts": 0},
+            {"max_attempts": True},
+            {"backoff_base": 2.0, "backoff_cap": 1.0},
+            {"jitter": 1.5},
+            {"deadline": 0},
+        ],
+    )
+    def test_invalid_policy(self, kwargs):
+        with pytest.raises(InvalidParameterError):
+            RetryPolicy(**kwargs)
@@ -24,10 +24,19 @@ __license__ = "MIT"
 
 # Import the local archive + disk-cache query surface (new in 1.3.0)
 from .archive import (
+    configure_archive_storage,
+    configure_archive_writer,
+    flush_archive_writer,
+    get_archive_rollups,
     get_archive_stats,
+    get_archive_writer_stats,
     get_keyword_history,
+    iter_archive,
     prune_archive,
     read_archive,
+    read_archive_frame,
+    refresh_archive_rollups,
+    store_snapshots,
 )
 
 # Import core downloaders
@@ -41,6 +50,7 @@ from .exceptions import (
     InvalidParameterError,
     ParseError,
     RateLimitError,
+    StaleDataWarning,
     TrendspygException,
 )
 
@@ -65,10 +75,12 @@ from .monitor import (
 )
 from .normalize import SCHEMA_VERSION
 from .rss_downloader import (
+    configure_rss_session,
     download_google_trends_rss,
     download_google_trends_rss_async,
     download_google_trends_rss_batch,
     download_google_trends_rss_batch_async,
+    iter_google_trends_rss_batch_async,
 )
 
 # Import typed return shapes (static hints; runtime values are plain dicts)
@@ -92,8 +104,12 @@ from .types import (
 
 # Import cache utilities
 from .utils import (
+    RetryPolicy,
     clear_rss_cache,
+    configure_rss_cache,
+    configure_rss_governor,
     get_rss_cache_stats,
+    get_rss_governor_stats,
     set_rss_cache_ttl,
 )
 
@@ -106,6 +122,7 @@ __all__ = [
     "download_google_trends_rss_async",  # Async RSS download for parallel fetching
     "download_google_trends_rss_batch",  # Batch RSS download with progress bar
     "download_google_trends_rss_batch_async",  # Async batch RSS with progress bar (fastest)
+    "iter_google_trends_rss_batch_async",  # Async batch yielding (geo, result|error) as they land
     # Explore path (keyword analysis over time)
     "download_google_trends_interest_over_time",  # Keyword interest over time (pytrends core)
     "download_google_trends_explore",  # Full Explore: interest + related + geo
@@ -120,11 +137,25 @@ __all__ = [
     "clear_rss_cache",  # Clear all cached RSS data
     "get_rss_cache_stats",  # Get cache statistics (hits, misses, size)
     "set_rss_cache_ttl",  # Set cache TTL (0 to disable; also governs the disk cache)
+    "configure_rss_cache",  # Stale-while-revalidate / stale-if-error windows, byte budget
+    "configure_rss_session",  # Resize the pooled keep-alive session of the sync RSS path
+    "get_rss_governor_stats",  # Current rate / concurrency / state of the adaptive RSS throttle
+    "configure_rss_governor",  # Set the adaptive RSS throttle's starting and max limits
+    "RetryPolicy",  # Jittered exponential backoff for transient RSS failures (retry=)
     # Local archive + disk cache (new in 1.3.0; opt-in via archive=/cache="disk")
     "read_archive",  # Read archived snapshots, newest first (filters + formats)
+    "iter_archive",  # Stream archived snapshots page by page, resumable via a keyset cursor
+    "read_archive_frame",  # Archived trends as a typed DataFrame / Arrow table, straight from SQL
+    "refresh_archive_rollups",  # Enable / catch up the hourly + daily keyword rollup tables
+    "get_archive_rollups",  # Per-hour / per-day keyword aggregates from the rollups
     "get_keyword_history",  # Every archived appearance of a keyword, oldest first
     "get_archive_stats",  # Counts, date range, geos, file size/path of the archive
     "prune_archive",  # Delete snapshots older than a cutoff (explicit only)
+    "store_snapshots",  # Archive many envelopes in one transaction (backfills, batches)
+    "configure_archive_writer",  # Opt-in background write-behind for archive/cache writes
+    "flush_archive_writer",  # Wait for queued archive/cache writes to commit
+    "get_archive_writer_stats",  # Queue depth, write counters, commit latency of the writer
+    "configure_archive_storage",  # Opt-in delta storage (keyframes + deltas) for snapshots
     # Exceptions (all subclass TrendspygException; also importable from trendspyg.exceptions)
     "TrendspygException",  # Base class for every trendspyg error
     "DownloadError",  # Download / network failure
@@ -133,6 +164,7 @@ __all__ = [
     "BrowserError",  # Chrome / Selenium automation failure
     "ParseError",  # RSS/CSV payload failed to parse
     "ArchiveError",  # Local archive unreadable (writes never raise — they warn)
+    "StaleDataWarning",  # An expired cached RSS feed was served (RuntimeWarning subclass)
     # Schema-version constants (detect envelope/shape drift)
     "SCHEMA_VERSION",  # normalize=True NormalizedEnvelope schema
     "EXPLORE_SCHEMA_VERSION",  # ExploreEnvelope schema
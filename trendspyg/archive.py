@@ -11,20 +11,58 @@ Storage is one file (default: the platform data directory, override with the
 ``TRENDSPYG_DB`` env var or a ``db_path=`` argument). SQLite is embedded — no
 server, no service, no new dependencies.
 
-Layout (``db_schema_version`` 1):
+Layout (``db_schema_version`` 2):
 
 * ``snapshots``/``trends`` — the archive: full normalized envelopes verbatim
   (``payload_json``) plus flattened per-keyword rows for indexed queries.
   Since 1.4.0 the Explore path archives here too (``source`` = ``"explore"`` /
   ``"explore_comparison"``; keyword rows carry NULL rank/volume).
+  Keyword lookups are case-insensitive, so since 1.7.0 ``trends.keyword`` is
+  indexed ``COLLATE NOCASE`` (``idx_trends_keyword_nocase``); the earlier
+  BINARY ``idx_trends_keyword`` could not serve those lookups and is dropped
+  when an older file is first opened. ``idx_trends_snapshot`` (1.7.0) keeps
+  the ``ON DELETE CASCADE`` from ``snapshots`` from scanning ``trends`` once
+  per deleted snapshot.
 * ``cache`` — the RSS disk cache: the same raw payloads the in-memory TTLCache
-  holds, keyed identically, with datetimes round-tripped exactly.
+  holds, keyed identically, with datetimes round-tripped exactly. Since 1.7.0
+  each row also carries the response validators (``etag``, ``last_modified``,
+  ``content_hash``) so an expired entry can be revalidated with a conditional
+  GET instead of re-downloaded. The columns are added in place to older files
+  and are nullable, so earlier installs keep writing rows without them.
 * ``explore_cache`` (1.4.0) — the Explore disk cache. Separate from ``cache``
   on purpose: every ``cache`` write prunes rows older than the RSS TTL
   (minutes), which would purge Explore entries whose TTLs are hours/days.
   Explore payloads are pure parsed JSON, so no datetime codec is needed.
   Adding this table is layout-tolerant: 1.3.0 installs ignore it (verified
   against the 1.3.0 wheel), so ``db_schema_version`` stays 1.
+* Payload compression (1.7.0, ``db_schema_version`` 2). ``payload_json`` in
+  all three tables holds either plain JSON text (every row written before
+  1.7.0, and small payloads) or a BLOB: one codec byte (``z`` zlib, ``s``
+  zstd) followed by the compressed UTF-8 JSON. Rows are decompressed only when
+  read. The nullable ``payload_size`` column records the uncompressed byte size
+  for :func:`get_archive_stats`. Older trendspyg versions cannot read BLOB
+  payloads (nor the reference and delta rows below), so a version-1 file is
+  stamped 2 by the transaction that writes its first such row, and they then
+  refuse it with an actionable :class:`~trendspyg.exceptions.ArchiveError`.
+  Until then it stays a version-1 file; opening and reading it changes nothing.
+* Deduplication (1.7.0). Each snapshot records a ``content_hash`` of its
+  envelope minus ``fetched_at``. A snapshot whose hash matches the latest one
+  for its (source, geo) is stored as a reference row: ``ref_id`` points at the
+  snapshot holding the payload and trend rows, ``payload_json`` is empty, and
+  no trend rows are written. Reads rebuild the envelope from the referenced
+  payload with the reference's own ``fetched_at``, so they stay exact.
+  ``prune_archive`` moves the payload to a surviving reference before it
+  deletes the snapshot that holds it.
+* Delta storage (1.7.0, opt-in via :func:`configure_archive_storage`). A
+  snapshot may instead hold a JSON patch against the previous snapshot of its
+  (source, geo) (``delta_of``), with ``delta_depth`` counting the patches back
+  to a full keyframe. Trend rows are written as usual. Pruning a snapshot that
+  kept deltas refer to rewrites those as keyframes first.
+* Rollups (1.7.0, opt-in per file via :func:`refresh_archive_rollups`). The
+  ``rollups`` table holds per hour and per day (UTC), geo, source and keyword
+  the appearance count, best rank, max ``volume_min`` and first/last seen.
+  Snapshots with ids past the ``rollup_through`` meta watermark are folded in
+  by the same transaction that archives them.
 
 Failure policy: WRITE failures never break a download (callers warn and carry
 on); READ failures raise :class:`~trendspyg.exceptions.ArchiveError`.
@@ -32,19 +70,37 @@ on); READ failures raise :class:`~trendspyg.exceptions.ArchiveError`.
 
 from __future__ import annotations
 
+import atexit
+import copy
+import hashlib
 import json
 import os
+import queue
 import sqlite3
 import sys
+import threading
 import time
 import warnings
+import weakref
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from .exceptions import ArchiveError, InvalidParameterError
 
+try:  # zstd compresses these payloads better and faster than zlib; optional
+    import zstandard as _zstd
+except ImportError:  # pragma: no cover - exercised when zstandard is absent
+    _zstd = None
+
 #: Bumped when the on-disk table layout changes shape.
-DB_SCHEMA_VERSION = 1
+DB_SCHEMA_VERSION = 2
+
+#: Versions this trendspyg opens as they are; :func:`_mark_packed` upgrades them to
+#: ``DB_SCHEMA_VERSION`` when the first row they cannot read is written.
+_UPGRADABLE_SCHEMA_VERSIONS = ("1",)
 
 _SCHEMA = """
 CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
@@ -56,6 +112,11 @@ CREATE TABLE IF NOT EXISTS snapshots (
     schema_version TEXT NOT NULL,
     trend_count    INTEGER NOT NULL,
     payload_json   TEXT NOT NULL,
+    payload_size   INTEGER,
+    content_hash   TEXT,
+    ref_id         INTEGER,
+    delta_of       INTEGER,
+    delta_depth    INTEGER,
     UNIQUE(source, geo, fetched_at)
 );
 CREATE TABLE IF NOT EXISTS trends (
@@ -65,17 +126,46 @@ CREATE TABLE IF NOT EXISTS trends (
     volume_min  INTEGER
 );
 CREATE INDEX IF NOT EXISTS idx_snapshots_geo_time ON snapshots(geo, fetched_at);
-CREATE INDEX IF NOT EXISTS idx_trends_keyword ON trends(keyword);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots(fetched_at);
+DROP INDEX IF EXISTS idx_trends_keyword;
+CREATE INDEX IF NOT EXISTS idx_trends_keyword_nocase ON trends(keyword COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_trends_snapshot ON trends(snapshot_id);
 CREATE TABLE IF NOT EXISTS cache (
-    key          TEXT PRIMARY KEY,
-    stored_at    REAL NOT NULL,
-    payload_json TEXT NOT NULL
+    key           TEXT PRIMARY KEY,
+    stored_at     REAL NOT NULL,
+    payload_json  TEXT NOT NULL,
+    payload_size  INTEGER,
+    etag          TEXT,
+    last_modified TEXT,
+    content_hash  TEXT
 );
 CREATE TABLE IF NOT EXISTS explore_cache (
     key          TEXT PRIMARY KEY,
     stored_at    REAL NOT NULL,
-    payload_json TEXT NOT NULL
+    payload_json TEXT NOT NULL,
+    payload_size INTEGER
 );
+CREATE TABLE IF NOT EXISTS rollups (
+    bucket         TEXT NOT NULL,
+    bucket_start   TEXT NOT NULL,
+    geo            TEXT NOT NULL,
+    source         TEXT NOT NULL,
+    keyword        TEXT NOT NULL COLLATE NOCASE,
+    appearances    INTEGER NOT NULL,
+    best_rank      INTEGER,
+    max_volume_min INTEGER,
+    first_seen     TEXT NOT NULL,
+    last_seen      TEXT NOT NULL,
+    PRIMARY KEY (bucket, bucket_start, geo, source, keyword)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_rollups_keyword ON rollups(bucket, keyword, bucket_start);
+"""
+
+#: Indexes over columns in ``_ADDED_COLUMNS``: created once those exist.
+_ADDED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_snapshots_ref ON snapshots(ref_id);
+CREATE INDEX IF NOT EXISTS idx_snapshots_delta ON snapshots(delta_of)
+    WHERE delta_of IS NOT NULL;
 """
 
 #: GC horizon for abandoned explore_cache keys. Freshness is decided at READ
@@ -85,6 +175,40 @@ CREATE TABLE IF NOT EXISTS explore_cache (
 #: short-ttl caller purge a long-ttl caller's still-fresh entries.
 _EXPLORE_CACHE_GC_SECONDS = 30 * 86400.0
 
+#: How long an expired RSS cache row that carries validators is kept for
+#: conditional revalidation. Rows without validators still go at the TTL.
+_REVALIDATE_SECONDS = 86400.0
+
+#: Snapshots deleted per transaction by ``prune_archive`` (~20 trend rows each).
+_PRUNE_BATCH = 500
+
+#: Pages released per ``PRAGMA incremental_vacuum`` step after a prune.
+_VACUUM_STEP_PAGES = 2048
+
+#: Columns added to existing tables after 1.3.0, as (table, column, type).
+#: ``_ensure_schema`` adds whichever are missing, so older files upgrade in
+#: place without a ``db_schema_version`` bump (the columns are nullable).
+_ADDED_COLUMNS = (
+    ("cache", "etag", "TEXT"),
+    ("cache", "last_modified", "TEXT"),
+    ("cache", "content_hash", "TEXT"),
+    ("snapshots", "payload_size", "INTEGER"),
+    ("cache", "payload_size", "INTEGER"),
+    ("explore_cache", "payload_size", "INTEGER"),
+    ("snapshots", "content_hash", "TEXT"),
+    ("snapshots", "ref_id", "INTEGER"),
+    ("snapshots", "delta_of", "INTEGER"),
+    ("snapshots", "delta_depth", "INTEGER"),
+)
+
+#: Codec markers: the first byte of a compressed (BLOB) payload.
+_CODEC_ZLIB = b"z"
+_CODEC_ZSTD = b"s"
+
+#: Payloads smaller than this are stored as plain text; compressing them saves
+#: little and costs a decompression on every read.
+_COMPRESS_MIN_BYTES = 512
+
 
 def _default_db_path() -> str:
     """Resolve the archive path: ``TRENDSPYG_DB`` env var, else platform data dir."""
@@ -101,26 +225,28 @@ def _default_db_path() -> str:
     return os.path.join(base, "trendspyg", "trendspyg.db")
 
 
-def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
-    """Open (creating on first touch) the archive DB with the designed pragmas.
+def _open(path: str, verify: bool) -> sqlite3.Connection:
+    """Open ``path`` with the designed pragmas, optionally verifying the schema.
 
-    One connection per operation is the access pattern throughout this module:
-    write rates are low, and the spike proved it safe for concurrent processes
-    (WAL mode + busy_timeout).
+    WAL mode is a property of the file, so it is set together with the schema
+    check; ``busy_timeout`` and ``foreign_keys`` are per connection and are set
+    on every open.
     """
-    path = db_path or _default_db_path()
     parent = os.path.dirname(os.path.abspath(path))
     try:
         os.makedirs(parent, exist_ok=True)
-        conn = sqlite3.connect(path, timeout=8.0)
+        conn = sqlite3.connect(path, timeout=8.0, check_same_thread=False)
     except (OSError, sqlite3.Error) as exc:
         raise ArchiveError("Cannot open trends archive at '%s': %s" % (path, exc)) from exc
     try:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA busy_timeout = 8000")
         conn.execute("PRAGMA foreign_keys = ON")
-        conn.execute("PRAGMA journal_mode = WAL")
-        _ensure_schema(conn, path)
+        if verify:
+            # No-op on existing files; new ones can then shrink after a prune.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("PRAGMA journal_mode = WAL")
+            _ensure_schema(conn, path)
         return conn
     except sqlite3.Error as exc:
         conn.close()
@@ -133,9 +259,165 @@ def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
         raise
 
 
+def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """Open (creating on first touch) a fresh, caller-owned archive connection.
+
+    Always verifies the schema. The module's own operations go through
+    :func:`_connection` instead, which reuses pooled connections.
+    """
+    return _open(db_path or _default_db_path(), verify=True)
+
+
+#: Per-thread pool bound: a thread touching more archive files than this
+#: closes its least recently used connection.
+_POOL_SIZE = 8
+
+
+class _ThreadConnections:
+    """One thread's open connections: abspath -> (connection, file identity)."""
+
+    __slots__ = ("conns", "__weakref__")
+
+    def __init__(self) -> None:
+        self.conns: "OrderedDict[str, Tuple[sqlite3.Connection, Tuple[int, int]]]" = OrderedDict()
+
+    def close(self) -> None:
+        while self.conns:
+            conn, _ = self.conns.popitem(last=False)[1]
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+
+class _ConnectionManager:
+    """Per-process, per-path SQLite connections, kept open per thread.
+
+    Opening a connection used to cost a connect, three pragmas, the whole
+    ``_SCHEMA`` script and a meta read on every archive call. The manager
+    keeps one connection per (thread, file) open and verifies each file's
+    schema once per process. sqlite3's per-connection statement cache then
+    prepares each of this module's fixed SQL strings once per connection.
+
+    A connection is dropped and reopened when the file behind it is deleted or
+    replaced (its device/inode changes), when a statement on it raises
+    ``sqlite3.Error``, and in a forked child — inherited connections are
+    abandoned unused, since SQLite handles must not cross ``fork()``.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._holders: "weakref.WeakSet[_ThreadConnections]" = weakref.WeakSet()
+        self._verified: set = set()
+        self._pid = os.getpid()
+
+    def _check_fork(self) -> None:
+        if os.getpid() != self._pid:
+            # Don't close: the parent still owns these file handles.
+            self._local = threading.local()
+            self._holders = weakref.WeakSet()
+            self._verified = set()
+            self._pid = os.getpid()
+
+    def _holder(self) -> _ThreadConnections:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ThreadConnections()
+            self._local.holder = holder
+            with self._lock:
+                self._holders.add(holder)
+        return holder
+
+    def acquire(self, db_path: Optional[str]) -> Tuple[sqlite3.Connection, str]:
+        """Return this thread's connection to ``db_path`` and its pool key."""
+        self._check_fork()
+        path = db_path or _default_db_path()
+        key = os.path.abspath(path)
+        holder = self._holder()
+        entry = holder.conns.get(key)
+        identity = _file_identity(key)
+        if entry is not None:
+            if identity is not None and entry[1] == identity:
+                holder.conns.move_to_end(key)
+                return entry[0], key
+            self.discard(key)
+        with self._lock:
+            verify = identity is None or key not in self._verified
+        conn = _open(path, verify=verify)
+        identity = _file_identity(key)
+        if identity is None:
+            conn.close()
+            raise ArchiveError("Cannot open trends archive at '%s': file vanished" % path)
+        with self._lock:
+            self._verified.add(key)
+        holder.conns[key] = (conn, identity)
+        while len(holder.conns) > _POOL_SIZE:
+            holder.conns.popitem(last=False)[1][0].close()
+        return conn, key
+
+    def discard(self, key: str) -> None:
+        """Close and forget this thread's connection for ``key``; re-verify next open."""
+        holder = getattr(self._local, "holder", None)
+        entry = holder.conns.pop(key, None) if holder is not None else None
+        if entry is not None:
+            try:
+                entry[0].close()
+            except sqlite3.Error:
+                pass
+        with self._lock:
+            self._verified.discard(key)
+
+    def close_all(self) -> None:
+        """Close every pooled connection in every thread (exit / test teardown)."""
+        if os.getpid() != self._pid:
+            self._check_fork()
+            return
+        with self._lock:
+            holders = list(self._holders)
+            self._verified.clear()
+        for holder in holders:
+            holder.close()
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    """(st_dev, st_ino) of ``path``, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+_connections = _ConnectionManager()
+atexit.register(_connections.close_all)
+
+
+@contextmanager
+def _connection(db_path: Optional[str] = None) -> Iterator[sqlite3.Connection]:
+    """Borrow this thread's pooled connection to the archive at ``db_path``.
+
+    A ``sqlite3.Error`` escaping the block discards the connection so the next
+    call starts clean (and re-verifies the schema).
+    """
+    conn, key = _connections.acquire(db_path)
+    try:
+        yield conn
+    except sqlite3.Error:
+        _connections.discard(key)
+        raise
+
+
+def _close_connections() -> None:
+    """Close all pooled archive connections (used by tests and at exit)."""
+    _connections.close_all()
+
+
 def _ensure_schema(conn: sqlite3.Connection, path: str) -> None:
     """Create tables on first touch; refuse a DB written by a different layout."""
     conn.executescript(_SCHEMA)
+    _add_missing_columns(conn)
+    conn.executescript(_ADDED_INDEXES)
     row = conn.execute("SELECT value FROM meta WHERE key = 'db_schema_version'").fetchone()
     if row is None:
         conn.execute(
@@ -143,7 +425,7 @@ def _ensure_schema(conn: sqlite3.Connection, path: str) -> None:
             (str(DB_SCHEMA_VERSION),),
         )
         conn.commit()
-    elif row[0] != str(DB_SCHEMA_VERSION):
+    elif row[0] != str(DB_SCHEMA_VERSION) and row[0] not in _UPGRADABLE_SCHEMA_VERSIONS:
         raise ArchiveError(
             "Archive at '%s' uses db schema version %s but this trendspyg "
             "supports version %s. Upgrade trendspyg, or point db_path/TRENDSPYG_DB "
@@ -151,6 +433,27 @@ def _ensure_schema(conn: sqlite3.Connection, path: str) -> None:
         )
 
 
+def _mark_packed(conn: sqlite3.Connection) -> None:
+    """Stamp an upgradable file with ``DB_SCHEMA_VERSION`` before writing a row older
+    versions cannot read (compressed, reference or delta), in the caller's transaction."""
+    conn.execute(
+        "UPDATE meta SET value = ? WHERE key = 'db_schema_version' AND value IN (%s)"
+        % ",".join("?" * len(_UPGRADABLE_SCHEMA_VERSIONS)),
+        (str(DB_SCHEMA_VERSION),) + _UPGRADABLE_SCHEMA_VERSIONS,
+    )
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> None:
+    """Bring a file written by an older trendspyg up to the current columns."""
+    existing: Dict[str, set] = {}
+    for table, column, decl in _ADDED_COLUMNS:
+        if table not in existing:
+            existing[table] = {r[1] for r in conn.execute("PRAGMA table_info(%s)" % table)}
+        if column not in existing[table]:
+            conn.execute("ALTER TABLE %s ADD COLUMN %s %s" % (table, column, decl))
+            existing[table].add(column)
+
+
 def _encode_payload(obj: Any) -> str:
     """JSON-encode a raw payload, round-tripping datetimes exactly."""
 
@@ -173,6 +476,177 @@ def _decode_payload(text: str) -> Any:
     return json.loads(text, object_hook=_hook)
 
 
+def _pack_payload(text: str) -> Tuple[Union[str, bytes], int]:
+    """``(stored value, uncompressed byte size)`` for a JSON payload.
+
+    zstd when ``zstandard`` is installed, else zlib; kept as plain text when
+    small or when compression would not shrink it.
+    """
+    raw = text.encode("utf-8")
+    if len(raw) < _COMPRESS_MIN_BYTES:
+        return text, len(raw)
+    if _zstd is not None:
+        packed = _CODEC_ZSTD + _zstd.ZstdCompressor(level=3).compress(raw)
+    else:
+        packed = _CODEC_ZLIB + zlib.compress(raw, 6)
+    if len(packed) >= len(raw):
+        return text, len(raw)
+    return packed, len(raw)
+
+
+def _unpack_payload(value: Union[str, bytes]) -> str:
+    """Inverse of :func:`_pack_payload`: the JSON text of a stored payload."""
+    if isinstance(value, str):
+        return value
+    codec, body = value[:1], value[1:]
+    try:
+        if codec == _CODEC_ZLIB:
+            return zlib.decompress(body).decode("utf-8")
+        if codec == _CODEC_ZSTD and _zstd is not None:
+            return str(_zstd.ZstdDecompressor().decompress(body).decode("utf-8"))
+    except Exception as exc:  # zlib.error, zstandard.ZstdError, UnicodeDecodeError
+        raise ArchiveError("Corrupt compressed payload in the trends archive: %s" % exc) from exc
+    if codec == _CODEC_ZSTD:
+        raise ArchiveError(
+            "This archive holds zstd-compressed payloads written by another install; "
+            "install zstandard (pip install zstandard) to read them."
+        )
+    raise ArchiveError("Unknown payload codec %r in the trends archive" % codec)
+
+
+#: Snapshot payload storage, set by :func:`configure_archive_storage`.
+_storage: Dict[str, Any] = {"mode": "full", "keyframe_interval": 24}
+
+#: List fields diffed item by item, and the item field identifying an item.
+_DELTA_LISTS = {"trends": "keyword", "news": "url"}
+
+
+def _diff_dict(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """Patch turning ``old`` into ``new``; :func:`_apply_dict` applies it.
+
+    ``{"set": {...}, "del": [...], "lists": {field: ops}, "keys": [...]}``, each
+    part present only when needed. ``keys`` restores key order when it changed.
+    """
+    patch: Dict[str, Any] = {}
+    changed: Dict[str, Any] = {}
+    lists: Dict[str, Any] = {}
+    for key, value in new.items():
+        before = old.get(key)
+        if key in old and before == value:
+            continue
+        if key in _DELTA_LISTS and isinstance(before, list) and isinstance(value, list):
+            lists[key] = _diff_items(before, value, _DELTA_LISTS[key])
+        else:
+            changed[key] = value
+    removed = [key for key in old if key not in new]
+    if changed:
+        patch["set"] = changed
+    if removed:
+        patch["del"] = removed
+    if lists:
+        patch["lists"] = lists
+    if [k for k in old if k in new] + [k for k in new if k not in old] != list(new):
+        patch["keys"] = list(new)
+    return patch
+
+
+def _diff_items(old: List[Any], new: List[Any], key: str) -> List[Any]:
+    """Ops rebuilding the list ``new`` from ``old``, one per item of ``new``.
+
+    An op is an index into ``old`` (item unchanged), a :func:`_diff_dict`
+    patch plus ``"i"`` (that item, changed) or ``{"new": item}``.
+    """
+    positions: Dict[str, int] = {}
+    for i, item in enumerate(old):
+        if isinstance(item, dict) and isinstance(item.get(key), str):
+            positions.setdefault(item[key], i)
+    ops: List[Any] = []
+    for item in new:
+        ident = item.get(key) if isinstance(item, dict) else None
+        at = positions.get(ident) if isinstance(ident, str) else None
+        if at is None:
+            ops.append({"new": item})
+        elif old[at] == item:
+            ops.append(at)
+        else:
+            patch = _diff_dict(old[at], item)
+            patch["i"] = at
+            ops.append(patch)
+    return ops
+
+
+def _apply_dict(old: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of :func:`_diff_dict`. Builds new containers; ``old`` is untouched."""
+    removed = patch.get("del", ())
+    new = {key: value for key, value in old.items() if key not in removed}
+    for key, ops in patch.get("lists", {}).items():
+        new[key] = [
+            (
+                old[key][op]
+                if isinstance(op, int)
+                else op["new"] if "new" in op else _apply_dict(old[key][op["i"]], op)
+            )
+            for op in ops
+        ]
+    new.update(patch.get("set", {}))
+    if "keys" in patch:
+        new = {key: new[key] for key in patch["keys"]}
+    return new
+
+
+def _resolve(
+    conn: sqlite3.Connection, snapshot_id: int, memo: Dict[int, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """The envelope stored at ``snapshot_id``, applying its delta chain if any.
+
+    ``memo`` caches envelopes by id across calls; a chain is at most
+    ``keyframe_interval`` payloads long. The result may share objects with
+    other memo entries — copy it before handing it out.
+    """
+    chain: List[Tuple[int, Dict[str, Any]]] = []
+    current = snapshot_id
+    while current not in memo:
+        row = conn.execute(
+            "SELECT payload_json, delta_of FROM snapshots WHERE id = ?", (current,)
+        ).fetchone()
+        if row is None:
+            raise ArchiveError(
+                "Snapshot %d of the trends archive is missing its delta base %d"
+                % (snapshot_id, current)
+            )
+        payload = json.loads(_unpack_payload(row["payload_json"]))
+        if row["delta_of"] is None:
+            memo[current] = payload
+            break
+        chain.append((current, payload))
+        current = row["delta_of"]
+    envelope = memo[current]
+    for delta_id, delta in reversed(chain):
+        envelope = memo[delta_id] = _apply_dict(envelope, delta)
+    return envelope
+
+
+def _delta_payload(
+    conn: sqlite3.Connection,
+    parent_id: int,
+    envelope: Dict[str, Any],
+    memo: Dict[int, Dict[str, Any]],
+) -> Optional[Tuple[str, int]]:
+    """``(delta_json, depth)`` storing ``envelope`` against ``parent_id``.
+
+    None when a keyframe is due, or when the delta would not be smaller.
+    """
+    row = conn.execute("SELECT delta_depth FROM snapshots WHERE id = ?", (parent_id,)).fetchone()
+    depth = (row[0] or 0) + 1
+    if depth >= _storage["keyframe_interval"]:
+        return None
+    parent = _resolve(conn, parent_id, memo)
+    delta = _diff_dict(parent, envelope)
+    if _apply_dict(parent, delta) != envelope:  # never trade exactness for size
+        return None
+    return json.dumps(delta, separators=(",", ":")), depth
+
+
 def _keyword_rows(envelope: Dict[str, Any]) -> "List[tuple]":
     """Flattened ``(keyword, rank, volume_min)`` rows for the trends index.
 
@@ -197,65 +671,302 @@ def _store_snapshot(envelope: Dict[str, Any], db_path: Optional[str] = None) ->
     ignored and return the existing row's id, so re-archiving the same
     envelope is harmless.
     """
-    rows = _keyword_rows(envelope)
-    conn = _connect(db_path)
-    try:
+    record = _snapshot_record(envelope)
+    with _connection(db_path) as conn:
         with conn:
-            cur = conn.execute(
-                "INSERT OR IGNORE INTO snapshots"
-                " (source, geo, fetched_at, schema_version, trend_count, payload_json)"
-                " VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    envelope["source"],
-                    envelope["geo"],
-                    envelope["fetched_at"],
-                    str(envelope.get("schema_version", "")),
-                    len(rows),
-                    json.dumps(envelope),
-                ),
-            )
-            if cur.rowcount == 0:  # already archived
-                row = conn.execute(
-                    "SELECT id FROM snapshots WHERE source = ? AND geo = ? AND fetched_at = ?",
-                    (envelope["source"], envelope["geo"], envelope["fetched_at"]),
-                ).fetchone()
-                return int(row[0])
-            snapshot_id = int(cur.lastrowid)  # type: ignore[arg-type]
-            conn.executemany(
-                "INSERT INTO trends (snapshot_id, keyword, rank, volume_min)"
-                " VALUES (?, ?, ?, ?)",
-                [(snapshot_id, kw, rank, vol) for kw, rank, vol in rows],
+            return _insert_records(conn, [record])[0]
+
+
+#: A snapshot ready to insert: (source, geo, fetched_at, schema_version,
+#: payload_json, content_hash, keyword rows). Built up front so a queued write
+#: captures the envelope as it was when fetched, even if the caller mutates it.
+_SnapshotRecord = Tuple[str, str, str, str, str, str, List[tuple]]
+
+
+def _snapshot_record(envelope: Dict[str, Any]) -> _SnapshotRecord:
+    """Serialize ``envelope`` into the row values :func:`_insert_records` writes."""
+    content = {k: v for k, v in envelope.items() if k != "fetched_at"}
+    content_hash = hashlib.sha256(
+        json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return (
+        envelope["source"],
+        envelope["geo"],
+        envelope["fetched_at"],
+        str(envelope.get("schema_version", "")),
+        json.dumps(envelope),
+        content_hash,
+        _keyword_rows(envelope),
+    )
+
+
+def _insert_records(conn: sqlite3.Connection, records: Sequence[_SnapshotRecord]) -> List[int]:
+    """Insert snapshot ``records`` on ``conn`` (in the caller's transaction); ids in order.
+
+    A record whose content matches the latest snapshot of its (source, geo) is
+    written as a reference to it: no payload, no trend rows. In ``"delta"``
+    storage mode any other record after the first is written as a delta
+    against that latest snapshot, with a full keyframe every
+    ``keyframe_interval`` snapshots.
+    """
+    ids: List[int] = []
+    trend_rows: List[tuple] = []
+    memo: Dict[int, Dict[str, Any]] = {}
+    for source, geo, fetched_at, schema_version, payload_json, content_hash, rows in records:
+        latest = conn.execute(
+            "SELECT id, ref_id, content_hash FROM snapshots WHERE geo = ? AND source = ?"
+            " ORDER BY fetched_at DESC LIMIT 1",
+            (geo, source),
+        ).fetchone()
+        ref_id: Optional[int] = None
+        delta_of: Optional[int] = None
+        depth = 0
+        text = payload_json
+        if latest is not None and latest["content_hash"] == content_hash:
+            ref_id = latest["ref_id"] or latest["id"]
+            text = ""
+        elif latest is not None and _storage["mode"] == "delta":
+            parent_id = latest["ref_id"] or latest["id"]
+            delta = _delta_payload(conn, parent_id, json.loads(payload_json), memo)
+            if delta is not None and len(delta[0]) < len(payload_json):
+                text, depth = delta
+                delta_of = parent_id
+        payload, payload_size = _pack_payload(text) if text else ("", 0)
+        if isinstance(payload, bytes) or ref_id is not None or delta_of is not None:
+            _mark_packed(conn)
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO snapshots (source, geo, fetched_at, schema_version,"
+            " trend_count, payload_json, payload_size, content_hash, ref_id, delta_of,"
+            " delta_depth) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source,
+                geo,
+                fetched_at,
+                schema_version,
+                len(rows),
+                payload,
+                payload_size,
+                content_hash,
+                ref_id,
+                delta_of,
+                depth,
+            ),
+        )
+        if cur.rowcount == 0:  # already archived
+            row = conn.execute(
+                "SELECT id FROM snapshots WHERE source = ? AND geo = ? AND fetched_at = ?",
+                (source, geo, fetched_at),
+            ).fetchone()
+            ids.append(int(row[0]))
+            continue
+        snapshot_id = int(cur.lastrowid)  # type: ignore[arg-type]
+        ids.append(snapshot_id)
+        if ref_id is None:
+            trend_rows.extend((snapshot_id, kw, rank, vol) for kw, rank, vol in rows)
+    conn.executemany(
+        "INSERT INTO trends (snapshot_id, keyword, rank, volume_min) VALUES (?, ?, ?, ?)",
+        trend_rows,
+    )
+    _roll_up(conn)
+    return ids
+
+
+def store_snapshots(
+    envelopes: Iterable[Dict[str, Any]], db_path: Optional[str] = None
+) -> List[int]:
+    """Archive many envelopes in a single transaction; returns their snapshot ids.
+
+    The bulk form of ``archive=True``: one commit for the whole batch instead
+    of one per envelope, which is what makes backfills of exported envelopes
+    (and the batch download functions' archiving) fast. Accepts the
+    NormalizedEnvelope / ExploreEnvelope / ComparisonEnvelope dicts the
+    download functions return with ``normalize=True``. Envelopes already in
+    the archive (same source, geo and ``fetched_at``) are skipped and report
+    their existing id. All or nothing: on an error nothing is written.
+
+    Args:
+        envelopes: Envelope dicts, e.g. ``read_archive()`` output from another
+            archive or JSON lines loaded from an export.
+        db_path: Archive file (default: TRENDSPYG_DB env var, else the
+            platform data directory).
+
+    Returns:
+        The snapshot id of each envelope, in input order.
+
+    Raises:
+        InvalidParameterError: If an envelope is not a dict with string
+            ``source``, ``geo`` and ``fetched_at``.
+        ArchiveError: If the archive file cannot be opened.
+    """
+    batch = list(envelopes)
+    for i, envelope in enumerate(batch):
+        if not isinstance(envelope, dict) or not all(
+            isinstance(envelope.get(k), str) for k in ("source", "geo", "fetched_at")
+        ):
+            raise InvalidParameterError(
+                "envelopes[%d] must be a dict with string 'source', 'geo' and 'fetched_at'"
+                " (a normalize=True envelope), got %r" % (i, type(envelope).__name__)
             )
-            return snapshot_id
-    finally:
-        conn.close()
+    if not batch:
+        return []
+    records = [_snapshot_record(envelope) for envelope in batch]
+    _flush_writer()  # ids must reflect snapshots queued before this call
+    with _connection(db_path) as conn:
+        with conn:
+            return _insert_records(conn, records)
+
+
+def configure_archive_storage(mode: str = "full", keyframe_interval: int = 24) -> None:
+    """
+    Choose how new archive snapshots are stored.
+
+    ``"full"`` (the default) stores every snapshot's whole envelope.
+    ``"delta"`` stores a snapshot as the trends and news articles added,
+    removed or changed since the previous snapshot of the same (source, geo),
+    with a full keyframe every ``keyframe_interval`` snapshots, so reading one
+    back applies at most ``keyframe_interval - 1`` deltas. Reads are exact in
+    both modes, and archives may mix them. The setting is process-wide and
+    only affects snapshots written after the call.
+
+    Args:
+        mode: "full" or "delta"
+        keyframe_interval: Snapshots per keyframe in "delta" mode (1 = all keyframes)
+
+    Raises:
+        InvalidParameterError: On an unknown mode or a keyframe_interval that
+            is not a positive int
+    """
+    if mode not in ("full", "delta"):
+        raise InvalidParameterError("mode must be 'full' or 'delta', got %r" % (mode,))
+    if (
+        isinstance(keyframe_interval, bool)
+        or not isinstance(keyframe_interval, int)
+        or keyframe_interval < 1
+    ):
+        raise InvalidParameterError(
+            "keyframe_interval must be a positive int, got %r" % (keyframe_interval,)
+        )
+    _flush_writer()  # queued snapshots keep the mode they were fetched under
+    _storage.update(mode=mode, keyframe_interval=keyframe_interval)
 
 
 def _disk_cache_get(key: str, ttl: float, db_path: Optional[str] = None) -> Optional[Any]:
     """Return the cached payload for ``key`` if newer than ``ttl`` seconds, else None."""
-    conn = _connect(db_path)
-    try:
+    entry = _disk_cache_get_entry(key, ttl, db_path=db_path)
+    return entry[0] if entry is not None else None
+
+
+def _disk_cache_get_entry(
+    key: str, ttl: float, grace: float = 0.0, db_path: Optional[str] = None
+) -> Optional[Tuple[Any, float]]:
+    """``(payload, stored_at)`` for ``key`` if stored less than ``ttl + grace`` seconds ago.
+
+    ``stored_at`` lets callers keep their own copies expiring with the row.
+    Rows with validators are kept for ``_REVALIDATE_SECONDS``, so that is the
+    longest grace the disk cache can honor.
+    """
+    with _connection(db_path) as conn:
         row = conn.execute(
-            "SELECT payload_json FROM cache WHERE key = ? AND stored_at >= ?",
-            (key, time.time() - ttl),
+            "SELECT payload_json, stored_at FROM cache WHERE key = ? AND stored_at >= ?",
+            (key, time.time() - ttl - grace),
         ).fetchone()
-        return _decode_payload(row[0]) if row is not None else None
-    finally:
-        conn.close()
+    return (_decode_payload(_unpack_payload(row[0])), float(row[1])) if row is not None else None
 
 
-def _disk_cache_set(key: str, payload: Any, ttl: float, db_path: Optional[str] = None) -> None:
-    """Store ``payload`` under ``key`` and opportunistically drop stale entries."""
-    conn = _connect(db_path)
-    try:
+def _disk_cache_set(
+    key: str,
+    payload: Any,
+    ttl: float,
+    db_path: Optional[str] = None,
+    validators: Optional[Dict[str, Optional[str]]] = None,
+) -> None:
+    """Store ``payload`` under ``key`` and opportunistically drop stale entries.
+
+    ``validators`` (``etag`` / ``last_modified`` / ``content_hash``) ride along
+    so the row can be revalidated after it expires; such rows outlive the TTL
+    by up to ``_REVALIDATE_SECONDS``.
+    """
+    payload_json = _encode_payload(payload)
+    with _connection(db_path) as conn:
         with conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO cache (key, stored_at, payload_json) VALUES (?, ?, ?)",
-                (key, time.time(), _encode_payload(payload)),
-            )
-            conn.execute("DELETE FROM cache WHERE stored_at < ?", (time.time() - ttl,))
-    finally:
-        conn.close()
+            _write_cache_row(conn, key, time.time(), payload_json, ttl, validators)
+
+
+def _write_cache_row(
+    conn: sqlite3.Connection,
+    key: str,
+    stored_at: float,
+    payload_json: str,
+    ttl: float,
+    validators: Optional[Dict[str, Optional[str]]],
+) -> None:
+    """The statements behind :func:`_disk_cache_set`, in the caller's transaction."""
+    validators = validators or {}
+    payload, payload_size = _pack_payload(payload_json)
+    if isinstance(payload, bytes):
+        _mark_packed(conn)
+    conn.execute(
+        "INSERT OR REPLACE INTO cache"
+        " (key, stored_at, payload_json, payload_size, etag, last_modified, content_hash)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            key,
+            stored_at,
+            payload,
+            payload_size,
+            validators.get("etag"),
+            validators.get("last_modified"),
+            validators.get("content_hash"),
+        ),
+    )
+    conn.execute(
+        "DELETE FROM cache WHERE stored_at < ? AND (content_hash IS NULL OR stored_at < ?)",
+        (stored_at - ttl, stored_at - max(ttl, _REVALIDATE_SECONDS)),
+    )
+
+
+def _disk_cache_get_validators(key: str, db_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """The last stored response for ``key`` regardless of age, for revalidation.
+
+    Returns ``{"etag", "last_modified", "content_hash", "trends"}`` or None when
+    nothing (or nothing with validators) is stored; ``"trends"`` is decoded
+    lazily, when first indexed.
+    """
+    with _connection(db_path) as conn:
+        row = conn.execute(
+            "SELECT payload_json, etag, last_modified, content_hash FROM cache"
+            " WHERE key = ? AND content_hash IS NOT NULL",
+            (key,),
+        ).fetchone()
+    if row is None:
+        return None
+    return _RevalidationEntry(
+        row["payload_json"],
+        etag=row["etag"],
+        last_modified=row["last_modified"],
+        content_hash=row["content_hash"],
+    )
+
+
+class _RevalidationEntry(dict):
+    """A revalidation entry whose ``"trends"`` is decompressed on first access.
+
+    Most revalidations end in a 200 with new content, which never looks at the
+    stored trends; only a 304 or an unchanged body pays for decoding them.
+    """
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: Union[str, bytes], **validators: Any) -> None:
+        super().__init__(**validators)
+        self._payload = payload
+
+    def __missing__(self, key: str) -> Any:
+        if key != "trends":
+            raise KeyError(key)
+        trends = _decode_payload(_unpack_payload(self._payload))
+        self["trends"] = trends
+        return trends
 
 
 def _explore_cache_get(key: str, ttl: float, db_path: Optional[str] = None) -> Optional[Any]:
@@ -265,38 +976,297 @@ def _explore_cache_get(key: str, ttl: float, db_path: Optional[str] = None) -> O
     the original fetch time rides along so a hit can rebuild an envelope that
     is honest about when the data actually left Google.
     """
-    conn = _connect(db_path)
-    try:
+    with _connection(db_path) as conn:
         row = conn.execute(
             "SELECT payload_json FROM explore_cache WHERE key = ? AND stored_at >= ?",
             (key, time.time() - ttl),
         ).fetchone()
-        return json.loads(row[0]) if row is not None else None
-    finally:
-        conn.close()
+        return json.loads(_unpack_payload(row[0])) if row is not None else None
 
 
 def _explore_cache_set(key: str, payload: Any, db_path: Optional[str] = None) -> None:
     """Store an Explore cache entry and garbage-collect abandoned keys."""
-    conn = _connect(db_path)
-    try:
+    payload_json = json.dumps(payload)
+    with _connection(db_path) as conn:
         with conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO explore_cache (key, stored_at, payload_json)"
-                " VALUES (?, ?, ?)",
-                (key, time.time(), json.dumps(payload)),
-            )
-            conn.execute(
-                "DELETE FROM explore_cache WHERE stored_at < ?",
-                (time.time() - _EXPLORE_CACHE_GC_SECONDS,),
-            )
-    finally:
-        conn.close()
+            _write_explore_row(conn, key, time.time(), payload_json)
+
+
+def _write_explore_row(
+    conn: sqlite3.Connection, key: str, stored_at: float, payload_json: str
+) -> None:
+    """The statements behind :func:`_explore_cache_set`, in the caller's transaction."""
+    payload, payload_size = _pack_payload(payload_json)
+    if isinstance(payload, bytes):
+        _mark_packed(conn)
+    conn.execute(
+        "INSERT OR REPLACE INTO explore_cache (key, stored_at, payload_json, payload_size)"
+        " VALUES (?, ?, ?, ?)",
+        (key, stored_at, payload, payload_size),
+    )
+    conn.execute(
+        "DELETE FROM explore_cache WHERE stored_at < ?",
+        (stored_at - _EXPLORE_CACHE_GC_SECONDS,),
+    )
+
+
+class _ArchiveWriter:
+    """Write-behind for archive and disk-cache writes: one thread, group commits.
+
+    The download hooks enqueue fully serialized rows and return; a single
+    daemon thread drains the bounded queue, grouping up to ``max_batch`` items
+    per file into one transaction. A full queue blocks the enqueuing fetch
+    until the writer catches up (back-pressure, never dropped writes). Write
+    failures warn from the writer thread, as the synchronous hooks do.
+    """
+
+    def __init__(self, max_queue: int, max_batch: int) -> None:
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        self._queue: "queue.Queue[Any]" = queue.Queue(max_queue)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.commits = 0
+        self.blocked = 0
+        self.commit_seconds = 0.0
+        self.max_commit_seconds = 0.0
+        self.last_commit_seconds = 0.0
+
+    def submit(self, db_path: Optional[str], item: tuple) -> None:
+        """Queue ``item`` for ``db_path``; blocks while the queue is full."""
+        self._ensure_thread()
+        entry = (db_path or _default_db_path(), item)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self.blocked += 1
+            self._queue.put(entry)
+        with self._lock:
+            self.enqueued += 1
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if os.getpid() != self._pid:
+                # Forked child: the parent's thread is gone and owns its queue
+                self._queue = queue.Queue(self.max_queue)
+                self._thread = None
+                self._pid = os.getpid()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="trendspyg-archive-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            batch = [entry]
+            while entry is not None and len(batch) < self.max_batch:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(entry)
+            items = [e for e in batch if e is not None]
+            try:
+                if items:
+                    self._commit(items)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(items) < len(batch):
+                return  # close() sentinel
+
+    def _commit(self, items: List[Tuple[str, tuple]]) -> None:
+        by_path: "OrderedDict[str, List[tuple]]" = OrderedDict()
+        for path, item in items:
+            by_path.setdefault(path, []).append(item)
+        for path, group in by_path.items():
+            started = time.perf_counter()
+            try:
+                with _connection(path) as conn:
+                    with conn:
+                        for item in group:
+                            _apply_queued(conn, item)
+            except Exception as exc:  # deliberate blanket catch: this module's failure policy
+                with self._lock:
+                    self.failed += len(group)
+                warnings.warn(
+                    "trendspyg archive write failed (%s); %d queued write(s) lost, the "
+                    "downloads themselves are unaffected" % (exc, len(group)),
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                continue
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.written += len(group)
+                self.commits += 1
+                self.commit_seconds += elapsed
+                self.last_commit_seconds = elapsed
+                self.max_commit_seconds = max(self.max_commit_seconds, elapsed)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is committed; False on timeout."""
+        if self._thread is None or os.getpid() != self._pid:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush, then stop the writer thread."""
+        drained = self.flush(timeout)
+        thread = self._thread
+        if drained and thread is not None and thread.is_alive() and os.getpid() == self._pid:
+            self._queue.put(None)
+            thread.join(timeout)
+        return drained
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": True,
+                "queue_depth": self._queue.qsize(),
+                "max_queue": self.max_queue,
+                "max_batch": self.max_batch,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "failed": self.failed,
+                "blocked": self.blocked,
+                "commits": self.commits,
+                "last_commit_ms": self.last_commit_seconds * 1000.0,
+                "avg_commit_ms": (
+                    self.commit_seconds / self.commits * 1000.0 if self.commits else 0.0
+                ),
+                "max_commit_ms": self.max_commit_seconds * 1000.0,
+            }
+
+
+def _apply_queued(conn: sqlite3.Connection, item: tuple) -> None:
+    """Run one queued write on the writer's connection."""
+    kind = item[0]
+    if kind == "snapshot":
+        _insert_records(conn, [item[1]])
+    elif kind == "cache":
+        _write_cache_row(conn, *item[1:])
+    else:
+        _write_explore_row(conn, *item[1:])
+
+
+#: The write-behind writer, or None for synchronous writes (the default).
+_writer: Optional[_ArchiveWriter] = None
+
+
+def _flush_writer() -> None:
+    """Make queued writes visible before an archive read (no-op when disabled)."""
+    writer = _writer
+    if writer is not None:
+        writer.flush()
+
+
+def _close_writer() -> None:
+    writer = _writer
+    if writer is not None:
+        writer.close()
+
+
+# Registered after the connection pool's hook, so it runs first at exit
+atexit.register(_close_writer)
+
+
+def configure_archive_writer(
+    enabled: bool = True, max_queue: int = 1000, max_batch: int = 200
+) -> None:
+    """
+    Turn the background (write-behind) archive writer on or off.
+
+    When enabled, ``archive=True`` snapshots and ``cache="disk"`` writes are
+    queued and committed by one background thread, several per transaction,
+    so fetches (including async ones on the event loop) no longer wait on
+    SQLite. Pending writes are flushed at interpreter exit, when the writer is
+    reconfigured, and before the archive read functions run; use
+    :func:`flush_archive_writer` to wait for them explicitly. Write failures
+    still only warn.
+
+    Args:
+        enabled: False flushes the queue and returns to synchronous writes
+        max_queue: Queued writes before a fetch blocks until the writer catches up
+        max_batch: Most writes grouped into one commit
+
+    Raises:
+        InvalidParameterError: If max_queue or max_batch is not a positive int
+    """
+    global _writer
+    for name, value in (("max_queue", max_queue), ("max_batch", max_batch)):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise InvalidParameterError("%s must be a positive int, got %r" % (name, value))
+    previous = _writer
+    _writer = _ArchiveWriter(max_queue, max_batch) if enabled else None
+    if previous is not None:
+        previous.close()
+
+
+def flush_archive_writer(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until every queued archive/cache write is committed.
+
+    Args:
+        timeout: Seconds to wait at most (default: no limit)
+
+    Returns:
+        True once the queue is drained (always True with the writer off),
+        False if the timeout passed first
+    """
+    writer = _writer
+    return True if writer is None else writer.flush(timeout)
+
+
+def get_archive_writer_stats() -> Dict[str, Any]:
+    """
+    Get the state of the background archive writer.
+
+    Returns:
+        Dict with 'enabled', 'queue_depth', 'max_queue', 'max_batch', the
+        'enqueued' / 'written' / 'failed' write counters, 'blocked' (writes
+        that waited on a full queue), 'commits', and 'last_commit_ms' /
+        'avg_commit_ms' / 'max_commit_ms' commit latencies
+    """
+    writer = _writer
+    if writer is None:
+        return {
+            "enabled": False,
+            "queue_depth": 0,
+            "max_queue": 0,
+            "max_batch": 0,
+            "enqueued": 0,
+            "written": 0,
+            "failed": 0,
+            "blocked": 0,
+            "commits": 0,
+            "last_commit_ms": 0.0,
+            "avg_commit_ms": 0.0,
+            "max_commit_ms": 0.0,
+        }
+    return writer.stats()
 
 
 def _explore_cache_get_safely(key: str, ttl: float, db_path: Optional[str] = None) -> Optional[Any]:
     """Explore cache read hook — an unreadable cache is a miss, never an error."""
     try:
+        # Explore has no in-memory layer: a queued write must land before a
+        # hit is missed (a miss costs a browser run, the flush milliseconds)
+        _flush_writer()
         return _explore_cache_get(key, ttl, db_path=db_path)
     except Exception as exc:  # deliberate blanket catch: this module's failure policy
         warnings.warn(
@@ -310,6 +1280,10 @@ def _explore_cache_get_safely(key: str, ttl: float, db_path: Optional[str] = Non
 def _explore_cache_set_safely(key: str, payload: Any, db_path: Optional[str] = None) -> None:
     """Explore cache write hook — a write failure never breaks a fetch."""
     try:
+        writer = _writer
+        if writer is not None:
+            writer.submit(db_path, ("explore", key, time.time(), json.dumps(payload)))
+            return
         _explore_cache_set(key, payload, db_path=db_path)
     except Exception as exc:  # deliberate blanket catch: this module's failure policy
         warnings.warn(
@@ -322,6 +1296,10 @@ def _explore_cache_set_safely(key: str, payload: Any, db_path: Optional[str] = N
 def _store_snapshot_safely(envelope: Dict[str, Any], db_path: Optional[str] = None) -> None:
     """Archive hook for the download paths — a write failure never breaks a fetch."""
     try:
+        writer = _writer
+        if writer is not None:
+            writer.submit(db_path, ("snapshot", _snapshot_record(envelope)))
+            return
         _store_snapshot(envelope, db_path=db_path)
     except Exception as exc:  # deliberate blanket catch: this module's failure policy
         warnings.warn(
@@ -331,10 +1309,46 @@ def _store_snapshot_safely(envelope: Dict[str, Any], db_path: Optional[str] = No
         )
 
 
-def _disk_cache_get_safely(key: str, ttl: float, db_path: Optional[str] = None) -> Optional[Any]:
-    """Disk-cache read hook — an unreadable cache is a miss, never an error."""
+def _store_snapshots_safely(
+    envelopes: Sequence[Dict[str, Any]], db_path: Optional[str] = None
+) -> None:
+    """Batch archive hook: one transaction for a whole sweep, warning on failure."""
     try:
-        return _disk_cache_get(key, ttl, db_path=db_path)
+        writer = _writer
+        if writer is not None:
+            for envelope in envelopes:
+                writer.submit(db_path, ("snapshot", _snapshot_record(envelope)))
+            return
+        store_snapshots(envelopes, db_path=db_path)
+    except Exception as exc:  # deliberate blanket catch: this module's failure policy
+        warnings.warn(
+            "trendspyg archive write failed (%s); the downloads themselves are unaffected" % exc,
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+def _disk_cache_get_entry_safely(
+    key: str, ttl: float, grace: float = 0.0, db_path: Optional[str] = None
+) -> Optional[Tuple[Any, float]]:
+    """Disk-cache entry read hook — an unreadable cache is a miss, never an error."""
+    try:
+        return _disk_cache_get_entry(key, ttl, grace, db_path=db_path)
+    except Exception as exc:  # deliberate blanket catch: this module's failure policy
+        warnings.warn(
+            "trendspyg disk cache read failed (%s); fetching fresh instead" % exc,
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return None
+
+
+def _disk_cache_get_validators_safely(
+    key: str, db_path: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """Revalidation read hook — an unreadable cache just means an unconditional GET."""
+    try:
+        return _disk_cache_get_validators(key, db_path=db_path)
     except Exception as exc:  # deliberate blanket catch: this module's failure policy
         warnings.warn(
             "trendspyg disk cache read failed (%s); fetching fresh instead" % exc,
@@ -345,11 +1359,20 @@ def _disk_cache_get_safely(key: str, ttl: float, db_path: Optional[str] = None)
 
 
 def _disk_cache_set_safely(
-    key: str, payload: Any, ttl: float, db_path: Optional[str] = None
+    key: str,
+    payload: Any,
+    ttl: float,
+    db_path: Optional[str] = None,
+    validators: Optional[Dict[str, Optional[str]]] = None,
 ) -> None:
     """Disk-cache write hook — a write failure never breaks a fetch."""
     try:
-        _disk_cache_set(key, payload, ttl, db_path=db_path)
+        writer = _writer
+        if writer is not None:
+            item = ("cache", key, time.time(), _encode_payload(payload), ttl, validators)
+            writer.submit(db_path, item)
+            return
+        _disk_cache_set(key, payload, ttl, db_path=db_path, validators=validators)
     except Exception as exc:  # deliberate blanket catch: this module's failure policy
         warnings.warn(
             "trendspyg disk cache write failed (%s); the download itself is unaffected" % exc,
@@ -403,6 +1426,12 @@ def _snapshot_filters(
     return where, params
 
 
+def _chunks(ids: Sequence[int], size: int = _PRUNE_BATCH) -> Iterator[Sequence[int]]:
+    """``ids`` in slices small enough for one ``IN (...)`` parameter list."""
+    for i in range(0, len(ids), size):
+        yield ids[i : i + size]
+
+
 def read_archive(
     geo: Optional[str] = None,
     source: Optional[Union[str, Sequence[str]]] = None,
@@ -412,9 +1441,15 @@ def read_archive(
     limit: Optional[int] = None,
     output_format: str = "dict",
     db_path: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> Any:
     """Read archived snapshots (newest first), optionally filtered.
 
+    ``fields=`` (or ``output_format="compact"``) answers from the indexed
+    ``trends`` and ``snapshots`` tables alone, without loading any stored
+    payload: each snapshot comes back as ``{"fetched_at", "geo", "source",
+    "trend_count", "trends": [{field: value, ...}, ...]}``.
+
     Args:
         geo: Only snapshots for this region code (exact match).
         source: Only this data path: ``"rss"``, ``"csv"``, ``"explore"``,
@@ -425,44 +1460,40 @@ def read_archive(
         keyword: Only snapshots that contain this keyword (case-insensitive).
         limit: At most this many snapshots (the newest ones).
         output_format: ``"dict"`` (list of envelopes), ``"json"`` (JSON string),
-            or ``"dataframe"`` (one row per trend, needs the ``[analysis]`` extra).
+            ``"dataframe"`` (one row per trend, needs the ``[analysis]`` extra),
+            or ``"compact"`` (1.7.0: compact snapshots with every field).
         db_path: Archive file to read (default: TRENDSPYG_DB or the platform data dir).
+        fields: Per-trend fields of a compact read (1.7.0), any of
+            ``"keyword"``, ``"rank"``, ``"volume_min"``. Combines with the
+            ``"dict"``, ``"json"`` and ``"dataframe"`` formats.
 
     Returns:
-        The archived envelopes, newest first, in the requested format. An
-        archive that does not exist yet reads as empty.
+        The archived envelopes (or compact snapshots), newest first, in the
+        requested format. An archive that does not exist yet reads as empty.
 
     Raises:
-        InvalidParameterError: On an unknown ``output_format`` or bad ``start``/``end``.
+        InvalidParameterError: On an unknown ``output_format`` or field, or
+            bad ``start``/``end``.
         ArchiveError: If the archive file cannot be read.
         ImportError: If pandas is missing for ``"dataframe"``.
     """
-    if output_format not in ("dict", "json", "dataframe"):
+    if output_format not in ("dict", "json", "dataframe", "compact"):
         raise InvalidParameterError(
-            "Invalid output_format: '%s'. Valid options: dict, json, dataframe" % output_format
-        )
-
-    where, params = _snapshot_filters(geo, source, start, end)
-    if keyword is not None:
-        where.append(
-            "EXISTS (SELECT 1 FROM trends t WHERE t.snapshot_id = s.id"
-            " AND t.keyword = ? COLLATE NOCASE)"
+            "Invalid output_format: '%s'. Valid options: dict, json, dataframe, compact"
+            % output_format
         )
-        params.append(keyword)
-
-    sql = "SELECT s.payload_json FROM snapshots s"
+    fields = _check_fields(_COMPACT_FIELDS if output_format == "compact" else fields)
+    sql, where, params = _archive_select(geo, source, start, end, keyword, fields)
     if where:
         sql += " WHERE " + " AND ".join(where)
-    sql += " ORDER BY s.fetched_at DESC"
+    sql += " ORDER BY s.fetched_at DESC, s.id DESC"  # iter_archive's order
     if limit is not None:
         sql += " LIMIT ?"
         params.append(int(limit))
 
-    conn = _connect(db_path)
-    try:
-        envelopes = [json.loads(row[0]) for row in conn.execute(sql, params).fetchall()]
-    finally:
-        conn.close()
+    _flush_writer()  # queued snapshots are part of the archive
+    with _connection(db_path) as conn:
+        envelopes = _snapshot_rows(conn, conn.execute(sql, params).fetchall(), fields)
 
     if output_format == "json":
         return json.dumps(envelopes, indent=2)
@@ -474,24 +1505,346 @@ def read_archive(
                 "pandas is required for 'dataframe' format.\n"
                 "Install with: pip install trendspyg[analysis]"
             )
-        rows = []
+        trend_fields = fields or ("keyword", "rank", "volume_min", "volume_text")
+        frame_rows = []
         for env in envelopes:
             for trend in env.get("trends", []):
-                rows.append(
-                    {
-                        "fetched_at": env.get("fetched_at"),
-                        "geo": env.get("geo"),
-                        "source": env.get("source"),
-                        "keyword": trend.get("keyword"),
-                        "rank": trend.get("rank"),
-                        "volume_min": trend.get("volume_min"),
-                        "volume_text": trend.get("volume_text"),
-                    }
-                )
-        return pd.DataFrame(rows)
+                frame_row = {
+                    "fetched_at": env.get("fetched_at"),
+                    "geo": env.get("geo"),
+                    "source": env.get("source"),
+                }
+                frame_row.update((name, trend.get(name)) for name in trend_fields)
+                frame_rows.append(frame_row)
+        return pd.DataFrame(frame_rows)
     return envelopes
 
 
+#: Rows after a ``(fetched_at, id)`` keyset position in newest-first order,
+#: written so the fetched_at indexes serve it as a range scan.
+_KEYSET_AFTER = "s.fetched_at <= ? AND (s.fetched_at < ? OR s.id < ?)"
+
+
+def iter_archive(
+    geo: Optional[str] = None,
+    source: Optional[Union[str, Sequence[str]]] = None,
+    start: Optional[Union[str, datetime]] = None,
+    end: Optional[Union[str, datetime]] = None,
+    keyword: Optional[str] = None,
+    limit: Optional[int] = None,
+    db_path: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    after: Optional[Sequence[Any]] = None,
+    with_cursor: bool = False,
+    page_size: int = _PRUNE_BATCH,
+) -> Iterator[Any]:
+    """Stream archived snapshots (newest first) without holding them all in memory.
+
+    Same filters and ``fields=`` as :func:`read_archive`, but envelopes are
+    yielded one by one from pages of ``page_size`` rows, so memory stays flat
+    however large the archive is. Pages are fetched by keyset on
+    ``(fetched_at, snapshot id)``, each in its own short read, so a slow
+    consumer never holds the database open. Snapshots archived during the
+    iteration are newer than the position reached and are not yielded.
+
+    Args:
+        geo: Only snapshots for this region code.
+        source: Only this data path, or a sequence of them.
+        start: Only snapshots fetched at or after this time.
+        end: Only snapshots fetched at or before this time.
+        keyword: Only snapshots that contain this keyword (case-insensitive).
+        limit: Stop after this many snapshots.
+        db_path: Archive file to read.
+        fields: Yield compact snapshots with these per-trend fields (see
+            :func:`read_archive`).
+        after: Resume strictly after this cursor: a ``(fetched_at, id)`` pair
+            from an earlier ``with_cursor=True`` iteration (a JSON list works).
+        with_cursor: Yield ``(cursor, envelope)`` pairs instead of envelopes.
+        page_size: Snapshots fetched per read.
+
+    Yields:
+        Envelopes (or compact snapshots), or ``((fetched_at, id), envelope)``
+        pairs with ``with_cursor=True``.
+
+    Raises:
+        InvalidParameterError: On a bad cursor, field, ``page_size``, or
+            ``start``/``end`` — at call time, before the first snapshot is
+            requested.
+        ArchiveError: If the archive file cannot be read (while iterating).
+    """
+    checked_fields = _check_fields(fields)
+    if isinstance(page_size, bool) or not isinstance(page_size, int) or page_size < 1:
+        raise InvalidParameterError("page_size must be a positive int, got %r" % (page_size,))
+    position = None if after is None else _check_cursor(after)
+    select, where, params = _archive_select(geo, source, start, end, keyword, checked_fields)
+    remaining = None if limit is None else int(limit)
+
+    def pages(position: Optional[Tuple[str, int]], remaining: Optional[int]) -> Iterator[Any]:
+        _flush_writer()  # queued snapshots are part of the archive
+        while remaining is None or remaining > 0:
+            page_where, page_params = list(where), list(params)
+            if position is not None:
+                page_where.append(_KEYSET_AFTER)
+                page_params.extend([position[0], position[0], position[1]])
+            count = page_size if remaining is None else min(page_size, remaining)
+            sql = select
+            if page_where:
+                sql += " WHERE " + " AND ".join(page_where)
+            sql += " ORDER BY s.fetched_at DESC, s.id DESC LIMIT ?"
+            with _connection(db_path) as conn:
+                rows = conn.execute(sql, page_params + [count]).fetchall()
+                envelopes = _snapshot_rows(conn, rows, checked_fields)
+            for row, envelope in zip(rows, envelopes):
+                yield ((row["fetched_at"], row["id"]), envelope) if with_cursor else envelope
+            if len(rows) < count:
+                return
+            position = (rows[-1]["fetched_at"], rows[-1]["id"])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    # A plain function returning the generator, so bad arguments raise here
+    return pages(position, remaining)
+
+
+def _check_cursor(after: Any) -> Tuple[str, int]:
+    """Validate an :func:`iter_archive` resume cursor."""
+    if (
+        isinstance(after, (str, bytes))
+        or not isinstance(after, Sequence)
+        or len(after) != 2
+        or not isinstance(after[0], str)
+        or isinstance(after[1], bool)
+        or not isinstance(after[1], int)
+    ):
+        raise InvalidParameterError(
+            "after must be a (fetched_at, id) cursor from iter_archive, got %r" % (after,)
+        )
+    return after[0], after[1]
+
+
+#: Per-trend fields a compact read can answer from the ``trends`` table.
+_COMPACT_FIELDS = ("keyword", "rank", "volume_min")
+
+
+def _check_fields(fields: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Validate ``fields=`` of a compact read; None means full envelopes."""
+    if fields is None:
+        return None
+    checked = (fields,) if isinstance(fields, str) else tuple(fields)
+    if not checked or any(f not in _COMPACT_FIELDS for f in checked):
+        raise InvalidParameterError(
+            "fields must be a non-empty selection of %s, got %r"
+            % (", ".join(_COMPACT_FIELDS), fields)
+        )
+    return checked
+
+
+def _archive_select(
+    geo: Optional[str],
+    source: Optional[Union[str, Sequence[str]]],
+    start: Optional[Union[str, datetime]],
+    end: Optional[Union[str, datetime]],
+    keyword: Optional[str],
+    fields: Optional[Sequence[str]],
+) -> Tuple[str, List[str], List[Any]]:
+    """``(SELECT ... FROM snapshots s, where clauses, params)`` of a snapshot read."""
+    where, params = _snapshot_filters(geo, source, start, end)
+    if keyword is not None:
+        # A deduplicated snapshot has no trend rows of its own: match via its base.
+        matched = "(SELECT t.snapshot_id FROM trends t WHERE t.keyword = ? COLLATE NOCASE)"
+        where.append("(s.id IN %s OR s.ref_id IN %s)" % (matched, matched))
+        params.extend([keyword, keyword])
+    columns = "s.geo, s.source, s.trend_count" if fields else "s.payload_json, s.delta_of"
+    return "SELECT s.id, s.fetched_at, s.ref_id, %s FROM snapshots s" % columns, where, params
+
+
+def _snapshot_rows(
+    conn: sqlite3.Connection, rows: Sequence[sqlite3.Row], fields: Optional[Sequence[str]]
+) -> List[Dict[str, Any]]:
+    """Envelopes (or compact snapshots with ``fields``) for rows of :func:`_archive_select`."""
+    if fields:
+        return _compact_snapshots(conn, rows, fields)
+    envelopes = []
+    memo: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        if row["ref_id"] is None and row["delta_of"] is None:
+            envelope = memo[row["id"]] = json.loads(_unpack_payload(row["payload_json"]))
+        else:  # rebuilt from shared memo entries: hand out a private copy
+            envelope = copy.deepcopy(_resolve(conn, row["ref_id"] or row["id"], memo))
+        envelope["fetched_at"] = row["fetched_at"]
+        envelopes.append(envelope)
+    return envelopes
+
+
+def _compact_snapshots(
+    conn: sqlite3.Connection, rows: Sequence[sqlite3.Row], fields: Sequence[str]
+) -> List[Dict[str, Any]]:
+    """Compact snapshots for ``rows``, their trends read from the ``trends`` table."""
+    trends: Dict[int, List[Dict[str, Any]]] = {}
+    owners = sorted({row["ref_id"] or row["id"] for row in rows})
+    for chunk in _chunks(owners):
+        for trend in conn.execute(
+            "SELECT snapshot_id, %s FROM trends WHERE snapshot_id IN (%s)"
+            " ORDER BY snapshot_id, rowid" % (", ".join(fields), ",".join("?" * len(chunk))),
+            list(chunk),
+        ):
+            trends.setdefault(trend[0], []).append(
+                {name: trend[i] for i, name in enumerate(fields, 1)}
+            )
+    return [
+        {
+            "fetched_at": row["fetched_at"],
+            "geo": row["geo"],
+            "source": row["source"],
+            "trend_count": row["trend_count"],
+            "trends": (
+                [dict(t) for t in trends.get(row["ref_id"], [])]  # shared with its base
+                if row["ref_id"]
+                else trends.get(row["id"], [])
+            ),
+        }
+        for row in rows
+    ]
+
+
+def read_archive_frame(
+    geo: Optional[str] = None,
+    source: Optional[Union[str, Sequence[str]]] = None,
+    start: Optional[Union[str, datetime]] = None,
+    end: Optional[Union[str, datetime]] = None,
+    keyword: Optional[str] = None,
+    output_format: str = "dataframe",
+    chunk_size: Optional[int] = None,
+    db_path: Optional[str] = None,
+) -> Any:
+    """Archived trends as one typed table, one row per trend (newest snapshot first).
+
+    Selected straight from ``trends`` JOIN ``snapshots`` into column arrays —
+    no payload is decoded — so months of history load in a fraction of the
+    time ``read_archive(output_format="dataframe")`` takes. Columns and
+    dtypes: ``fetched_at`` (datetime64, UTC), ``geo`` and ``source``
+    (categorical), ``keyword`` (string), ``rank`` and ``volume_min``
+    (nullable Int64). ``volume_text`` lives only in the payload and is not
+    included.
+
+    Args:
+        geo: Only snapshots for this region code.
+        source: Only this data path, or a sequence of them.
+        start: Only snapshots fetched at or after this time.
+        end: Only snapshots fetched at or before this time.
+        keyword: Only snapshots that contain this keyword (case-insensitive).
+        output_format: ``"dataframe"`` (pandas) or ``"arrow"`` (``pyarrow.Table``).
+        chunk_size: Return an iterator of tables covering ``chunk_size``
+            snapshots each, instead of one table.
+        db_path: Archive file to read.
+
+    Returns:
+        A DataFrame or ``pyarrow.Table``, or an iterator of them with
+        ``chunk_size``.
+
+    Raises:
+        InvalidParameterError: On an unknown ``output_format``, a bad
+            ``chunk_size`` or bad ``start``/``end``.
+        ArchiveError: If the archive file cannot be read.
+        ImportError: If pandas (or pyarrow for ``"arrow"``) is missing.
+    """
+    if output_format not in ("dataframe", "arrow"):
+        raise InvalidParameterError(
+            "Invalid output_format: '%s'. Valid options: dataframe, arrow" % output_format
+        )
+    if chunk_size is not None and (
+        isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size < 1
+    ):
+        raise InvalidParameterError(
+            "chunk_size must be a positive int or None, got %r" % (chunk_size,)
+        )
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError(
+            "pandas is required for archive frames.\n"
+            "Install with: pip install trendspyg[analysis]"
+        )
+    if output_format == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for 'arrow' format.\n"
+                "Install with: pip install trendspyg[analysis]"
+            )
+
+    def build(rows: List[tuple]) -> Any:
+        columns = list(zip(*rows)) if rows else [()] * 6
+        frame = pd.DataFrame(
+            {
+                "fetched_at": pd.to_datetime(
+                    pd.Series(columns[0], dtype=object), utc=True, format="ISO8601"
+                ),
+                "geo": pd.Categorical(columns[1]),
+                "source": pd.Categorical(columns[2]),
+                "keyword": pd.array(columns[3], dtype="string"),
+                "rank": pd.array(columns[4], dtype="Int64"),
+                "volume_min": pd.array(columns[5], dtype="Int64"),
+            }
+        )
+        return (
+            frame
+            if output_format == "dataframe"
+            else pa.Table.from_pandas(frame, preserve_index=False)
+        )
+
+    _, where, params = _archive_select(geo, source, start, end, keyword, None)
+    _flush_writer()  # queued snapshots are part of the archive
+    if chunk_size is None:
+        with _connection(db_path) as conn:
+            return build(_frame_rows(conn, where, params))
+    return (build(rows) for rows in _frame_chunks(db_path, where, params, chunk_size))
+
+
+def _frame_rows(conn: sqlite3.Connection, where: List[str], params: List[Any]) -> List[tuple]:
+    """Joined ``(fetched_at, geo, source, keyword, rank, volume_min)`` rows, as tuples."""
+    sql = (
+        "SELECT s.fetched_at, s.geo, s.source, t.keyword, t.rank, t.volume_min"
+        " FROM snapshots s JOIN trends t ON t.snapshot_id = COALESCE(s.ref_id, s.id)"
+    )
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY s.fetched_at DESC, s.id DESC, t.rowid"
+    cur = conn.cursor()
+    cur.row_factory = None  # plain tuples: no per-row Row objects
+    return cur.execute(sql, params).fetchall()
+
+
+def _frame_chunks(
+    db_path: Optional[str], where: List[str], params: List[Any], chunk_size: int
+) -> Iterator[List[tuple]]:
+    """:func:`_frame_rows` for ``chunk_size`` snapshots at a time, by keyset."""
+    bound: List[str] = []
+    bound_params: List[Any] = []
+    while True:
+        page_where = where + bound
+        sql = "SELECT s.fetched_at, s.id FROM snapshots s"
+        if page_where:
+            sql += " WHERE " + " AND ".join(page_where)
+        sql += " ORDER BY s.fetched_at DESC, s.id DESC LIMIT ?"
+        with _connection(db_path) as conn:
+            keys = conn.execute(sql, params + bound_params + [chunk_size]).fetchall()
+            if not keys:
+                return
+            last_at, last_id = keys[-1]
+            rows = _frame_rows(
+                conn,
+                page_where + ["s.fetched_at >= ? AND (s.fetched_at > ? OR s.id >= ?)"],
+                params + bound_params + [last_at, last_at, last_id],
+            )
+        yield rows
+        if len(keys) < chunk_size:
+            return
+        bound = [_KEYSET_AFTER]
+        bound_params = [last_at, last_at, last_id]
+
+
 def get_keyword_history(
     keyword: str,
     geo: Optional[str] = None,
@@ -535,11 +1888,12 @@ def get_keyword_history(
 
     sql = (
         "SELECT s.fetched_at, s.geo, s.source, t.rank, t.volume_min"
-        " FROM trends t JOIN snapshots s ON s.id = t.snapshot_id"
+        " FROM trends t JOIN snapshots s"
+        " ON s.id = t.snapshot_id OR s.ref_id = t.snapshot_id"
         " WHERE " + " AND ".join(where) + " ORDER BY s.fetched_at ASC"
     )
-    conn = _connect(db_path)
-    try:
+    _flush_writer()  # queued snapshots are part of the archive
+    with _connection(db_path) as conn:
         return [
             {
                 "fetched_at": row["fetched_at"],
@@ -550,8 +1904,6 @@ def get_keyword_history(
             }
             for row in conn.execute(sql, params).fetchall()
         ]
-    finally:
-        conn.close()
 
 
 def get_archive_stats(db_path: Optional[str] = None) -> Dict[str, Any]:
@@ -560,15 +1912,22 @@ def get_archive_stats(db_path: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         ``{"db_path", "db_size_bytes", "snapshot_count", "trend_row_count",
         "geos", "sources", "first_fetched_at", "last_fetched_at",
-        "cache_entries", "explore_cache_entries"}`` — an archive that does
-        not exist yet reads as empty.
+        "cache_entries", "explore_cache_entries", "deduplicated_snapshots",
+        "delta_snapshots", "payload_bytes", "payload_raw_bytes",
+        "compression_ratio"}`` — an archive that does not exist yet reads as
+        empty. ``payload_bytes`` is what the stored payloads occupy,
+        ``payload_raw_bytes`` their uncompressed JSON size, and
+        ``compression_ratio`` the quotient (1.0 when nothing is stored).
+        ``deduplicated_snapshots`` counts snapshots stored as a reference to
+        an identical earlier one, ``delta_snapshots`` those stored as a delta
+        (see :func:`configure_archive_storage`).
 
     Raises:
         ArchiveError: If the archive file cannot be read.
     """
     path = db_path or _default_db_path()
-    conn = _connect(path)
-    try:
+    _flush_writer()  # queued snapshots are part of the archive
+    with _connection(path) as conn:
         snapshot_count = conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
         trend_count = conn.execute("SELECT COUNT(*) FROM trends").fetchone()[0]
         first, last = conn.execute(
@@ -580,8 +1939,18 @@ def get_archive_stats(db_path: Optional[str] = None) -> Dict[str, Any]:
         ]
         cache_entries = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
         explore_cache_entries = conn.execute("SELECT COUNT(*) FROM explore_cache").fetchone()[0]
-    finally:
-        conn.close()
+        deduplicated, deltas = conn.execute(
+            "SELECT COUNT(ref_id), COUNT(delta_of) FROM snapshots"
+        ).fetchone()
+        stored_bytes = raw_bytes = 0
+        for table in ("snapshots", "cache", "explore_cache"):
+            stored, raw = conn.execute(
+                "SELECT COALESCE(SUM(length(CAST(payload_json AS BLOB))), 0),"
+                " COALESCE(SUM(COALESCE(payload_size, length(CAST(payload_json AS BLOB)))), 0)"
+                " FROM %s" % table
+            ).fetchone()
+            stored_bytes += stored
+            raw_bytes += raw
     return {
         "db_path": os.path.abspath(path),
         "db_size_bytes": os.path.getsize(path) if os.path.exists(path) else 0,
@@ -593,31 +1962,231 @@ def get_archive_stats(db_path: Optional[str] = None) -> Dict[str, Any]:
         "last_fetched_at": last,
         "cache_entries": cache_entries,
         "explore_cache_entries": explore_cache_entries,
+        "deduplicated_snapshots": deduplicated,
+        "delta_snapshots": deltas,
+        "payload_bytes": stored_bytes,
+        "payload_raw_bytes": raw_bytes,
+        "compression_ratio": round(raw_bytes / stored_bytes, 2) if stored_bytes else 1.0,
     }
 
 
+#: Rollup buckets and the strftime format of their ``bucket_start`` (UTC).
+_BUCKETS = {"hour": "%Y-%m-%dT%H:00:00+00:00", "day": "%Y-%m-%d"}
+
+#: Snapshots aggregated per transaction by :func:`refresh_archive_rollups`.
+_ROLLUP_BATCH = 5000
+
+
+def _roll_up(conn: sqlite3.Connection, limit: Optional[int] = None) -> int:
+    """Fold snapshots past the ``rollup_through`` watermark into ``rollups``.
+
+    A no-op (one meta read) on archives where rollups were never enabled.
+    Runs in the caller's transaction; returns the snapshots folded in. A
+    keyword seen in several casings keeps the smallest one (binary order), so
+    incremental folding and a full rebuild store the same spelling.
+    """
+    row = conn.execute("SELECT value FROM meta WHERE key = 'rollup_through'").fetchone()
+    if row is None:
+        return 0
+    through = int(row[0])
+    count, upto = conn.execute(
+        "SELECT COUNT(*), MAX(id) FROM"
+        " (SELECT id FROM snapshots WHERE id > ? ORDER BY id LIMIT ?)",
+        (through, -1 if limit is None else limit),
+    ).fetchone()
+    if not count:
+        return 0
+    for bucket, fmt in _BUCKETS.items():
+        conn.execute(
+            "INSERT INTO rollups (bucket, bucket_start, geo, source, keyword, appearances,"
+            " best_rank, max_volume_min, first_seen, last_seen)"
+            " SELECT ?, strftime(?, s.fetched_at), s.geo, s.source,"
+            " MIN(t.keyword COLLATE BINARY), COUNT(*),"
+            " MIN(t.rank), MAX(t.volume_min), MIN(s.fetched_at), MAX(s.fetched_at)"
+            " FROM snapshots s JOIN trends t ON t.snapshot_id = COALESCE(s.ref_id, s.id)"
+            " WHERE s.id > ? AND s.id <= ? AND strftime(?, s.fetched_at) IS NOT NULL"
+            " GROUP BY 2, s.geo, s.source, t.keyword COLLATE NOCASE"
+            " ON CONFLICT (bucket, bucket_start, geo, source, keyword) DO UPDATE SET"
+            " keyword = min(keyword COLLATE BINARY, excluded.keyword),"
+            " appearances = appearances + excluded.appearances,"
+            " best_rank = COALESCE(min(best_rank, excluded.best_rank), best_rank,"
+            " excluded.best_rank),"
+            " max_volume_min = COALESCE(max(max_volume_min, excluded.max_volume_min),"
+            " max_volume_min, excluded.max_volume_min),"
+            " first_seen = min(first_seen, excluded.first_seen),"
+            " last_seen = max(last_seen, excluded.last_seen)",
+            (bucket, fmt, through, upto, fmt),
+        )
+    conn.execute("UPDATE meta SET value = ? WHERE key = 'rollup_through'", (str(upto),))
+    return int(count)
+
+
+def refresh_archive_rollups(db_path: Optional[str] = None, rebuild: bool = False) -> int:
+    """Enable the hourly/daily rollup tables of an archive and bring them up to date.
+
+    The first call turns rollups on for this archive file and aggregates
+    every snapshot already in it; from then on each archived snapshot is
+    folded in as it is written, in the same transaction. Call it again after
+    writing with a trendspyg older than 1.7.0, or with ``rebuild=True`` to
+    recompute everything from the snapshots currently in the archive
+    (rollups otherwise keep counting snapshots that ``prune_archive``
+    removed, so history survives pruning).
+
+    Args:
+        db_path: Archive file.
+        rebuild: Drop the rollups and aggregate the archive from scratch.
+
+    Returns:
+        The number of snapshots aggregated by this call.
+
+    Raises:
+        ArchiveError: If the archive file cannot be read.
+    """
+    _flush_writer()  # queued snapshots are part of the archive
+    total = 0
+    with _connection(db_path) as conn:
+        with conn:
+            if rebuild:
+                conn.execute("DELETE FROM rollups")
+                conn.execute("DELETE FROM meta WHERE key = 'rollup_through'")
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('rollup_through', '0')")
+        while True:  # short transactions, so writers get the lock in between
+            with conn:
+                done = _roll_up(conn, limit=_ROLLUP_BATCH)
+            total += done
+            if done < _ROLLUP_BATCH:
+                return total
+
+
+def get_archive_rollups(
+    bucket: str = "day",
+    geo: Optional[str] = None,
+    source: Optional[Union[str, Sequence[str]]] = None,
+    start: Optional[Union[str, datetime]] = None,
+    end: Optional[Union[str, datetime]] = None,
+    keyword: Optional[str] = None,
+    top: Optional[int] = None,
+    db_path: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Per-bucket keyword aggregates from the rollup tables, oldest bucket first.
+
+    Answers "top keywords per geo per day" or "hours X spent trending this
+    week" from pre-aggregated rows instead of scanning ``trends``. Rows of
+    several sources in one bucket are combined.
+
+    Args:
+        bucket: ``"hour"`` or ``"day"`` (UTC).
+        geo: Only this region code.
+        source: Only this data path, or a sequence of them (e.g. ``("rss", "csv")``).
+        start: Only buckets containing or after this time.
+        end: Only buckets containing or before this time.
+        keyword: Only this keyword (case-insensitive).
+        top: Keep the N most frequent keywords of each (bucket, geo).
+
+    Returns:
+        ``[{"bucket_start", "geo", "keyword", "appearances", "best_rank",
+        "max_volume_min", "first_seen", "last_seen"}, ...]`` ordered by
+        bucket, geo, then most appearances and best rank first.
+
+    Raises:
+        InvalidParameterError: On an unknown bucket, a bad ``top`` or bad
+            ``start``/``end``.
+        ArchiveError: If rollups were never enabled for this archive (run
+            :func:`refresh_archive_rollups` once) or it cannot be read.
+    """
+    if bucket not in _BUCKETS:
+        raise InvalidParameterError("bucket must be 'hour' or 'day', got %r" % (bucket,))
+    if top is not None and (isinstance(top, bool) or not isinstance(top, int) or top < 1):
+        raise InvalidParameterError("top must be a positive int or None, got %r" % (top,))
+    # rollups is aliased "s" so the snapshot filters apply to it as-is.
+    where, params = _snapshot_filters(geo, source, None, None)
+    where.insert(0, "s.bucket = ?")
+    params.insert(0, bucket)
+    if start is not None:
+        where.append("s.bucket_start >= strftime(?, ?)")
+        params.extend([_BUCKETS[bucket], _iso_arg(start, "start")])
+    if end is not None:
+        where.append("s.bucket_start <= strftime(?, ?)")
+        params.extend([_BUCKETS[bucket], _iso_arg(end, "end")])
+    if keyword is not None:
+        if not isinstance(keyword, str) or not keyword.strip():
+            raise InvalidParameterError("keyword must be a non-empty string, got %r" % (keyword,))
+        where.append("s.keyword = ?")
+        params.append(keyword.strip())
+    # Each (bucket, geo) is ranked in SQL, so top= never ships the tail to Python
+    sql = (
+        "SELECT bucket_start, geo, keyword, appearances, best_rank, max_volume_min,"
+        " first_seen, last_seen FROM (SELECT s.bucket_start, s.geo,"
+        " MIN(s.keyword COLLATE BINARY) AS keyword, SUM(s.appearances) AS appearances,"
+        " MIN(s.best_rank) AS best_rank, MAX(s.max_volume_min) AS max_volume_min,"
+        " MIN(s.first_seen) AS first_seen, MAX(s.last_seen) AS last_seen,"
+        " ROW_NUMBER() OVER (PARTITION BY s.bucket_start, s.geo ORDER BY"
+        " SUM(s.appearances) DESC, MIN(s.best_rank) IS NULL, MIN(s.best_rank),"
+        " MIN(s.keyword COLLATE BINARY)) AS position FROM rollups s WHERE "
+        + " AND ".join(where)
+        + " GROUP BY s.bucket_start, s.geo, s.keyword)"
+        + ("" if top is None else " WHERE position <= ?")
+        + " ORDER BY bucket_start, geo, position"
+    )
+    if top is not None:
+        params.append(top)
+    _flush_writer()  # queued snapshots are part of the archive
+    with _connection(db_path) as conn:
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'rollup_through'").fetchone() is None:
+            raise ArchiveError(
+                "Rollups are not enabled for this archive; run refresh_archive_rollups() once."
+            )
+        return [dict(row) for row in conn.execute(sql, params)]
+
+
 def prune_archive(
     before: Union[str, datetime],
     geo: Optional[str] = None,
     source: Optional[str] = None,
     db_path: Optional[str] = None,
+    batch_size: int = _PRUNE_BATCH,
+    max_seconds: Optional[float] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
 ) -> int:
     """Delete archived snapshots fetched before ``before``; returns the deleted count.
 
     Deleting is always explicit — nothing in the archive expires on its own.
-    Trend rows of deleted snapshots are removed with them.
+    Trend rows of deleted snapshots are removed with them. A kept snapshot
+    deduplicated against a deleted one takes over its payload first.
+
+    Snapshots go in batches of ``batch_size``, one short transaction each, so
+    concurrent writers (an ``archive=True`` poller) get the lock between
+    batches instead of waiting out the whole prune. Afterwards freed pages are
+    returned to the filesystem (incremental vacuum, on files created by 1.7.0+)
+    and the WAL is checkpointed and truncated, so the file actually shrinks.
 
     Args:
         before: Cutoff (datetime or ISO string); snapshots strictly older go.
         geo: Only prune this region code.
         source: Only prune this data path.
         db_path: Archive file to prune.
+        batch_size: Snapshots deleted per transaction.
+        max_seconds: Stop after the batch that crosses this budget. The rest is
+            left for the next call, so a huge backlog can be pruned in slices.
+        progress: Called as ``progress(deleted_so_far, total_to_delete)``
+            after every batch.
 
     Raises:
-        InvalidParameterError: If ``before`` is missing or not datetime/ISO string.
+        InvalidParameterError: If ``before`` is missing or not datetime/ISO
+            string, or on a bad ``batch_size``/``max_seconds``.
         ArchiveError: If the archive file cannot be read.
     """
     cutoff = _iso_arg(before, "before")
+    if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+        raise InvalidParameterError("batch_size must be a positive int, got %r" % (batch_size,))
+    if max_seconds is not None and (
+        isinstance(max_seconds, bool)
+        or not isinstance(max_seconds, (int, float))
+        or max_seconds < 0
+    ):
+        raise InvalidParameterError(
+            "max_seconds must be a non-negative number or None, got %r" % (max_seconds,)
+        )
     where = ["fetched_at < ?"]
     params: List[Any] = [cutoff]
     if geo is not None:
@@ -626,11 +2195,115 @@ def prune_archive(
     if source is not None:
         where.append("source = ?")
         params.append(source)
+    matching = " AND ".join(where)
+
+    started = time.monotonic()
+    deleted = 0
+    _flush_writer()  # queued snapshots are part of the archive
+    with _connection(db_path) as conn:
+        row = conn.execute("SELECT COUNT(*) FROM snapshots WHERE %s" % matching, params).fetchone()
+        total = row[0]
+        while deleted < total:
+            with conn:
+                ids = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT id FROM snapshots WHERE %s LIMIT ?" % matching,
+                        params + [batch_size],
+                    )
+                ]
+                _promote_references(conn, ids)
+                _rebase_deltas(conn, ids)
+                removed = 0
+                for chunk in _chunks(ids):
+                    removed += conn.execute(
+                        "DELETE FROM snapshots WHERE id IN (%s)" % ",".join("?" * len(chunk)),
+                        list(chunk),
+                    ).rowcount
+            if removed <= 0:
+                break
+            deleted += removed
+            if progress is not None:
+                progress(deleted, total)
+            if max_seconds is not None and time.monotonic() - started >= max_seconds:
+                break
+        if deleted:
+            with conn:  # ids of deleted newest snapshots are reused: roll those up again
+                conn.execute(
+                    "UPDATE meta SET value = MIN(CAST(value AS INTEGER),"
+                    " (SELECT COALESCE(MAX(id), 0) FROM snapshots))"
+                    " WHERE key = 'rollup_through'"
+                )
+            _reclaim_space(conn, None if max_seconds is None else started + max_seconds)
+    return deleted
 
-    conn = _connect(db_path)
-    try:
-        with conn:
-            cur = conn.execute("DELETE FROM snapshots WHERE " + " AND ".join(where), params)
-            return int(cur.rowcount)
-    finally:
-        conn.close()
+
+def _promote_references(conn: sqlite3.Connection, doomed: Sequence[int]) -> None:
+    """Keep deduplicated snapshots readable when the snapshot they refer to goes.
+
+    For each doomed base with surviving references, the earliest survivor
+    takes over its payload and trend rows; the other survivors are repointed.
+    """
+    doomed_set = set(doomed)
+    survivors: Dict[int, List[int]] = {}
+    for chunk in _chunks(doomed):
+        for row in conn.execute(
+            "SELECT id, ref_id FROM snapshots WHERE ref_id IN (%s) ORDER BY fetched_at"
+            % ",".join("?" * len(chunk)),
+            list(chunk),
+        ):
+            if row["id"] not in doomed_set:
+                survivors.setdefault(row["ref_id"], []).append(row["id"])
+    for base_id, refs in survivors.items():
+        heir = refs[0]
+        conn.execute(
+            "UPDATE snapshots SET ref_id = NULL,"
+            " payload_json = (SELECT payload_json FROM snapshots WHERE id = :base),"
+            " payload_size = (SELECT payload_size FROM snapshots WHERE id = :base),"
+            " delta_of = (SELECT delta_of FROM snapshots WHERE id = :base),"
+            " delta_depth = (SELECT delta_depth FROM snapshots WHERE id = :base)"
+            " WHERE id = :heir",
+            {"base": base_id, "heir": heir},
+        )
+        conn.execute("UPDATE snapshots SET ref_id = ? WHERE ref_id = ?", (heir, base_id))
+        conn.execute("UPDATE snapshots SET delta_of = ? WHERE delta_of = ?", (heir, base_id))
+        conn.execute("UPDATE trends SET snapshot_id = ? WHERE snapshot_id = ?", (heir, base_id))
+
+
+def _rebase_deltas(conn: sqlite3.Connection, doomed: Sequence[int]) -> None:
+    """Rewrite kept deltas of doomed snapshots as keyframes, before those go."""
+    doomed_set = set(doomed)
+    orphans: List[Tuple[int, str]] = []
+    for chunk in _chunks(doomed):
+        for row in conn.execute(
+            "SELECT id, fetched_at FROM snapshots WHERE delta_of IN (%s)"
+            % ",".join("?" * len(chunk)),
+            list(chunk),
+        ):
+            if row["id"] not in doomed_set:
+                orphans.append((row["id"], row["fetched_at"]))
+    memo: Dict[int, Dict[str, Any]] = {}
+    keyframes = [
+        (_pack_payload(json.dumps(dict(_resolve(conn, sid, memo), fetched_at=fetched_at))), sid)
+        for sid, fetched_at in orphans
+    ]
+    conn.executemany(
+        "UPDATE snapshots SET payload_json = ?, payload_size = ?, delta_of = NULL,"
+        " delta_depth = 0 WHERE id = ?",
+        [(payload, size, sid) for (payload, size), sid in keyframes],
+    )
+
+
+def _reclaim_space(conn: sqlite3.Connection, deadline: Optional[float]) -> None:
+    """Hand freed pages back to the filesystem and truncate the WAL.
+
+    Incremental vacuum only works on files created with ``auto_vacuum =
+    INCREMENTAL`` (1.7.0+); on older files the free pages are reused by later
+    writes instead. Runs in steps so it honours the prune's time budget.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        while conn.execute("PRAGMA freelist_count").fetchone()[0]:
+            conn.execute("PRAGMA incremental_vacuum(%d)" % _VACUUM_STEP_PAGES).fetchall()
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
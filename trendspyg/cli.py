@@ -720,11 +720,22 @@ def watch(
 )
 @click.option("--limit", type=int, default=None, help="At most N newest snapshots")
 @click.option("--stats", is_flag=True, help="Show archive statistics instead of data")
+@click.option(
+    "--ndjson",
+    is_flag=True,
+    help="Stream snapshots as one JSON object per line (constant memory, for big archives).",
+)
 @click.option(
     "--prune-before",
     default=None,
     help="Delete snapshots fetched before this ISO 8601 time, print the deleted count, and exit.",
 )
+@click.option(
+    "--prune-max-seconds",
+    type=float,
+    default=None,
+    help="With --prune-before: stop after about this many seconds; re-run to continue.",
+)
 @click.option(
     "--db",
     default=None,
@@ -742,7 +753,9 @@ def history(
     timeline: bool,
     limit: Optional[int],
     stats: bool,
+    ndjson: bool,
     prune_before: Optional[str],
+    prune_max_seconds: Optional[float],
     db: Optional[str],
     quiet: bool,
 ) -> None:
@@ -756,19 +769,49 @@ def history(
         trendspyg history --geo US --limit 5
         trendspyg history -k bitcoin --timeline --quiet | jq .
         trendspyg history --since 2026-08-01 --until 2026-08-05
+        trendspyg history --ndjson --quiet > archive.ndjson
         trendspyg history --stats
         trendspyg history --prune-before 2026-01-01
     """
     import json as _json
 
-    from .archive import get_archive_stats, get_keyword_history, prune_archive, read_archive
+    from .archive import (
+        get_archive_stats,
+        get_keyword_history,
+        iter_archive,
+        prune_archive,
+        read_archive,
+    )
 
     try:
         if prune_before is not None:
-            deleted = prune_archive(prune_before, geo=geo, source=source, db_path=db)
+            totals = {"total": 0}
+
+            def _progress(done: int, total: int) -> None:
+                totals["total"] = total
+                if not quiet:
+                    click.echo(f"[history] Pruning... {done}/{total} snapshots", err=True)
+
+            deleted = prune_archive(
+                prune_before,
+                geo=geo,
+                source=source,
+                db_path=db,
+                max_seconds=prune_max_seconds,
+                progress=_progress,
+            )
+            remaining = totals["total"] - deleted
             if not quiet:
                 click.echo(f"[history] Deleted {deleted} snapshots", err=True)
-            click.echo(_json.dumps({"deleted": deleted}))
+            if remaining:
+                if not quiet:
+                    click.echo(
+                        f"[history] {remaining} left (time budget reached); re-run to continue",
+                        err=True,
+                    )
+                click.echo(_json.dumps({"deleted": deleted, "remaining": remaining}))
+            else:
+                click.echo(_json.dumps({"deleted": deleted}))
             return
 
         if stats:
@@ -784,6 +827,23 @@ def history(
             click.echo(_json.dumps(points, indent=2))
             return
 
+        if ndjson:
+            count = 0
+            for envelope in iter_archive(
+                geo=geo,
+                source=source,
+                start=since,
+                end=until,
+                keyword=keyword,
+                limit=limit,
+                db_path=db,
+            ):
+                click.echo(_json.dumps(envelope))
+                count += 1
+            if not quiet:
+                click.echo(f"[history] {count} snapshots", err=True)
+            return
+
         envelopes = read_archive(
             geo=geo,
             source=source,
@@ -1,10 +1,14 @@
 """Custom exceptions for trendspyg."""
 
+from typing import Any, Dict, List, Optional
+
 
 class TrendspygException(Exception):
     """Base exception for all trendspyg errors."""
 
-    pass
+    #: Set when the failing call was retried (RSS path): one dict per attempt,
+    #: ``{'attempt', 'error', 'elapsed', 'wait'}`` (seconds), oldest first.
+    attempts: Optional[List[Dict[str, Any]]] = None
 
 
 class DownloadError(TrendspygException):
@@ -85,3 +89,15 @@ class ArchiveError(TrendspygException):
     """
 
     pass
+
+
+class StaleDataWarning(RuntimeWarning):
+    """Warned when an RSS function returns an expired cached feed.
+
+    Emitted for every output format whenever a stale-while-revalidate or
+    stale-if-error window (see ``configure_rss_cache``) serves data past its
+    TTL. Normalized envelopes and DataFrames are additionally marked
+    ``"stale": True`` / ``df.attrs["stale"]``; dict, JSON and CSV output can
+    only be told apart by this warning. Escalate it to an error with
+    ``warnings.simplefilter("error", StaleDataWarning)`` to refuse stale data.
+    """
@@ -50,6 +50,9 @@ _INSTRUCTIONS = (
 )
 
 _MAX_COMPARE_GEOS = 20
+# compare_trending fetches its geos on this many threads (well inside the
+# shared RSS session's pool of 10), so 20 geos cost ~4 round trips, not 20.
+_COMPARE_WORKERS = 5
 
 # Fail-fast retry profile for the Explore-backed tool: ~40s worst case
 # (4 x (6s watch + ~2s reload) + page load) instead of the library default's
@@ -114,7 +117,9 @@ def compare_trending(geos: List[str], compact: bool = False) -> Dict[str, Any]:
             f"Pass between 1 and {_MAX_COMPARE_GEOS} geo codes (got {len(geos)}). "
             "For a broad sweep, call this tool several times with smaller batches."
         )
-    results = download_google_trends_rss_batch(list(geos), show_progress=False, normalize=True)
+    results = download_google_trends_rss_batch(
+        list(geos), show_progress=False, normalize=True, max_workers=_COMPARE_WORKERS
+    )
     if compact:
         # normalize=True always yields envelope dicts; the batch annotation is a wide Union.
         return {geo: _compact_envelope(cast(Dict[str, Any], env)) for geo, env in results.items()}
@@ -298,7 +303,8 @@ def get_trending_history(
 
     # Trending-Now sources only — Explore-path snapshots (a user's research
     # queries, archived since 1.4.0) are not "what was trending".
-    envelopes = cast(
+    # Compact read: answered from the indexed tables, no payload is loaded.
+    snapshots = cast(
         List[Dict[str, Any]],
         read_archive(
             geo=geo,
@@ -307,25 +313,9 @@ def get_trending_history(
             start=start,
             end=end,
             limit=limit,
+            output_format="compact",
         ),
     )
-    snapshots = [
-        {
-            "fetched_at": env.get("fetched_at"),
-            "geo": env.get("geo"),
-            "source": env.get("source"),
-            "trend_count": env.get("count"),
-            "trends": [
-                {
-                    "keyword": t.get("keyword"),
-                    "rank": t.get("rank"),
-                    "volume_min": t.get("volume_min"),
-                }
-                for t in env.get("trends", [])
-            ],
-        }
-        for env in envelopes
-    ]
     result: Dict[str, Any] = {"snapshot_count": len(snapshots), "snapshots": snapshots}
     if keyword:
         result["keyword"] = keyword
@@ -17,47 +17,728 @@ Use Cases:
 """
 
 import asyncio
+import atexit
+import hashlib
+import os
+import threading
+import time
+import warnings
 import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import ContextVar, copy_context
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Optional, Union, cast
+from io import BytesIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NoReturn,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 if TYPE_CHECKING:
     import pandas as pd
     import aiohttp
 
-from .archive import _disk_cache_get_safely, _disk_cache_set_safely, _store_snapshot_safely
+from .archive import (
+    _default_db_path,
+    _disk_cache_get_entry_safely,
+    _disk_cache_get_validators_safely,
+    _disk_cache_set_safely,
+    _store_snapshot_safely,
+    _store_snapshots_safely,
+)
 from .config import COUNTRIES, DEFAULT_GEO, US_STATES
-from .exceptions import DownloadError, InvalidParameterError, RateLimitError
+from .exceptions import (
+    DownloadError,
+    InvalidParameterError,
+    RateLimitError,
+    StaleDataWarning,
+    TrendspygException,
+)
 from .normalize import normalize_rss
-from .utils import _parse_traffic_to_min, get_rss_cache
+from .utils import (
+    RetryPolicy,
+    _describe_attempts,
+    _parse_traffic_to_min,
+    _retry_after_seconds,
+    get_rss_cache,
+    get_rss_disk_l1,
+    get_rss_governor,
+    get_rss_validator_cache,
+)
 
 # Type aliases
 OutputFormat = Literal["csv", "json", "dataframe", "dict"]
 
+T = TypeVar("T")
 
-def _make_cache_key(
-    geo: str, include_images: bool, include_articles: bool, max_articles_per_trend: int
-) -> str:
-    """Generate a cache key from request parameters."""
-    return f"{geo}:{include_images}:{include_articles}:{max_articles_per_trend}"
+#: Defaults for the shared sync session. Every RSS request goes to one host, so
+#: ``pool_size`` is the number of keep-alive connections kept open to it.
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_RETRIES = 0
 
+_session_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_config: Dict[str, int] = {
+    "pool_size": DEFAULT_POOL_SIZE,
+    "max_retries": DEFAULT_CONNECT_RETRIES,
+}
 
-def _handle_http_error(status_code: int, geo: str, url: str) -> None:
+
+def _build_session(pool_size: int, max_retries: int) -> requests.Session:
+    """A keep-alive ``requests.Session`` with a sized pool.
+
+    Retrying belongs to the caller's :class:`RetryPolicy`, so by default the
+    adapter does not retry at all; ``max_retries`` only adds retries of
+    connection *establishment* — a request that reached Google is never
+    replayed here, so HTTP errors still surface through :func:`_handle_http_error`.
+    """
+    retry = Retry(total=max_retries, connect=max_retries, read=0, backoff_factor=0.2)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """The process-wide pooled session used when a caller does not pass ``session=``.
+
+    Created lazily under a lock so concurrent first callers share one pool, and
+    rebuilt after ``fork()`` — a child must never reuse sockets its parent owns.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            _session = _build_session(_session_config["pool_size"], _session_config["max_retries"])
+            _session_pid = os.getpid()
+        return _session
+
+
+def _close_session() -> None:
+    """Close the shared session's pooled connections (also registered at exit)."""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+atexit.register(_close_session)
+
+
+def configure_rss_session(
+    pool_size: int = DEFAULT_POOL_SIZE, max_retries: int = DEFAULT_CONNECT_RETRIES
+) -> None:
+    """
+    Resize the pooled HTTP session shared by the synchronous RSS functions.
+
+    The sync RSS functions reuse one keep-alive ``requests.Session`` per
+    process, so repeated polls and batch sweeps skip the DNS + TCP + TLS setup
+    a bare ``requests.get`` pays on every call. The current session is closed
+    and the next request opens a new one with these settings.
+
+    Args:
+        pool_size: Keep-alive connections held open to Google (default: 10).
+            Raise it if many threads fetch at once.
+        max_retries: Extra retries of a failed connection inside each attempt
+            (default: 0). Connection failures are already retried by the
+            RetryPolicy (``retry=``), so leave this at 0 unless calls use
+            ``RetryPolicy(max_attempts=1)``; otherwise the two multiply.
+            Requests that reached Google are never replayed by the pool.
+
+    Raises:
+        InvalidParameterError: If pool_size < 1 or max_retries < 0
+
+    Example:
+        >>> configure_rss_session(pool_size=32)  # web app with many worker threads
+    """
+    if not isinstance(pool_size, int) or pool_size < 1:
+        raise InvalidParameterError(f"pool_size must be an integer >= 1, got {pool_size!r}")
+    if not isinstance(max_retries, int) or max_retries < 0:
+        raise InvalidParameterError(f"max_retries must be an integer >= 0, got {max_retries!r}")
+    _close_session()
+    with _session_lock:
+        _session_config["pool_size"] = pool_size
+        _session_config["max_retries"] = max_retries
+
+
+def _make_cache_key(geo: str) -> str:
+    """Cache key for a geo's full-fidelity parse.
+
+    The parse options are deliberately not part of it: the caches hold one
+    full parse per geo and every ``include_*`` / ``max_articles_per_trend``
+    combination is projected from it (see ``_project_trends``), so mixed
+    callers share one entry and one upstream fetch.
+    """
+    return f"{geo}:full"
+
+
+def _project_trends(
+    trends: List[Dict], include_images: bool, include_articles: bool, max_articles_per_trend: int
+) -> List[Dict]:
+    """Cut a full-fidelity parse down to what the caller asked for.
+
+    The result equals what ``_parse_rss_xml`` returns for the same options;
+    each trend is a new dict, so callers may modify it without touching the
+    cached parse.
+    """
+    projected = []
+    for trend in trends:
+        trend = dict(trend)
+        if not include_images:
+            trend.pop("image", None)
+        if include_articles:
+            trend["news_articles"] = trend.get("news_articles", [])[:max_articles_per_trend]
+        else:
+            trend.pop("news_articles", None)
+        projected.append(trend)
+    return projected
+
+
+def _revalidation_entry(
+    cache_key: str, use_disk_cache: bool, db_path: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """The last response seen for ``cache_key``: its validators and parsed trends.
+
+    Disk mode reads the ``cache`` row (so cron jobs revalidate across
+    processes); every other mode uses the in-process validator store, which is
+    also what lets ``cache=False`` pollers such as ``watch_google_trends_rss``
+    send conditional requests.
+    """
+    if use_disk_cache:
+        return _disk_cache_get_validators_safely(cache_key, db_path=db_path)
+    return cast(Optional[Dict[str, Any]], get_rss_validator_cache().get(cache_key))
+
+
+def _conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """``If-None-Match`` / ``If-Modified-Since`` headers for a revalidation entry."""
+    headers: Dict[str, str] = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+#: Sent when a 304 arrives for an unconditional request: ask once more, and
+#: tell any cache on the way not to answer for Google.
+_NO_CACHE_HEADERS = {"Cache-Control": "no-cache"}
+
+
+def _refetch_headers(
+    status: int, entry: Optional[Dict[str, Any]], headers: Dict[str, str]
+) -> Optional[Dict[str, str]]:
+    """Headers to repeat the request with after a 304 nothing stored can answer.
+
+    Without an entry the 304 cannot have answered our validators, so it is
+    treated as a cache miss and the feed is fetched once more unconditionally.
+    None means the response stands (including a second unsolicited 304, which
+    :func:`_trends_from_response` then reports).
+    """
+    if status == 304 and entry is None and headers != _NO_CACHE_HEADERS:
+        return dict(_NO_CACHE_HEADERS)
+    return None
+
+
+def _response_validators(headers: Any, content: bytes) -> Dict[str, Optional[str]]:
+    """Validators to store for a 200 response: ETag, Last-Modified, content hash."""
+    etag = headers.get("ETag") if headers is not None else None
+    last_modified = headers.get("Last-Modified") if headers is not None else None
+    return {
+        "etag": etag if isinstance(etag, str) else None,
+        "last_modified": last_modified if isinstance(last_modified, str) else None,
+        "content_hash": hashlib.sha256(content).hexdigest(),
+    }
+
+
+def _trends_from_response(
+    status: int,
+    content: bytes,
+    headers: Any,
+    entry: Optional[Dict[str, Any]],
+    geo: str,
+    url: str,
+) -> "tuple[List[Dict], Dict[str, Optional[str]]]":
+    """Turn a fetched response into full-fidelity trends, skipping the parse when nothing changed.
+
+    A 304 answers a conditional request: the stored trends are still current.
+    A 200 whose body hashes to the stored ``content_hash`` is the same feed
+    served without validators, so the stored parse is reused as well.
+    """
+    if status == 304 and entry is not None:
+        validators = {k: entry.get(k) for k in ("etag", "last_modified", "content_hash")}
+        return entry["trends"], validators
+    if status == 304:  # a 304 we never asked for
+        _handle_http_error(status, geo, url)
+    validators = _response_validators(headers, content)
+    if entry is not None and entry.get("content_hash") == validators["content_hash"]:
+        return entry["trends"], validators
+    trends = _parse_rss_xml(
+        xml_content=content,
+        geo=geo,
+        include_images=True,
+        include_articles=True,
+        max_articles_per_trend=None,
+    )
+    return trends, validators
+
+
+def _store_fetched(
+    cache_key: str,
+    trends: List[Dict],
+    validators: Dict[str, Optional[str]],
+    cache: Union[bool, str],
+    db_path: Optional[str],
+) -> None:
+    """Record a fetch in the response cache and keep its validators for next time."""
+    if cache == "disk":
+        ttl = get_rss_cache().ttl
+        _disk_cache_set_safely(cache_key, trends, ttl, db_path=db_path, validators=validators)
+        if ttl > 0:
+            get_rss_disk_l1().set(_disk_l1_key(cache_key, db_path), (trends, time.time()), ttl=ttl)
+        return
+    if cache:
+        get_rss_cache().set(cache_key, trends)
+    get_rss_validator_cache().set(cache_key, dict(validators, trends=trends))
+
+
+def _disk_l1_key(cache_key: str, db_path: Optional[str]) -> str:
+    """L1 key for a disk-cache row: the same key in another archive file is another row."""
+    return f"{os.path.abspath(db_path or _default_db_path())}|{cache_key}"
+
+
+def _cached_trends(
+    cache_key: str, cache: Union[bool, str], db_path: Optional[str]
+) -> Optional[List[Dict]]:
+    """Cached trends for ``cache_key`` in the requested cache mode, if still fresh.
+
+    Disk mode reads through the in-process L1 and warms it from the row on a
+    miss. L1 copies keep the row's ``stored_at`` and are checked against the
+    TTL in force now, so lowering it (or ``set_rss_cache_ttl(0)``) applies to
+    copies made before the change as well.
+    """
+    if cache == "disk":
+        ttl = get_rss_cache().ttl
+        l1_key = _disk_l1_key(cache_key, db_path)
+        if ttl > 0:
+            hit = get_rss_disk_l1().get(l1_key)
+            if hit is not None and time.time() - hit[1] < ttl:
+                return cast(List[Dict], hit[0])
+        entry = _disk_cache_get_entry_safely(cache_key, ttl, db_path=db_path)
+        if entry is None:
+            return None
+        trends, stored_at = entry
+        if ttl > 0:
+            get_rss_disk_l1().set(l1_key, entry, ttl=stored_at + ttl - time.time())
+        return cast(List[Dict], trends)
+    if cache:
+        return cast(Optional[List[Dict]], get_rss_cache().get(cache_key))
+    return None
+
+
+def _stale_trends(
+    cache_key: str, cache: Union[bool, str], db_path: Optional[str]
+) -> Optional[Tuple[List[Dict], float]]:
+    """Expired cached trends still inside a grace window, with seconds since expiry.
+
+    Always None while both windows are off (the default) or caching is
+    disabled (TTL 0), so a plain miss costs no extra lookup.
+    """
+    rss_cache = get_rss_cache()
+    grace = max(rss_cache.stale_while_revalidate, rss_cache.stale_if_error)
+    if grace <= 0 or rss_cache.ttl <= 0:
+        return None
+    if cache == "disk":
+        entry = _disk_cache_get_entry_safely(cache_key, rss_cache.ttl, grace, db_path=db_path)
+        if entry is None:
+            return None
+        return entry[0], max(0.0, time.time() - entry[1] - rss_cache.ttl)
+    if cache:
+        return cast(Optional[Tuple[List[Dict], float]], rss_cache.get_stale(cache_key))
+    return None
+
+
+def _serves_stale_on_error(
+    stale: Optional[Tuple[List[Dict], float]], geo: str, error: Exception
+) -> bool:
+    """Whether ``stale`` may stand in for a failed fetch (warns when it does)."""
+    if stale is None or stale[1] > get_rss_cache().stale_if_error:
+        return False
+    warnings.warn(
+        f"trendspyg RSS fetch for {geo} failed ({type(error).__name__}); "
+        f"serving cached trends that expired {stale[1]:.0f}s ago",
+        StaleDataWarning,
+        stacklevel=3,
+    )
+    return True
+
+
+def _warn_revalidating(geo: str, age: float) -> None:
+    """Tell the caller the trends it is about to get expired ``age`` seconds ago."""
+    warnings.warn(
+        f"trendspyg RSS cache for {geo} expired {age:.0f}s ago; serving it "
+        "while a background fetch refreshes it",
+        StaleDataWarning,
+        stacklevel=3,
+    )
+
+
+def _rss_output(
+    full: List[Dict],
+    geo: str,
+    output_format: OutputFormat,
+    normalize: bool,
+    include_images: bool,
+    include_articles: bool,
+    max_articles_per_trend: int,
+    stale: bool = False,
+) -> Union[List[Dict], str, "pd.DataFrame", Dict[str, Any]]:
+    """Render a cached parse for the caller.
+
+    ``stale`` marks an expired parse: normalized envelopes get ``"stale": True``
+    and DataFrames ``df.attrs["stale"] = True``. Dict, JSON and CSV output
+    carry no marker; callers learn of staleness from the StaleDataWarning
+    the serving path emits.
+    """
+    trends = _project_trends(full, include_images, include_articles, max_articles_per_trend)
+    if normalize:
+        envelope = normalize_rss(trends, geo)
+        if stale:
+            envelope["stale"] = True
+        return envelope
+    result = _format_output(trends, output_format, include_images, include_articles)
+    if stale and output_format == "dataframe":
+        cast("pd.DataFrame", result).attrs["stale"] = True
+    return result
+
+
+class _Flight:
+    """A fetch in progress that concurrent callers for the same key wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_flights_lock = threading.Lock()
+_flights: Dict[Hashable, _Flight] = {}
+_async_flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+
+def _flight_key(
+    cache_key: str, cache: Union[bool, str], archive: bool, db_path: Optional[str]
+) -> Hashable:
+    """Key under which concurrent misses share one fetch.
+
+    Besides the request parameters it carries everything the fetch does with
+    its result (which cache it fills, whether it is archived, in which file),
+    so a caller never joins a fetch that skips work it asked for.
+    """
+    return (cache_key, "disk" if cache == "disk" else bool(cache), archive, db_path)
+
+
+def _single_flight(key: Hashable, fetch: Callable[[], T]) -> Tuple[T, bool]:
+    """Run ``fetch`` once for all threads that ask for ``key`` at the same time.
+
+    The first caller runs it; callers arriving while it is in flight block and
+    receive the same result (or exception). Returns ``(result, shared)`` where
+    ``shared`` is True for callers that waited on someone else's fetch.
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = _flights[key] = _Flight()
+    if not leader:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return cast(T, flight.result), True
+    try:
+        flight.result = fetch()
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+    return cast(T, flight.result), False
+
+
+#: Set (per fetch context) by the batch functions: fresh snapshots are
+#: collected here and archived in one transaction when the sweep ends,
+#: instead of one commit per geo.
+_pending_snapshots: "ContextVar[Optional[List[Dict[str, Any]]]]" = ContextVar(
+    "trendspyg_pending_snapshots", default=None
+)
+
+
+def _archive_snapshot(envelope: Dict[str, Any], db_path: Optional[str]) -> None:
+    """Archive a fresh fetch now, or queue it for the enclosing batch's single write."""
+    pending = _pending_snapshots.get()
+    if pending is None:
+        _store_snapshot_safely(envelope, db_path=db_path)
+    else:
+        pending.append(envelope)
+
+
+def _refresh_archiver(
+    archive: bool,
+    geo: str,
+    db_path: Optional[str],
+    include_images: bool,
+    include_articles: bool,
+    max_articles_per_trend: int,
+) -> Optional[Callable[[List[Dict]], None]]:
+    """How a background refresh archives its parse, exactly as the caller's own fetch would."""
+    if not archive:
+        return None
+
+    def store(full: List[Dict]) -> None:
+        # Written directly, never queued: a batch may have flushed already
+        trends = _project_trends(full, include_images, include_articles, max_articles_per_trend)
+        _store_snapshot_safely(normalize_rss(trends, geo), db_path=db_path)
+
+    return store
+
+
+def _refresh_in_background(
+    key: Hashable,
+    fetch: Callable[[], Tuple[List[Dict], bool]],
+    archive: Optional[Callable[[List[Dict]], None]],
+) -> None:
+    """Refresh a stale entry on a daemon thread; the caller already has its answer.
+
+    Skipped when a fetch for ``key`` is already in flight. A failed refresh
+    leaves the stale entry for the next caller to retry.
+    """
+    with _flights_lock:
+        if key in _flights:
+            return
+
+    def run() -> None:
+        try:
+            (full, fetched), shared = _single_flight(key, fetch)
+        except Exception:  # nobody is waiting on a background refresh
+            return
+        if archive is not None and fetched and not shared:
+            archive(full)
+
+    threading.Thread(target=run, name="trendspyg-rss-refresh", daemon=True).start()
+
+
+async def _single_flight_async(key: Hashable, fetch: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+    """Async counterpart of :func:`_single_flight`, one shared future per key.
+
+    The fetch runs as its own task and every caller awaits it through
+    ``asyncio.shield``, so cancelling one caller (even the first) never
+    cancels the fetch the others are waiting on.
+    """
+    loop = asyncio.get_running_loop()
+    flight_key = (id(loop), key)  # futures belong to one event loop
+    future = _async_flights.get(flight_key)
+    shared = future is not None
+    if future is None:
+        future = _async_flights[flight_key] = asyncio.ensure_future(fetch())
+
+        def _finished(done: "asyncio.Future[Any]") -> None:
+            if _async_flights.get(flight_key) is done:
+                del _async_flights[flight_key]
+            if not done.cancelled():
+                done.exception()  # retrieved: no "never retrieved" warning
+
+        future.add_done_callback(_finished)
+    return cast(T, await asyncio.shield(future)), shared
+
+
+_refresh_tasks: "set[asyncio.Future[Any]]" = set()  # strong refs until they finish
+
+
+def _refresh_in_background_async(
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Tuple[List[Dict], bool]]],
+    archive: Optional[Callable[[List[Dict]], None]],
+) -> None:
+    """Async counterpart of :func:`_refresh_in_background`, as a task on the running loop."""
+    if (id(asyncio.get_running_loop()), key) in _async_flights:
+        return
+
+    async def run() -> None:
+        try:
+            (full, fetched), shared = await _single_flight_async(key, fetch)
+        except Exception:  # nobody is waiting on a background refresh
+            return
+        if archive is not None and fetched and not shared:
+            archive(full)
+
+    task = asyncio.ensure_future(run())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+#: Retry policy used when an RSS function is called without ``retry=``:
+#: 3 attempts, 0.5s then ~1s full-jitter waits, on connection failures,
+#: timeouts and 5xx.
+DEFAULT_RSS_RETRY = RetryPolicy()
+
+
+class _HTTPStatusError(Exception):
+    """An error status seen by the async path, before it is mapped to our errors."""
+
+    def __init__(self, status: int, headers: Any) -> None:
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.headers = headers
+
+
+def _record_attempt(
+    retry: RetryPolicy,
+    attempts: List[Dict[str, Any]],
+    started: float,
+    attempt_started: float,
+    error: str,
+    transient: bool,
+    status: Optional[int] = None,
+    headers: Any = None,
+) -> Optional[float]:
+    """Log a failed attempt; return the wait before the next one, or None to give up."""
+    now = time.monotonic()
+    attempt = len(attempts) + 1
+    wait: Optional[float] = None
+    retry_after = _retry_after_seconds(headers) if status is not None else None
+    if transient:
+        wait = retry.backoff(attempt, retry_after)
+        if not retry.should_retry(attempt, now - started, wait):
+            wait = None
+    attempts.append(
+        {
+            "attempt": attempt,
+            "error": error,
+            "elapsed": round(now - attempt_started, 3),
+            "wait": round(wait, 3) if wait is not None else 0.0,
+        }
+    )
+    if wait is not None and status in (429, 403):
+        get_rss_governor().on_throttle(retry_after)  # the final one goes via _handle_http_error
+    return wait
+
+
+def _with_attempts(error: TrendspygException, attempts: List[Dict[str, Any]]) -> TrendspygException:
+    """``error`` with the per-attempt log attached, if the request was retried.
+
+    The same instance is returned, so subclass attributes and the traceback
+    survive; only its message gains the attempt log.
+    """
+    if len(attempts) < 2:
+        return error
+    error.args = (f"{error}\n\n{_describe_attempts(attempts)}",)
+    error.attempts = attempts
+    return error
+
+
+def _raise_request_error(error: requests.RequestException, geo: str, url: str) -> NoReturn:
+    """Map a ``requests`` failure to DownloadError / RateLimitError."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        # Handle HTTP errors with specific messages
+        _handle_http_error(error.response.status_code, geo, url, error.response.headers)
+    if isinstance(error, requests.ConnectionError):
+        raise DownloadError(
+            "Connection failed - cannot reach Google Trends\n\n"
+            "Possible causes:\n"
+            "• No internet connection\n"
+            "• DNS resolution failed\n"
+            "• Firewall blocking the request\n\n"
+            "Check your internet connection and try again."
+        )
+    if isinstance(error, requests.Timeout):
+        raise DownloadError(
+            "Request timed out after 10 seconds\n\n"
+            "Possible causes:\n"
+            "• Slow internet connection\n"
+            "• Google Trends is experiencing delays\n\n"
+            "Try again in a moment."
+        )
+    raise DownloadError(
+        f"Network error: {type(error).__name__}\n\n" f"Details: {error}\n" f"URL: {url}"
+    )
+
+
+def _raise_async_request_error(error: BaseException, geo: str, url: str) -> NoReturn:
+    """Map an aiohttp / asyncio failure to DownloadError / RateLimitError."""
+    import aiohttp
+
+    if isinstance(error, _HTTPStatusError):
+        _handle_http_error(error.status, geo, url, error.headers)
+    if isinstance(error, aiohttp.ClientResponseError):
+        _handle_http_error(error.status, geo, url, error.headers)
+    if isinstance(error, aiohttp.ClientConnectorError):
+        raise DownloadError(
+            "Connection failed - cannot reach Google Trends\n\n"
+            "Possible causes:\n"
+            "• No internet connection\n"
+            "• DNS resolution failed\n"
+            "• Firewall blocking the request\n\n"
+            "Check your internet connection and try again."
+        )
+    if isinstance(error, asyncio.TimeoutError):
+        raise DownloadError(
+            "Request timed out after 10 seconds\n\n"
+            "Possible causes:\n"
+            "• Slow internet connection\n"
+            "• Google Trends is experiencing delays\n\n"
+            "Try again in a moment."
+        )
+    raise DownloadError(
+        f"Network error: {type(error).__name__}\n\n" f"Details: {error}\n" f"URL: {url}"
+    )
+
+
+def _handle_http_error(status_code: int, geo: str, url: str, headers: Any = None) -> NoReturn:
     """
     Raise appropriate exception based on HTTP status code.
 
     Provides specific, actionable error messages for common HTTP errors.
+    A 429 / 403 also tells the shared rate governor to back off (honoring the
+    response's ``Retry-After`` when ``headers`` are given).
     """
     if status_code == 429 or status_code == 403:
+        retry_after = _retry_after_seconds(headers)
+        get_rss_governor().on_throttle(retry_after)
         raise RateLimitError(
             f"Rate limit exceeded (HTTP {status_code})\n\n"
             "Google is temporarily blocking requests. Solutions:\n"
-            "• Wait 1-2 minutes before trying again\n"
-            "• Reduce request frequency (add delays between calls)\n"
-            "• Use caching: results are cached for 5 minutes by default\n"
-            "• For batch operations, use max_concurrent=5 or delay=0.5\n\n"
+            + (
+                f"• Google asked to wait {retry_after:.0f}s before trying again\n"
+                if retry_after
+                else "• Wait 1-2 minutes before trying again\n"
+            )
+            + "• Further RSS requests from this process are slowed down automatically\n"
+            "  (see get_rss_governor_stats)\n"
+            "• Use caching: results are cached for 5 minutes by default\n\n"
             f"Geo: {geo} | URL: {url}"
         )
     elif status_code == 404:
@@ -85,24 +766,99 @@ def _handle_http_error(status_code: int, geo: str, url: str) -> None:
         )
 
 
+#: Google's RSS extension namespace, in the ``{uri}tag`` form iterparse reports.
+_HT = "{https://trends.google.com/trending/rss}"
+_NEWS_ITEM = _HT + "news_item"
+#: Direct children of ``<item>`` -> trend field. ``<title>`` and ``<pubDate>``
+#: are un-namespaced RSS elements.
+_ITEM_FIELDS = {
+    "title": "trend",
+    _HT + "approx_traffic": "traffic",
+    "pubDate": "pub_date",
+    _HT + "picture": "picture",
+    _HT + "picture_source": "picture_source",
+}
+#: Direct children of ``<ht:news_item>`` -> article field.
+_ARTICLE_FIELDS = {
+    _HT + "news_item_title": "headline",
+    _HT + "news_item_url": "url",
+    _HT + "news_item_source": "source",
+    _HT + "news_item_picture": "image",
+}
+
+try:  # optional faster backend; the stdlib parser is always available
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - depends on the environment
+    _lxml_etree = None
+
+
+def _iterparse(xml_content: bytes) -> Iterable["tuple[str, Any]"]:
+    """``(event, element)`` pairs for end events, via lxml when installed."""
+    if _lxml_etree is not None:
+        return cast(
+            Iterable["tuple[str, Any]"],
+            _lxml_etree.iterparse(
+                BytesIO(xml_content),
+                events=("end",),
+                tag="item",
+                resolve_entities=False,
+                no_network=True,
+            ),
+        )
+    return ET.iterparse(BytesIO(xml_content), events=("end",))
+
+
+def _rss_items(xml_content: bytes, stream: bool) -> Iterator[Any]:
+    """The feed's ``<item>`` elements, each complete when yielded.
+
+    ``stream=True`` reads the feed with iterparse and frees every item once
+    the caller moves on (with lxml, its already-read siblings as well), so
+    memory stays bounded however large the feed. ``stream=False`` parses the
+    whole tree first, which is faster on a normal 10-20 item feed when only
+    the lean per-item fields are read.
+    """
+    if not stream:
+        if _lxml_etree is not None:
+            parser = _lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+            root = _lxml_etree.fromstring(xml_content, parser)
+        else:
+            root = ET.fromstring(xml_content)
+        yield from root.iter("item")
+        return
+    for _, elem in _iterparse(xml_content):
+        if elem.tag != "item":
+            continue
+        yield elem
+        elem.clear()  # finished item: free its subtree
+        if _lxml_etree is not None:
+            while elem.getprevious() is not None:  # and the emptied items before it
+                del elem.getparent()[0]
+
+
 def _parse_rss_xml(
     xml_content: bytes,
     geo: str,
     include_images: bool,
     include_articles: bool,
-    max_articles_per_trend: int,
+    max_articles_per_trend: Optional[int],
 ) -> List[Dict]:
     """
     Parse RSS XML content into list of trend dictionaries.
 
-    Shared parsing logic used by both sync and async downloaders.
+    Shared parsing logic used by both sync and async downloaders. Each
+    ``<item>`` is read once (a dict dispatch over its children instead of
+    repeated ``find()`` calls), and news articles are only walked when the
+    caller asked for them. When images or articles are requested the feed is
+    streamed and finished items are freed, so memory stays flat however large
+    the feed; a lean parse reads the whole (small) tree at once, which is
+    faster there (see ``_rss_items``).
 
     Args:
         xml_content: Raw XML bytes from RSS feed
         geo: Geographic code for explore links
         include_images: Include image URLs and sources
         include_articles: Include news articles data
-        max_articles_per_trend: Max news articles per trend
+        max_articles_per_trend: Max news articles per trend (None: all of them)
 
     Returns:
         List of trend dictionaries
@@ -110,83 +866,94 @@ def _parse_rss_xml(
     Raises:
         DownloadError: If XML parsing fails
     """
+    trends: List[Dict] = []
+
     try:
-        root = ET.fromstring(xml_content)
-    except ET.ParseError as e:
+        for elem in _rss_items(xml_content, stream=include_images or include_articles):
+            fields: Dict[str, Optional[str]] = {}
+            articles: List[Dict[str, Optional[str]]] = []
+            for child in elem:  # direct children only; the first match wins
+                if child.tag == _NEWS_ITEM:
+                    if include_articles and (
+                        max_articles_per_trend is None
+                        or max_articles_per_trend < 0
+                        or len(articles) < max_articles_per_trend
+                    ):
+                        article: Dict[str, Optional[str]] = {}
+                        for part in child:
+                            name = _ARTICLE_FIELDS.get(part.tag)
+                            if name is not None and name not in article:
+                                article[name] = part.text
+                        articles.append(
+                            {
+                                "headline": article.get("headline"),
+                                "url": article.get("url"),
+                                "source": article.get("source"),
+                                "image": article.get("image"),
+                            }
+                        )
+                    continue
+                name = _ITEM_FIELDS.get(child.tag)
+                if name is not None and name not in fields:
+                    fields[name] = child.text
+            trends.append(
+                _build_trend(
+                    fields, articles, geo, include_images, include_articles, max_articles_per_trend
+                )
+            )
+    except (ET.ParseError, SyntaxError) as e:  # lxml's XMLSyntaxError is a SyntaxError
         raise DownloadError(f"Failed to parse RSS XML: {e}")
 
-    # Define namespace
-    ns = {"ht": "https://trends.google.com/trending/rss"}
-
-    # Extract trend data
-    trends = []
-
-    for item in root.findall(".//item"):
-        # Basic info
-        title = item.find("title")
-        trend = title.text if title is not None else "N/A"
-
-        traffic_elem = item.find("ht:approx_traffic", ns)
-        traffic = traffic_elem.text if traffic_elem is not None else "N/A"
+    return trends
 
-        pub_date_elem = item.find("pubDate")
-        pub_date_str = pub_date_elem.text if pub_date_elem is not None else None
 
-        # Parse date to datetime
-        published: Union[datetime, str, None] = None
-        if pub_date_str:
-            try:
-                # RFC 2822 format: "Tue, 4 Nov 2025 03:00:00 -0800"
-                published = datetime.strptime(pub_date_str, "%a, %d %b %Y %H:%M:%S %z")
-            except ValueError:
-                # Fallback: keep as string
-                published = pub_date_str
-
-        # Build trend dict
-        trend_data: Dict = {
-            "trend": trend,
-            "traffic": traffic,
-            "traffic_min": _parse_traffic_to_min(traffic),
-            "published": published,
-            "explore_link": (
-                f"https://trends.google.com/trends/explore?q={trend}&geo={geo}&hl=en-US"
-            ),
+def _build_trend(
+    fields: Dict[str, Optional[str]],
+    articles: List[Dict[str, Optional[str]]],
+    geo: str,
+    include_images: bool,
+    include_articles: bool,
+    max_articles_per_trend: Optional[int],
+) -> Dict:
+    """Assemble one trend dict from the fields streamed out of an ``<item>``."""
+    trend = fields["trend"] if "trend" in fields else "N/A"
+    traffic = fields["traffic"] if "traffic" in fields else "N/A"
+    pub_date_str = fields.get("pub_date")
+
+    # Parse date to datetime
+    published: Union[datetime, str, None] = None
+    if pub_date_str:
+        try:
+            # RFC 2822 format: "Tue, 4 Nov 2025 03:00:00 -0800"
+            published = datetime.strptime(pub_date_str, "%a, %d %b %Y %H:%M:%S %z")
+        except ValueError:
+            # Fallback: keep as string
+            published = pub_date_str
+
+    # Build trend dict
+    trend_data: Dict = {
+        "trend": trend,
+        "traffic": traffic,
+        "traffic_min": _parse_traffic_to_min(traffic),
+        "published": published,
+        "explore_link": (f"https://trends.google.com/trends/explore?q={trend}&geo={geo}&hl=en-US"),
+    }
+
+    # Add image if requested
+    if include_images:
+        trend_data["image"] = {
+            "url": fields.get("picture"),
+            "source": fields.get("picture_source"),
         }
 
-        # Add image if requested
-        if include_images:
-            picture_elem = item.find("ht:picture", ns)
-            picture_source_elem = item.find("ht:picture_source", ns)
-
-            trend_data["image"] = {
-                "url": picture_elem.text if picture_elem is not None else None,
-                "source": picture_source_elem.text if picture_source_elem is not None else None,
-            }
-
-        # Add news articles if requested
-        if include_articles:
-            articles = []
-            news_items = item.findall("ht:news_item", ns)[:max_articles_per_trend]
-
-            for news in news_items:
-                headline_elem = news.find("ht:news_item_title", ns)
-                url_elem = news.find("ht:news_item_url", ns)
-                source_elem = news.find("ht:news_item_source", ns)
-                image_elem = news.find("ht:news_item_picture", ns)
-
-                article = {
-                    "headline": headline_elem.text if headline_elem is not None else None,
-                    "url": url_elem.text if url_elem is not None else None,
-                    "source": source_elem.text if source_elem is not None else None,
-                    "image": image_elem.text if image_elem is not None else None,
-                }
-                articles.append(article)
-
-            trend_data["news_articles"] = articles
-
-        trends.append(trend_data)
+    # Add news articles if requested (already capped while streaming; the
+    # slice keeps the historical meaning of a negative limit)
+    if include_articles:
+        trend_data["news_articles"] = (
+            articles if max_articles_per_trend is None else articles[:max_articles_per_trend]
+        )
 
-    return trends
+    return trend_data
 
 
 def _format_output(
@@ -352,6 +1119,87 @@ def _validate_geo_rss(geo: str) -> str:
     raise InvalidParameterError(error_msg)
 
 
+def _fetch_rss(
+    geo: str,
+    cache_key: str,
+    cache: Union[bool, str],
+    db_path: Optional[str],
+    session: Optional[requests.Session],
+    retry: RetryPolicy = DEFAULT_RSS_RETRY,
+) -> Tuple[List[Dict], bool]:
+    """Fetch, parse (at full fidelity) and cache one feed. Returns ``(trends, fetched)``.
+
+    ``fetched`` is False when the cache was filled by a concurrent caller
+    between the caller's own cache check and this call.
+    """
+    # Another caller may have filled the cache since our own check
+    cached_trends = _cached_trends(cache_key, cache, db_path)
+    if cached_trends is not None:
+        return cached_trends, False
+
+    # Build RSS URL
+    url = f"https://trends.google.com/trending/rss?geo={geo}"
+
+    if session is None:
+        session = _get_session()
+
+    # Revalidate whatever we saw last: an unchanged feed answers 304 (no body,
+    # no parse) instead of re-sending ~50-100KB of identical XML.
+    entry = _revalidation_entry(cache_key, cache == "disk", db_path)
+
+    headers = _conditional_headers(entry)
+    attempts: List[Dict[str, Any]] = []
+    started = time.monotonic()
+    while True:
+        attempt_started = time.monotonic()
+        try:
+            # Fetch RSS feed (pooled keep-alive connection), paced by the shared
+            # adaptive rate governor
+            with get_rss_governor().slot():
+                response = session.get(url, timeout=10, headers=headers)
+            response.raise_for_status()
+            refetch = _refetch_headers(response.status_code, entry, headers)
+            if refetch is None:
+                break
+            headers = refetch
+        except requests.RequestException as e:
+            failed = e.response if isinstance(e, requests.HTTPError) else None
+            status = failed.status_code if failed is not None else None
+            wait = _record_attempt(
+                retry,
+                attempts,
+                started,
+                attempt_started,
+                f"HTTP {status}" if status is not None else type(e).__name__,
+                transient=isinstance(e, (requests.ConnectionError, requests.Timeout))
+                or status in retry.retry_statuses,
+                status=status,
+                headers=failed.headers if failed is not None else None,
+            )
+            if wait is None:
+                try:
+                    _raise_request_error(e, geo, url)
+                except TrendspygException as error:
+                    raise _with_attempts(error, attempts) from e
+            time.sleep(wait)
+
+    get_rss_governor().on_success()
+
+    # Parse XML and extract trends using shared helper (skipped when unchanged)
+    trends, validators = _trends_from_response(
+        response.status_code,
+        response.content,
+        response.headers,
+        entry,
+        geo,
+        url,
+    )
+
+    # Store in cache (always store as dict for reuse with different output formats)
+    _store_fetched(cache_key, trends, validators, cache, db_path)
+    return trends, True
+
+
 def download_google_trends_rss(
     geo: str = DEFAULT_GEO,
     output_format: OutputFormat = "dict",
@@ -362,6 +1210,8 @@ def download_google_trends_rss(
     normalize: bool = False,
     archive: bool = False,
     db_path: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    retry: Optional[RetryPolicy] = None,
 ) -> Union[List[Dict], str, "pd.DataFrame", Dict[str, Any]]:
     """
     Download Google Trends RSS feed data with rich media content.
@@ -374,7 +1224,12 @@ def download_google_trends_rss(
 
     **Caching:** Results are cached for 5 minutes by default to reduce
     API calls and improve performance for repeated requests. Use `cache=False`
-    to bypass the cache and always fetch fresh data.
+    to bypass the cache and always fetch fresh data. Fresh fetches are
+    conditional: the last response's ETag / Last-Modified are sent back, and
+    an unchanged feed (a 304, or an identical body) reuses the last parse.
+    The cache holds one full parse per geo, so any include_images /
+    include_articles / max_articles_per_trend combination is served from it,
+    and concurrent callers missing on the same geo share one in-flight fetch.
 
     **Data Provided (RSS-specific):**
     - ✅ News article headlines and URLs
@@ -426,6 +1281,14 @@ def download_google_trends_rss(
             raising; the download always returns.
         db_path: Archive/disk-cache file (default: the TRENDSPYG_DB env var,
             else the platform data directory)
+        session: Optional requests.Session to send the request with. If not
+                 provided, a process-wide pooled keep-alive session is used
+                 (see configure_rss_session), so repeated calls reuse
+                 connections instead of re-doing the TLS handshake.
+        retry: RetryPolicy for transient failures (connection errors,
+               timeouts, 5xx). Default: 3 attempts with jittered exponential
+               backoff; RetryPolicy(max_attempts=1) disables retries. An error
+               raised after retries lists each attempt's timing.
 
     Returns:
         Depending on output_format:
@@ -509,83 +1372,173 @@ def download_google_trends_rss(
         raise InvalidParameterError(
             f"Invalid cache: '{cache}'. Valid options: True, False, 'disk'."
         )
+    if retry is not None and not isinstance(retry, RetryPolicy):
+        raise InvalidParameterError(f"retry must be a RetryPolicy or None, got {retry!r}")
 
     # Check cache first ('disk' = persistent cross-process cache in the archive
-    # DB; True = the in-process TTLCache; both honor the same configurable TTL)
-    cache_key = _make_cache_key(geo, include_images, include_articles, max_articles_per_trend)
-    use_disk_cache = cache == "disk"
-    if use_disk_cache:
-        cached_trends = _disk_cache_get_safely(cache_key, get_rss_cache().ttl, db_path=db_path)
-    elif cache:
-        cached_trends = get_rss_cache().get(cache_key)
-    else:
-        cached_trends = None
+    # DB; True = the in-process TTLCache; both honor the same configurable TTL).
+    # One full-fidelity parse per geo serves every include_* / article limit.
+    cache_key = _make_cache_key(geo)
+    cached_trends = _cached_trends(cache_key, cache, db_path)
     if cached_trends is not None:
+        return _rss_output(
+            cached_trends,
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+        )
+
+    flight_key = _flight_key(cache_key, cache, archive, db_path)
+    policy = retry if retry is not None else DEFAULT_RSS_RETRY
+
+    # Expired but inside the stale-while-revalidate window: answer at cache-hit
+    # speed and refresh behind the caller (on the shared session — the
+    # caller's may be closed by the time the refresh runs).
+    stale = _stale_trends(cache_key, cache, db_path)
+    if stale is not None and stale[1] <= get_rss_cache().stale_while_revalidate:
+        _refresh_in_background(
+            flight_key,
+            lambda: _fetch_rss(geo, cache_key, cache, db_path, None, policy),
+            _refresh_archiver(
+                archive, geo, db_path, include_images, include_articles, max_articles_per_trend
+            ),
+        )
+        _warn_revalidating(geo, stale[1])  # after scheduling: an "error" filter still refreshes
+        return _rss_output(
+            stale[0],
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+            stale=True,
+        )
+
+    # Concurrent misses for the same key share one fetch (single-flight), so a
+    # burst of identical requests costs exactly one upstream call.
+    try:
+        (full, fetched), shared = _single_flight(
+            flight_key,
+            lambda: _fetch_rss(geo, cache_key, cache, db_path, session, policy),
+        )
+    except TrendspygException as e:
+        # stale-if-error: a recently expired feed beats an exception
+        if not _serves_stale_on_error(stale, geo, e):
+            raise
+        return _rss_output(
+            cast(Tuple[List[Dict], float], stale)[0],
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+            stale=True,
+        )
+    trends = _project_trends(full, include_images, include_articles, max_articles_per_trend)
+
+    # Only fresh fetches are archived — cache hits (and callers that shared
+    # another caller's fetch) never produce near-duplicate history rows.
+    if normalize or (archive and fetched and not shared):
+        envelope = normalize_rss(trends, geo)
+        if archive and fetched and not shared:
+            _archive_snapshot(envelope, db_path)
         if normalize:
-            return normalize_rss(cached_trends, geo)
-        # Return cached data in requested format
-        return _format_output(cached_trends, output_format, include_images, include_articles)
+            return envelope
+    return _format_output(trends, output_format, include_images, include_articles)
+
+
+async def _fetch_rss_async(
+    geo: str,
+    cache_key: str,
+    cache: Union[bool, str],
+    db_path: Optional[str],
+    session: Optional["aiohttp.ClientSession"],
+    retry: RetryPolicy = DEFAULT_RSS_RETRY,
+) -> Tuple[List[Dict], bool]:
+    """Async counterpart of :func:`_fetch_rss`."""
+    import aiohttp
+
+    # Another caller may have filled the cache since our own check
+    cached_trends = _cached_trends(cache_key, cache, db_path)
+    if cached_trends is not None:
+        return cached_trends, False
 
     # Build RSS URL
     url = f"https://trends.google.com/trending/rss?geo={geo}"
 
-    try:
-        # Fetch RSS feed
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+    # Determine if we need to create our own session
+    close_session = session is None
+    entry = _revalidation_entry(cache_key, cache == "disk", db_path)
 
-    except requests.HTTPError as e:
-        # Handle HTTP errors with specific messages
-        _handle_http_error(e.response.status_code, geo, url)
+    headers = _conditional_headers(entry)
+    attempts: List[Dict[str, Any]] = []
+    started = time.monotonic()
+    try:
+        if session is None:
+            session = aiohttp.ClientSession()
 
-    except requests.ConnectionError:
-        raise DownloadError(
-            "Connection failed - cannot reach Google Trends\n\n"
-            "Possible causes:\n"
-            "• No internet connection\n"
-            "• DNS resolution failed\n"
-            "• Firewall blocking the request\n\n"
-            "Check your internet connection and try again."
-        )
+        while True:
+            attempt_started = time.monotonic()
+            try:
+                async with get_rss_governor().slot_async():
+                    async with session.get(
+                        url, timeout=aiohttp.ClientTimeout(total=10), headers=headers
+                    ) as response:
+                        if response.status >= 400:  # as raise_for_status() on the sync path
+                            raise _HTTPStatusError(response.status, response.headers)
+                        status = response.status
+                        response_headers = response.headers
+                        content = await response.read()
+                refetch = _refetch_headers(status, entry, headers)
+                if refetch is None:
+                    break
+                headers = refetch
+            except (_HTTPStatusError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                failed_status: Optional[int] = None
+                if isinstance(e, (_HTTPStatusError, aiohttp.ClientResponseError)):
+                    failed_status = e.status
+                wait = _record_attempt(
+                    retry,
+                    attempts,
+                    started,
+                    attempt_started,
+                    (f"HTTP {failed_status}" if failed_status is not None else type(e).__name__),
+                    transient=isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+                    or failed_status in retry.retry_statuses,
+                    status=failed_status,
+                    headers=getattr(e, "headers", None),
+                )
+                if wait is None:
+                    try:
+                        _raise_async_request_error(e, geo, url)
+                    except TrendspygException as error:
+                        raise _with_attempts(error, attempts) from e
+                await asyncio.sleep(wait)
 
-    except requests.Timeout:
-        raise DownloadError(
-            "Request timed out after 10 seconds\n\n"
-            "Possible causes:\n"
-            "• Slow internet connection\n"
-            "• Google Trends is experiencing delays\n\n"
-            "Try again in a moment."
-        )
+    finally:
+        if close_session and session is not None:
+            await session.close()
 
-    except requests.RequestException as e:
-        raise DownloadError(
-            f"Network error: {type(e).__name__}\n\n" f"Details: {e}\n" f"URL: {url}"
-        )
+    get_rss_governor().on_success()
 
-    # Parse XML and extract trends using shared helper
-    trends = _parse_rss_xml(
-        xml_content=response.content,
-        geo=geo,
-        include_images=include_images,
-        include_articles=include_articles,
-        max_articles_per_trend=max_articles_per_trend,
+    # Parse XML and extract trends using shared helper (skipped when unchanged)
+    trends, validators = _trends_from_response(
+        status,
+        content,
+        response_headers,
+        entry,
+        geo,
+        url,
     )
 
-    # Store in cache (always store as dict for reuse with different output formats)
-    if use_disk_cache:
-        _disk_cache_set_safely(cache_key, trends, get_rss_cache().ttl, db_path=db_path)
-    elif cache:
-        get_rss_cache().set(cache_key, trends)
-
-    # Only fresh fetches are archived — cache hits never produce
-    # near-duplicate history rows.
-    if normalize or archive:
-        envelope = normalize_rss(trends, geo)
-        if archive:
-            _store_snapshot_safely(envelope, db_path=db_path)
-        if normalize:
-            return envelope
-    return _format_output(trends, output_format, include_images, include_articles)
+    # Store in cache
+    _store_fetched(cache_key, trends, validators, cache, db_path)
+    return trends, True
 
 
 async def download_google_trends_rss_async(
@@ -599,6 +1552,7 @@ async def download_google_trends_rss_async(
     normalize: bool = False,
     archive: bool = False,
     db_path: Optional[str] = None,
+    retry: Optional[RetryPolicy] = None,
 ) -> Union[List[Dict], str, "pd.DataFrame", Dict[str, Any]]:
     """
     Async version of download_google_trends_rss for concurrent fetching.
@@ -611,6 +1565,7 @@ async def download_google_trends_rss_async(
 
     **Caching:** Results are cached for 5 minutes by default (shared with sync version).
     Use `cache=False` to bypass the cache and always fetch fresh data.
+    Concurrent coroutines missing on the same request await one shared fetch.
 
     **Performance comparison:**
     ```python
@@ -649,6 +1604,8 @@ async def download_google_trends_rss_async(
             (write failures warn instead of raising)
         db_path: Archive/disk-cache file (default: TRENDSPYG_DB env var,
             else the platform data directory)
+        retry: RetryPolicy for transient failures (default: 3 attempts with
+               jittered exponential backoff, as in the sync version)
 
     Returns:
         Depending on output_format:
@@ -701,7 +1658,7 @@ async def download_google_trends_rss_async(
         Requires aiohttp: pip install trendspyg[async]
     """
     try:
-        import aiohttp
+        import aiohttp  # noqa: F401 - fail fast before any cache lookup
     except ImportError:
         raise ImportError(
             "aiohttp is required for async operations.\n"
@@ -723,91 +1680,79 @@ async def download_google_trends_rss_async(
         raise InvalidParameterError(
             f"Invalid cache: '{cache}'. Valid options: True, False, 'disk'."
         )
+    if retry is not None and not isinstance(retry, RetryPolicy):
+        raise InvalidParameterError(f"retry must be a RetryPolicy or None, got {retry!r}")
 
     # Check cache first ('disk' = persistent cross-process cache in the archive
-    # DB; True = the in-process TTLCache; both honor the same configurable TTL)
-    cache_key = _make_cache_key(geo, include_images, include_articles, max_articles_per_trend)
-    use_disk_cache = cache == "disk"
-    if use_disk_cache:
-        cached_trends = _disk_cache_get_safely(cache_key, get_rss_cache().ttl, db_path=db_path)
-    elif cache:
-        cached_trends = get_rss_cache().get(cache_key)
-    else:
-        cached_trends = None
+    # DB; True = the in-process TTLCache; both honor the same configurable TTL).
+    # One full-fidelity parse per geo serves every include_* / article limit.
+    cache_key = _make_cache_key(geo)
+    cached_trends = _cached_trends(cache_key, cache, db_path)
     if cached_trends is not None:
-        if normalize:
-            return normalize_rss(cached_trends, geo)
-        # Return cached data in requested format
-        return _format_output(cached_trends, output_format, include_images, include_articles)
-
-    # Build RSS URL
-    url = f"https://trends.google.com/trending/rss?geo={geo}"
+        return _rss_output(
+            cached_trends,
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+        )
 
-    # Determine if we need to create our own session
-    close_session = session is None
+    flight_key = _flight_key(cache_key, cache, archive, db_path)
+    policy = retry if retry is not None else DEFAULT_RSS_RETRY
+
+    # Expired but inside the stale-while-revalidate window: answer now and
+    # refresh in a task with its own session (the caller's may be closed by then)
+    stale = _stale_trends(cache_key, cache, db_path)
+    if stale is not None and stale[1] <= get_rss_cache().stale_while_revalidate:
+        _refresh_in_background_async(
+            flight_key,
+            lambda: _fetch_rss_async(geo, cache_key, cache, db_path, None, policy),
+            _refresh_archiver(
+                archive, geo, db_path, include_images, include_articles, max_articles_per_trend
+            ),
+        )
+        _warn_revalidating(geo, stale[1])  # after scheduling: an "error" filter still refreshes
+        return _rss_output(
+            stale[0],
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+            stale=True,
+        )
 
+    # Concurrent misses for the same key share one fetch (one future per key)
     try:
-        if session is None:
-            session = aiohttp.ClientSession()
-
-        try:
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    _handle_http_error(response.status, geo, url)
-                content = await response.read()
-
-        except aiohttp.ClientResponseError as e:
-            _handle_http_error(e.status, geo, url)
-
-        except aiohttp.ClientConnectorError:
-            raise DownloadError(
-                "Connection failed - cannot reach Google Trends\n\n"
-                "Possible causes:\n"
-                "• No internet connection\n"
-                "• DNS resolution failed\n"
-                "• Firewall blocking the request\n\n"
-                "Check your internet connection and try again."
-            )
-
-        except asyncio.TimeoutError:
-            raise DownloadError(
-                "Request timed out after 10 seconds\n\n"
-                "Possible causes:\n"
-                "• Slow internet connection\n"
-                "• Google Trends is experiencing delays\n\n"
-                "Try again in a moment."
-            )
-
-        except aiohttp.ClientError as e:
-            raise DownloadError(
-                f"Network error: {type(e).__name__}\n\n" f"Details: {e}\n" f"URL: {url}"
-            )
-
-    finally:
-        if close_session and session is not None:
-            await session.close()
-
-    # Parse XML and extract trends using shared helper
-    trends = _parse_rss_xml(
-        xml_content=content,
-        geo=geo,
-        include_images=include_images,
-        include_articles=include_articles,
-        max_articles_per_trend=max_articles_per_trend,
-    )
-
-    # Store in cache
-    if use_disk_cache:
-        _disk_cache_set_safely(cache_key, trends, get_rss_cache().ttl, db_path=db_path)
-    elif cache:
-        get_rss_cache().set(cache_key, trends)
+        (full, fetched), shared = await _single_flight_async(
+            flight_key,
+            lambda: _fetch_rss_async(geo, cache_key, cache, db_path, session, policy),
+        )
+    except TrendspygException as e:
+        # stale-if-error: a recently expired feed beats an exception
+        if not _serves_stale_on_error(stale, geo, e):
+            raise
+        return _rss_output(
+            cast(Tuple[List[Dict], float], stale)[0],
+            geo,
+            output_format,
+            normalize,
+            include_images,
+            include_articles,
+            max_articles_per_trend,
+            stale=True,
+        )
+    trends = _project_trends(full, include_images, include_articles, max_articles_per_trend)
 
-    # Only fresh fetches are archived — cache hits never produce
-    # near-duplicate history rows.
-    if normalize or archive:
+    # Only fresh fetches are archived — cache hits (and callers that shared
+    # another caller's fetch) never produce near-duplicate history rows.
+    if normalize or (archive and fetched and not shared):
         envelope = normalize_rss(trends, geo)
-        if archive:
-            _store_snapshot_safely(envelope, db_path=db_path)
+        if archive and fetched and not shared:
+            _archive_snapshot(envelope, db_path)
         if normalize:
             return envelope
     return _format_output(trends, output_format, include_images, include_articles)
@@ -823,6 +1768,10 @@ def download_google_trends_rss_batch(
     normalize: bool = False,
     archive: bool = False,
     db_path: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    max_workers: Optional[int] = None,
+    ordered: bool = True,
+    retry: Optional[RetryPolicy] = None,
 ) -> Dict[str, Union[List[Dict], Dict[str, Any]]]:
     """
     Download RSS trends for multiple countries/regions with progress tracking.
@@ -840,18 +1789,33 @@ def download_google_trends_rss_batch(
                Use 0.5-1.0 if you're fetching many countries to avoid rate limits
         normalize: If True, each geo maps to a NormalizedEnvelope instead of a
                    raw trend list. See trendspyg.types.NormalizedEnvelope.
-        archive: Also record each fresh fetch in the local archive DB
-                 (write failures warn instead of raising)
+        archive: Also record each fresh fetch in the local archive DB, in one
+                 transaction when the sweep ends (write failures warn instead
+                 of raising)
         db_path: Archive file (default: TRENDSPYG_DB env var, else the
                  platform data directory)
+        session: Optional requests.Session shared by every fetch in the
+                 batch (default: the process-wide pooled session, so the
+                 whole sweep runs over a handful of keep-alive connections)
+        max_workers: Fetch in parallel on a thread pool of this size
+                     (default: None = one geo at a time). No aiohttp needed;
+                     every worker shares the pooled session, so keep this at
+                     or below its pool size (10, see configure_rss_session).
+                     With a delay, requests are *started* delay seconds apart.
+        ordered: With max_workers, return geos in input order (default) or,
+                 if False, in the order their fetches completed
+        retry: RetryPolicy applied to each geo's fetch (default: 3 attempts
+               with jittered exponential backoff), so one transient error no
+               longer aborts a sweep
 
     Returns:
         Dict mapping geo code to list of trends: {'US': [...], 'GB': [...]}
         (or geo -> NormalizedEnvelope dict when normalize=True)
 
     Raises:
-        InvalidParameterError: If any geo code is invalid
-        DownloadError: If any RSS fetch fails
+        InvalidParameterError: If any geo code or max_workers is invalid
+        DownloadError: If any RSS fetch fails (in parallel mode, fetches not
+            yet started are cancelled)
 
     Examples:
         >>> # Fetch 5 countries with progress bar
@@ -867,14 +1831,24 @@ def download_google_trends_rss_batch(
         ... )
         Fetching trends: 100%|██████████| 125/125 [01:05<00:00, 1.9 geo/s]
 
+        >>> # Same sweep on 10 threads (~3-5s, no aiohttp required)
+        >>> results = download_google_trends_rss_batch(list(COUNTRIES.keys()), max_workers=10)
+
     Warning:
         Fetching many countries (>50) without delay may trigger Google rate limits.
-        If you get blocked, wait a few minutes and add delay=0.5 or delay=1.0.
+        Every fetch is paced by the shared adaptive rate governor, which backs
+        off on 429/403 (honoring Retry-After) and speeds back up while Google
+        answers normally; delay= adds a fixed floor on top of it.
 
     Note:
-        For maximum speed with many countries, use the async version:
-        `download_google_trends_rss_batch_async()` which fetches in parallel.
+        For parallel fetching without threads, use the async version:
+        `download_google_trends_rss_batch_async()`.
     """
+    if max_workers is not None and (
+        isinstance(max_workers, bool) or not isinstance(max_workers, int) or max_workers < 1
+    ):
+        raise InvalidParameterError(f"max_workers must be an integer >= 1, got {max_workers!r}")
+
     try:
         from tqdm import tqdm
 
@@ -890,12 +1864,10 @@ def download_google_trends_rss_batch(
 
     results: Dict[str, Union[List[Dict], Dict[str, Any]]] = {}
 
-    # Create iterator with optional progress bar
-    iterator: Iterable[str] = geos
-    if show_progress and has_tqdm:
-        iterator = tqdm(geos, desc="Fetching trends", unit="geo")
+    pending: List[Dict[str, Any]] = []
 
-    for geo in iterator:
+    def fetch_into_batch(geo: str) -> Union[List[Dict], Dict[str, Any]]:
+        _pending_snapshots.set(pending)
         trends = download_google_trends_rss(
             geo=geo,
             output_format="dict",
@@ -905,16 +1877,70 @@ def download_google_trends_rss_batch(
             normalize=normalize,
             archive=archive,
             db_path=db_path,
+            session=session,
+            retry=retry,
         )
-        results[geo] = cast(Union[List[Dict], Dict[str, Any]], trends)
-
-        # Optional delay between requests
-        if delay > 0:
-            import time
+        return cast(Union[List[Dict], Dict[str, Any]], trends)
 
-            time.sleep(delay)
+    def fetch(geo: str) -> Union[List[Dict], Dict[str, Any]]:
+        # A fresh context per geo, so pool threads never keep the queue set
+        return copy_context().run(fetch_into_batch, geo)
 
-    return results
+    try:
+        if max_workers is None:
+            # Create iterator with optional progress bar
+            iterator: Iterable[str] = geos
+            if show_progress and has_tqdm:
+                iterator = tqdm(geos, desc="Fetching trends", unit="geo")
+
+            for geo in iterator:
+                results[geo] = fetch(geo)
+
+                # Optional delay between requests
+                if delay > 0:
+                    time.sleep(delay)
+
+            return results
+
+        # Thread-pool mode: the GIL is released while a worker waits on the
+        # network, so N workers on the shared keep-alive pool give async-level
+        # throughput from plain sync code.
+        progress = (
+            tqdm(total=len(geos), desc="Fetching trends", unit="geo")
+            if show_progress and has_tqdm
+            else None
+        )
+        futures: Dict["Future[Union[List[Dict], Dict[str, Any]]]", str] = {}
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="trendspyg-rss"
+            ) as pool:
+                try:
+                    for i, geo in enumerate(geos):
+                        if i and delay > 0:
+                            time.sleep(delay)
+                        future = pool.submit(fetch, geo)
+                        if progress is not None:
+                            future.add_done_callback(lambda _: progress.update(1))
+                        futures[future] = geo
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                except BaseException:
+                    # Fail like the sequential loop: don't start the rest
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            if progress is not None:
+                progress.close()
+
+        if ordered:
+            return {geo: results[geo] for geo in geos}
+        return results
+    finally:
+        # Every fresh fetch of the sweep (even if a later geo failed), one transaction
+        if pending:
+            _store_snapshots_safely(pending, db_path=db_path)
 
 
 async def download_google_trends_rss_batch_async(
@@ -927,6 +1953,7 @@ async def download_google_trends_rss_batch_async(
     normalize: bool = False,
     archive: bool = False,
     db_path: Optional[str] = None,
+    retry: Optional[RetryPolicy] = None,
 ) -> Dict[str, Union[List[Dict], Dict[str, Any]]]:
     """
     Download RSS trends for multiple countries/regions in parallel with progress.
@@ -940,14 +1967,17 @@ async def download_google_trends_rss_batch_async(
         include_articles: Include news articles data
         max_articles_per_trend: Max news articles per trend (default: 5)
         show_progress: Show tqdm progress bar (default: True)
-        max_concurrent: Maximum concurrent requests (default: 10)
-                       Lower this if you get rate limited (try 5 or 3)
+        max_concurrent: Maximum concurrent requests (default: 10). The shared
+                       rate governor may allow fewer while Google is throttling.
         normalize: If True, each geo maps to a NormalizedEnvelope instead of a
                    raw trend list. See trendspyg.types.NormalizedEnvelope.
-        archive: Also record each fresh fetch in the local archive DB
-                 (write failures warn instead of raising)
+        archive: Also record each fresh fetch in the local archive DB, in one
+                 transaction when the sweep ends (write failures warn instead
+                 of raising)
         db_path: Archive file (default: TRENDSPYG_DB env var, else the
                  platform data directory)
+        retry: RetryPolicy applied to each geo's fetch (default: 3 attempts
+               with jittered exponential backoff)
 
     Returns:
         Dict mapping geo code to list of trends: {'US': [...], 'GB': [...]}
@@ -982,16 +2012,15 @@ async def download_google_trends_rss_batch_async(
         - Uses connection pooling for efficiency
 
     Warning:
-        High concurrency (>20) may trigger Google rate limits.
-        If you get errors, reduce max_concurrent to 5 or 3.
+        High concurrency (>20) may trigger Google rate limits. The shared
+        adaptive rate governor backs off automatically on 429/403 (see
+        get_rss_governor_stats); max_concurrent is a hard cap on top of it.
 
     Note:
         Requires aiohttp: pip install trendspyg[async]
     """
     try:
-        import asyncio
-
-        import aiohttp
+        import aiohttp  # noqa: F401 - fail fast before the progress bar
     except ImportError:
         raise ImportError(
             "aiohttp is required for async batch operations.\n"
@@ -1012,37 +2041,210 @@ async def download_google_trends_rss_batch_async(
             )
 
     results: Dict[str, Union[List[Dict], Dict[str, Any]]] = {}
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def fetch_one(session: "aiohttp.ClientSession", geo: str) -> tuple:
-        async with semaphore:
-            trends = await download_google_trends_rss_async(
-                geo=geo,
-                output_format="dict",
-                include_images=include_images,
-                include_articles=include_articles,
-                max_articles_per_trend=max_articles_per_trend,
-                session=session,
-                normalize=normalize,
-                archive=archive,
-                db_path=db_path,
-            )
-            return geo, trends
-
-    async with aiohttp.ClientSession() as session:
-        tasks = [fetch_one(session, geo) for geo in geos]
-
-        if show_progress and has_tqdm:
-            # Use tqdm async progress bar
-            async for result in atqdm(
-                asyncio.as_completed(tasks), total=len(tasks), desc="Fetching trends", unit="geo"
-            ):
-                geo, trends = await result
-                results[geo] = trends
-        else:
-            # Without progress bar
-            for coro in asyncio.as_completed(tasks):
-                geo, trends = await coro
-                results[geo] = trends
+    progress = (
+        atqdm(total=len(geos), desc="Fetching trends", unit="geo")
+        if show_progress and has_tqdm
+        else None
+    )
+    stream = iter_google_trends_rss_batch_async(
+        geos,
+        include_images=include_images,
+        include_articles=include_articles,
+        max_articles_per_trend=max_articles_per_trend,
+        max_concurrent=max_concurrent,
+        normalize=normalize,
+        archive=archive,
+        db_path=db_path,
+        retry=retry,
+    )
+    try:
+        async for geo, trends in stream:
+            # All-or-nothing: the first failure aborts the sweep (use
+            # iter_google_trends_rss_batch_async to keep partial results)
+            if isinstance(trends, Exception):
+                raise trends
+            results[geo] = trends
+            if progress is not None:
+                progress.update(1)
+    finally:
+        await stream.aclose()
+        if progress is not None:
+            progress.close()
 
     return results
+
+
+BatchResult = Union[List[Dict], Dict[str, Any], Exception]
+
+
+async def iter_google_trends_rss_batch_async(
+    geos: List[str],
+    include_images: bool = True,
+    include_articles: bool = True,
+    max_articles_per_trend: int = 5,
+    max_concurrent: int = 10,
+    timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    normalize: bool = False,
+    archive: bool = False,
+    db_path: Optional[str] = None,
+    session: Optional["aiohttp.ClientSession"] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> AsyncGenerator[Tuple[str, BatchResult], None]:
+    """
+    Fetch RSS trends for many geos, yielding each result as soon as it lands.
+
+    The streaming, failure-tolerant form of download_google_trends_rss_batch_async:
+    every geo is yielded exactly once as ``(geo, result)``, where ``result``
+    is the trend list (or NormalizedEnvelope when normalize=True) or the
+    exception that geo raised. One bad geo never loses the others, and
+    archiving or alerting can start on the first country instead of waiting
+    for the slowest.
+
+    Args:
+        geos: List of geo codes (e.g., ['US', 'GB', 'CA', 'AU'])
+        include_images: Include image URLs and sources
+        include_articles: Include news articles data
+        max_articles_per_trend: Max news articles per trend (default: 5)
+        max_concurrent: Maximum fetches in flight at once (default: 10).
+                       Geos are started as earlier ones finish, so no more
+                       than this many tasks exist at any time.
+        timeout: Seconds allowed per geo (default: None = the request's own
+                 10s network timeout). A geo that runs over yields DownloadError.
+        deadline: Seconds allowed for the whole sweep (default: None). When it
+                  passes, fetches still running are cancelled and they, plus
+                  any geos not yet started, yield DownloadError.
+        normalize: Yield NormalizedEnvelope dicts instead of raw trend lists
+        archive: Also record each fresh fetch in the local archive DB, in one
+                 transaction when the sweep ends (write failures warn instead
+                 of raising)
+        db_path: Archive file (default: TRENDSPYG_DB env var, else the
+                 platform data directory)
+        session: Optional aiohttp.ClientSession shared by every fetch. If not
+                 provided, one is created for the sweep and closed after it.
+        retry: RetryPolicy applied to each geo's fetch (default: 3 attempts
+               with jittered exponential backoff). A per-geo timeout covers
+               all of that geo's attempts.
+
+    Yields:
+        ``(geo, result)`` tuples in completion order, where ``result`` is the
+        geo's data or the Exception it raised (InvalidParameterError for a bad
+        geo code, DownloadError / RateLimitError for fetch failures)
+
+    Raises:
+        InvalidParameterError: If max_concurrent, timeout or deadline is invalid
+        ImportError: If aiohttp is not installed
+
+    Examples:
+        >>> async def sweep():
+        ...     async for geo, result in iter_google_trends_rss_batch_async(
+        ...         list(COUNTRIES), timeout=5, deadline=60
+        ...     ):
+        ...         if isinstance(result, Exception):
+        ...             print(f"{geo}: failed ({result})")
+        ...         else:
+        ...             print(f"{geo}: {len(result)} trends")
+        >>> asyncio.run(sweep())
+
+    Note:
+        Requires aiohttp: pip install trendspyg[async]
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "aiohttp is required for async batch operations.\n"
+            "Install with: pip install trendspyg[async]"
+        )
+
+    if (
+        isinstance(max_concurrent, bool)
+        or not isinstance(max_concurrent, int)
+        or max_concurrent < 1
+    ):
+        raise InvalidParameterError(
+            f"max_concurrent must be an integer >= 1, got {max_concurrent!r}"
+        )
+    for name, value in (("timeout", timeout), ("deadline", deadline)):
+        if value is not None and (isinstance(value, bool) or not value > 0):
+            raise InvalidParameterError(f"{name} must be a positive number of seconds or None")
+
+    loop = asyncio.get_running_loop()
+    stop_at = None if deadline is None else loop.time() + deadline
+    waiting = iter(geos)
+    running: Dict["asyncio.Future[Any]", str] = {}
+    close_session = session is None
+    if session is None:
+        session = aiohttp.ClientSession()
+
+    pending: List[Dict[str, Any]] = []
+
+    async def fetch_one(geo: str) -> Union[List[Dict], Dict[str, Any]]:
+        _pending_snapshots.set(pending)  # each fetch runs in its own task context
+        fetch = download_google_trends_rss_async(
+            geo=geo,
+            output_format="dict",
+            include_images=include_images,
+            include_articles=include_articles,
+            max_articles_per_trend=max_articles_per_trend,
+            session=session,
+            normalize=normalize,
+            archive=archive,
+            db_path=db_path,
+            retry=retry,
+        )
+        if timeout is None:
+            return cast(Union[List[Dict], Dict[str, Any]], await fetch)
+        try:
+            return cast(Union[List[Dict], Dict[str, Any]], await asyncio.wait_for(fetch, timeout))
+        except asyncio.TimeoutError:
+            raise DownloadError(f"Timed out after {timeout}s fetching RSS for '{geo}'")
+
+    try:
+        while True:
+            # Top up to max_concurrent; later geos start only as slots free up
+            while len(running) < max_concurrent:
+                geo = next(waiting, None)
+                if geo is None:
+                    break
+                running[asyncio.ensure_future(fetch_one(geo))] = geo
+            if not running:
+                return
+
+            remaining = None if stop_at is None else stop_at - loop.time()
+            done: "set[asyncio.Future[Any]]" = set()
+            if remaining is None or remaining > 0:
+                done, _ = await asyncio.wait(
+                    running, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+            if not done:
+                break  # sweep deadline passed
+
+            for task in done:
+                geo = running.pop(task)
+                error = task.exception()
+                if error is not None and not isinstance(error, Exception):
+                    raise error  # KeyboardInterrupt and friends are not results
+                yield geo, error if error is not None else task.result()
+
+        # Deadline: everything unfinished or never started fails the same way
+        unfinished = list(running.values()) + list(waiting)
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        running.clear()
+        for geo in unfinished:
+            yield geo, DownloadError(
+                f"Batch deadline of {deadline}s passed before '{geo}' finished"
+            )
+    finally:
+        # Early exit (break / aclose / error): don't leave fetches running
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if close_session:
+            await session.close()
+        # The sweep's fresh fetches go to the archive in one transaction
+        if pending:
+            _store_snapshots_safely(pending, db_path=db_path)
@@ -1,12 +1,36 @@
 """Utility functions for trendspy."""
 
+import asyncio
+import heapq
 import os
+import random
 import re
+import sys
 import threading
 import time
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar, cast
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from .exceptions import InvalidParameterError, RateLimitError
 
 # Type variable for generic function
 F = TypeVar("F", bound=Callable[..., Any])
@@ -40,15 +64,123 @@ def _parse_traffic_to_min(traffic: Optional[str]) -> int:
     return int(value * _TRAFFIC_SUFFIX.get(suffix, 1))
 
 
+def _approx_size(value: Any) -> int:
+    """Rough deep size of ``value`` in bytes, counting each object once.
+
+    ``sys.getsizeof`` of the object plus everything reachable through dicts,
+    lists, tuples and sets — enough to tell a lean payload from a full one
+    with news articles, not an exact heap measurement.
+    """
+    seen = set()
+    size = 0
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return size
+
+
+class _CacheShard(Generic[T]):
+    """One lock's worth of a :class:`TTLCache`: entries in LRU order plus an expiry heap."""
+
+    __slots__ = (
+        "lock",
+        "entries",
+        "expiries",
+        "max_size",
+        "max_bytes",
+        "bytes",
+        "hits",
+        "misses",
+        "stale_hits",
+    )
+
+    def __init__(self, max_size: int, max_bytes: Optional[int]) -> None:
+        self.lock = threading.Lock()
+        # key -> (value, expiry_time, approx_bytes), least recently used first
+        self.entries: "OrderedDict[str, Tuple[T, float, int]]" = OrderedDict()
+        # (expiry_time, key) min-heap. Heap items for keys since re-set or
+        # dropped are left in place and skipped when they surface.
+        self.expiries: List[Tuple[float, str]] = []
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def drop(self, key: str) -> None:
+        """Remove ``key`` (which must be present) and release its bytes."""
+        self.bytes -= self.entries.pop(key)[2]
+
+    def put(self, key: str, value: T, expiry: float, nbytes: int) -> None:
+        """Insert or replace ``key`` as the most recently used entry."""
+        if key in self.entries:
+            self.drop(key)
+        self.entries[key] = (value, expiry, nbytes)
+        self.bytes += nbytes
+        heapq.heappush(self.expiries, (expiry, key))
+        if len(self.expiries) > 2 * len(self.entries) + 64:
+            # mostly dead items (keys re-set over and over): rebuild
+            self.expiries = [(entry[1], k) for k, entry in self.entries.items()]
+            heapq.heapify(self.expiries)
+
+    def over_budget(self, extra_entries: int = 0, extra_bytes: int = 0) -> bool:
+        """Whether the shard would exceed its entry or byte budget."""
+        if len(self.entries) + extra_entries > self.max_size:
+            return True
+        return self.max_bytes is not None and self.bytes + extra_bytes > self.max_bytes
+
+    def make_room(self, now: float, grace: float, entries: int = 1, nbytes: int = 0) -> None:
+        """Evict until ``entries`` more entries totalling ``nbytes`` fit.
+
+        Expired entries go first, then the least recently used.
+        """
+        if not self.over_budget(entries, nbytes):
+            return
+        self.evict_expired(now, grace)
+        while self.entries and self.over_budget(entries, nbytes):
+            self.drop(next(iter(self.entries)))
+
+    def evict_expired(self, now: float, grace: float) -> int:
+        """Drop entries past expiry + ``grace``, soonest first: O(log n) each."""
+        evicted = 0
+        expiries = self.expiries
+        while expiries and expiries[0][0] + grace <= now:
+            expiry, key = heapq.heappop(expiries)
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] == expiry:
+                self.drop(key)
+                evicted += 1
+        return evicted
+
+
 class TTLCache(Generic[T]):
     """
     Thread-safe TTL (Time-To-Live) cache for storing temporary data.
 
     Features:
-    - Automatic expiration based on TTL
-    - Thread-safe operations
-    - Maximum size limit with LRU-style eviction
-    - Cache statistics (hits, misses)
+    - Automatic expiration based on TTL, with optional per-entry TTLs
+    - Thread-safe operations, optionally striped over several locks
+    - Maximum size limit (entries, and optionally approximate bytes) with
+      least-recently-used eviction
+    - Optional grace windows past the TTL (stale-while-revalidate /
+      stale-if-error) during which expired values stay readable via
+      ``get_stale``
+    - Cache statistics (hits, misses, stale hits, resident bytes)
+
+    Reads and writes are O(1) (an ordered dict moves a hit to the MRU end);
+    expired entries are found through a min-heap of expiry times, so making
+    room costs O(log n) instead of a scan, and a burst of one-off keys evicts
+    the coldest entries rather than the oldest-inserted hot ones.
 
     Example:
         >>> cache = TTLCache(ttl=300, max_size=100)  # 5 min TTL, max 100 items
@@ -57,20 +189,60 @@ class TTLCache(Generic[T]):
         >>> cache.clear()  # Clear all cached data
     """
 
-    def __init__(self, ttl: float = 300.0, max_size: int = 256):
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_size: int = 256,
+        stale_while_revalidate: float = 0.0,
+        stale_if_error: float = 0.0,
+        stripes: int = 1,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
         """
         Initialize TTL cache.
 
         Args:
             ttl: Time-to-live in seconds (default: 300 = 5 minutes)
             max_size: Maximum number of items to cache (default: 256)
+            stale_while_revalidate: Seconds past the TTL during which an
+                expired value may be served while it is refreshed (default: 0)
+            stale_if_error: Seconds past the TTL during which an expired value
+                may stand in for a failed refresh (default: 0)
+            stripes: Independent locks the keys are spread over (default: 1).
+                More stripes cut lock contention in heavily threaded servers;
+                ``max_size`` is then split evenly between them, so LRU order
+                is kept per stripe.
+            max_bytes: Budget for the approximate size of all values (default:
+                None = entry count only). Least recently used entries are
+                evicted to stay under it; a value larger than the whole budget
+                is not cached.
+            sizeof: Size estimator for values (default: a deep
+                ``sys.getsizeof``)
+
+        Raises:
+            InvalidParameterError: If stripes or max_bytes is invalid
         """
-        self._cache: Dict[str, Tuple[T, float]] = {}  # key -> (value, expiry_time)
+        if isinstance(stripes, bool) or not isinstance(stripes, int) or stripes < 1:
+            raise InvalidParameterError(f"stripes must be an integer >= 1, got {stripes!r}")
         self._ttl = ttl
         self._max_size = max_size
-        self._lock = threading.RLock()
-        self._hits = 0
-        self._misses = 0
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self._sizeof = sizeof if sizeof is not None else _approx_size
+        per_stripe = -(-max_size // stripes)  # ceil: never below max_size in total
+        self._shards: List[_CacheShard[T]] = [_CacheShard(per_stripe, None) for _ in range(stripes)]
+        self._max_bytes: Optional[int] = None
+        self.max_bytes = max_bytes
+
+    @property
+    def _grace(self) -> float:
+        """How long past its expiry an entry is kept for stale reads."""
+        return max(self.stale_while_revalidate, self.stale_if_error, 0.0)
+
+    def _shard(self, key: str) -> _CacheShard[T]:
+        shards = self._shards
+        return shards[hash(key) % len(shards)] if len(shards) > 1 else shards[0]
 
     def get(self, key: str) -> Optional[T]:
         """
@@ -82,71 +254,119 @@ class TTLCache(Generic[T]):
         Returns:
             Cached value or None if not found/expired
         """
-        with self._lock:
-            if key in self._cache:
-                value, expiry = self._cache[key]
-                if time.time() < expiry:
-                    self._hits += 1
-                    return value
-                else:
-                    # Expired, remove it
-                    del self._cache[key]
-            self._misses += 1
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None:
+                now = time.time()
+                if now < entry[1]:
+                    shard.entries.move_to_end(key)
+                    shard.hits += 1
+                    return entry[0]
+                elif now >= entry[1] + self._grace:
+                    # Expired (and past any grace window), remove it
+                    shard.drop(key)
+            shard.misses += 1
             return None
 
-    def set(self, key: str, value: T) -> None:
+    def get_stale(self, key: str) -> Optional[Tuple[T, float]]:
+        """
+        Get a value even if expired, as long as it is inside the grace window.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            ``(value, seconds_since_expiry)`` (0.0 while still fresh), or None
+            if not found or expired longer ago than both grace windows
+        """
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                return None
+            expired_for = max(0.0, time.time() - entry[1])
+            if expired_for >= self._grace and expired_for > 0:
+                shard.drop(key)
+                return None
+            shard.entries.move_to_end(key)
+            if expired_for > 0:
+                shard.stale_hits += 1
+            return entry[0], expired_for
+
+    def set(self, key: str, value: T, ttl: Optional[float] = None) -> None:
         """
         Set value in cache with TTL.
 
         Args:
             key: Cache key
             value: Value to cache
+            ttl: Lifetime of this entry in seconds (default: the cache's TTL)
         """
-        with self._lock:
-            # Evict oldest entries if at max size
-            if len(self._cache) >= self._max_size and key not in self._cache:
-                self._evict_expired()
-                # If still at max, remove oldest entry
-                if len(self._cache) >= self._max_size:
-                    oldest_key = next(iter(self._cache))
-                    del self._cache[oldest_key]
-
-            expiry = time.time() + self._ttl
-            self._cache[key] = (value, expiry)
+        nbytes = self._sizeof(value)  # outside the lock: may walk a large payload
+        shard = self._shard(key)
+        now = time.time()
+        with shard.lock:
+            if key in shard.entries:
+                shard.drop(key)
+            if shard.max_bytes is not None and nbytes > shard.max_bytes:
+                return  # could never fit: caching it would only flush everything else
+            # Make room: expired entries first, then the least recently used
+            shard.make_room(now, self._grace, nbytes=nbytes)
+            shard.put(key, value, now + (self._ttl if ttl is None else ttl), nbytes)
 
     def _evict_expired(self) -> int:
-        """Remove all expired entries. Returns count of evicted items."""
+        """Remove all entries past expiry and grace. Returns count of evicted items."""
         now = time.time()
-        expired_keys = [k for k, (_, exp) in self._cache.items() if now >= exp]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        grace = self._grace
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                evicted += shard.evict_expired(now, grace)
+        return evicted
 
     def clear(self) -> None:
         """Clear all cached data."""
-        with self._lock:
-            self._cache.clear()
-            self._hits = 0
-            self._misses = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.expiries = []
+                shard.bytes = 0
+                shard.hits = 0
+                shard.misses = 0
+                shard.stale_hits = 0
 
     def stats(self) -> Dict[str, Any]:
         """
         Get cache statistics.
 
         Returns:
-            Dict with hits, misses, size, hit_rate
+            Dict with hits, misses, stale_hits, size, bytes, hit_rate
         """
-        with self._lock:
-            total = self._hits + self._misses
-            hit_rate = (self._hits / total * 100) if total > 0 else 0.0
-            return {
-                "hits": self._hits,
-                "misses": self._misses,
-                "size": len(self._cache),
-                "max_size": self._max_size,
-                "ttl": self._ttl,
-                "hit_rate": f"{hit_rate:.1f}%",
-            }
+        hits = misses = stale_hits = size = nbytes = 0
+        for shard in self._shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                stale_hits += shard.stale_hits
+                size += len(shard.entries)
+                nbytes += shard.bytes
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0.0
+        return {
+            "hits": hits,
+            "misses": misses,
+            "stale_hits": stale_hits,
+            "size": size,
+            "max_size": self._max_size,
+            "bytes": nbytes,
+            "max_bytes": self._max_bytes,
+            "stripes": len(self._shards),
+            "ttl": self._ttl,
+            "stale_while_revalidate": self.stale_while_revalidate,
+            "stale_if_error": self.stale_if_error,
+            "hit_rate": f"{hit_rate:.1f}%",
+        }
 
     @property
     def ttl(self) -> float:
@@ -158,19 +378,405 @@ class TTLCache(Generic[T]):
         """Set new TTL value (doesn't affect existing entries)."""
         self._ttl = value
 
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """Get the byte budget (None when only the entry count is bounded)."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: Optional[int]) -> None:
+        """Set a new byte budget, evicting least recently used entries to meet it."""
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int) or value < 1
+        ):
+            raise InvalidParameterError(f"max_bytes must be an integer >= 1 or None, got {value!r}")
+        self._max_bytes = value
+        per_stripe = None if value is None else -(-value // len(self._shards))
+        now = time.time()
+        for shard in self._shards:
+            with shard.lock:
+                shard.max_bytes = per_stripe
+                shard.make_room(now, self._grace, entries=0)
+
+
+def _retry_after_seconds(headers: Optional[Mapping[str, Any]]) -> Optional[float]:
+    """Seconds requested by a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateGovernor:
+    """
+    Thread- and asyncio-safe adaptive rate limiter (token bucket + concurrency cap).
+
+    Both limits follow AIMD, like TCP congestion control: every healthy
+    response adds ``increase`` requests/second to the rate (and one slot to the
+    concurrency cap per cap's worth of successes), every throttling response
+    multiplies both by ``decrease``. A ``Retry-After`` on the throttling
+    response also pauses all callers until it has passed, so throughput settles
+    just under the highest level the server tolerates.
+
+    Example:
+        >>> governor = RateGovernor(rate=5.0, max_concurrency=10)
+        >>> with governor.slot():
+        ...     response = session.get(url)
+        >>> governor.on_success()   # or governor.on_throttle(retry_after=30)
+        >>> governor.stats()['rate']
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        min_rate: float = 0.1,
+        max_rate: float = 50.0,
+        concurrency: int = 10,
+        max_concurrency: int = 20,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        max_wait: float = 60.0,
+        enabled: bool = True,
+    ):
+        """
+        Initialize the governor.
+
+        Args:
+            rate: Starting rate in requests/second
+            min_rate: Floor the rate never backs off below
+            max_rate: Ceiling the rate never grows above
+            concurrency: Starting number of requests allowed in flight
+            max_concurrency: Ceiling for the concurrency cap (floor is 1)
+            increase: Requests/second added per healthy response
+            decrease: Factor applied to rate and concurrency on throttling
+            max_wait: Longest Retry-After pause to sit out; a longer one makes
+                callers raise RateLimitError instead of blocking
+            enabled: If False, slots are granted immediately (feedback is
+                still recorded in stats)
+        """
+        if not 0 < min_rate <= rate <= max_rate:
+            raise InvalidParameterError("Need 0 < min_rate <= rate <= max_rate")
+        if not 1 <= concurrency <= max_concurrency:
+            raise InvalidParameterError("Need 1 <= concurrency <= max_concurrency")
+        if increase < 0 or not 0 < decrease < 1 or max_wait < 0:
+            raise InvalidParameterError("Need increase >= 0, 0 < decrease < 1, max_wait >= 0")
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self._initial = (float(rate), float(concurrency))
+        self._cond = threading.Condition()
+        self.reset()
+
+    def reset(self) -> None:
+        """Return to the starting rate and concurrency and clear all counters."""
+        with self._cond:
+            self._rate, self._limit = self._initial
+            self._tokens = max(1.0, self._rate)
+            self._refilled = time.monotonic()
+            self._paused_until = 0.0
+            self._in_flight = 0
+            self._successes = 0
+            self._throttles = 0
+            self._cond.notify_all()
+
+    def _reserve(self) -> float:
+        """Take a slot and a token if both are free; else the seconds to wait."""
+        with self._cond:
+            now = time.monotonic()
+            if not self.enabled:
+                self._in_flight += 1
+                return 0.0
+            pause = self._paused_until - now
+            if pause > self.max_wait:
+                raise RateLimitError(
+                    f"Rate limited: the server asked to wait {pause:.0f}s (Retry-After). "
+                    "Try again later."
+                )
+            if pause > 0:
+                return pause
+            capacity = max(1.0, self._rate)
+            self._tokens = min(capacity, self._tokens + max(0.0, now - self._refilled) * self._rate)
+            self._refilled = now
+            if self._in_flight >= int(self._limit):
+                return 0.05  # woken early by release() in the sync path
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self._rate
+            self._tokens -= 1.0
+            self._in_flight += 1
+            return 0.0
+
+    def _release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until a request may be sent; hold a concurrency slot meanwhile."""
+        while True:
+            wait = self._reserve()
+            if not wait:
+                break
+            with self._cond:
+                self._cond.wait(wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Async counterpart of :meth:`slot` (sleeps instead of blocking the loop)."""
+        while True:
+            wait = self._reserve()
+            if not wait:
+                break
+            await asyncio.sleep(wait)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def on_success(self) -> None:
+        """Additive increase after a healthy (2xx / 304) response."""
+        with self._cond:
+            self._successes += 1
+            self._rate = min(self.max_rate, self._rate + self.increase)
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._cond.notify_all()
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Multiplicative decrease after a 429 / 403, plus any Retry-After pause."""
+        with self._cond:
+            self._throttles += 1
+            self._rate = max(self.min_rate, self._rate * self.decrease)
+            self._limit = max(1.0, self._limit * self.decrease)
+            self._tokens = min(self._tokens, max(1.0, self._rate))
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits and counters, plus a one-word state."""
+        with self._cond:
+            pause = max(0.0, self._paused_until - time.monotonic())
+            if pause > 0:
+                state = "paused"
+            elif self._rate < self._initial[0]:
+                state = "recovering"
+            else:
+                state = "healthy"
+            return {
+                "state": state,
+                "enabled": self.enabled,
+                "rate": round(self._rate, 3),
+                "concurrency": int(self._limit),
+                "in_flight": self._in_flight,
+                "paused_for": round(pause, 3),
+                "successes": self._successes,
+                "throttles": self._throttles,
+                "min_rate": self.min_rate,
+                "max_rate": self.max_rate,
+                "max_concurrency": self.max_concurrency,
+            }
+
 
 # Global RSS cache instance (5 minute TTL, max 256 entries)
 _rss_cache: TTLCache = TTLCache(ttl=300.0, max_size=256)
 
+# Response validators (ETag / Last-Modified / content hash) plus the parsed
+# trends they describe, per RSS cache key. Outlives the response cache so an
+# expired entry — or a cache=False poll — can be revalidated with a
+# conditional GET instead of re-downloaded and re-parsed.
+_rss_validator_cache: TTLCache = TTLCache(ttl=86400.0, max_size=256)
+
+# In-process L1 in front of the cache='disk' SQLite table, keyed by archive
+# file + RSS cache key. Entries are ``(trends, stored_at)`` and are re-checked
+# against the current TTL on every hit, so both tiers agree on what is fresh;
+# a hot key costs a dict lookup instead of a connection, a schema check and a
+# JSON decode.
+_rss_disk_l1: TTLCache = TTLCache(ttl=300.0, max_size=256)
+
+
+class RetryPolicy:
+    """
+    How transient failures are retried: jittered, capped exponential backoff.
+
+    A failed attempt is retried when it is transient — a connection failure, a
+    timeout, or an HTTP status in ``retry_statuses`` — until ``max_attempts``
+    is reached or the next wait would overrun ``deadline``. The wait before
+    attempt ``n + 1`` is ``min(backoff_cap, backoff_base * 2 ** (n - 1))``
+    with the ``jitter`` fraction of it randomized (1.0 = "full jitter", so a
+    sweep's retries spread out instead of landing on Google in lockstep), and
+    never shorter than a ``Retry-After`` the server sent.
+
+    Example:
+        >>> policy = RetryPolicy(max_attempts=5, backoff_cap=4.0, deadline=30)
+        >>> trends = download_google_trends_rss(geo='US', retry=policy)
+        >>> no_retry = RetryPolicy(max_attempts=1)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        jitter: float = 1.0,
+        retry_statuses: Iterable[int] = (500, 502, 503, 504),
+        deadline: Optional[float] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts including the first (1 = no retries)
+            backoff_base: Wait before the first retry, in seconds (doubles per retry)
+            backoff_cap: Longest wait between two attempts, in seconds
+            jitter: Fraction of each wait that is randomized, 0.0-1.0
+            retry_statuses: HTTP statuses worth another attempt. 429 is not
+                included by default: the rate governor already backs off on it.
+            deadline: Seconds allowed for all attempts together (None = no limit)
+        """
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int) or max_attempts < 1:
+            raise InvalidParameterError(
+                f"max_attempts must be an integer >= 1, got {max_attempts!r}"
+            )
+        if backoff_base < 0 or backoff_cap < backoff_base:
+            raise InvalidParameterError("Need 0 <= backoff_base <= backoff_cap")
+        if not 0.0 <= jitter <= 1.0:
+            raise InvalidParameterError(f"jitter must be between 0.0 and 1.0, got {jitter!r}")
+        if deadline is not None and deadline <= 0:
+            raise InvalidParameterError(f"deadline must be > 0 seconds or None, got {deadline!r}")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.deadline = deadline
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based)."""
+        delay = min(self.backoff_cap, self.backoff_base * 2.0 ** (attempt - 1))
+        delay = delay * (1.0 - self.jitter) + random.uniform(0.0, delay * self.jitter)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def should_retry(self, attempt: int, elapsed: float, wait: float) -> bool:
+        """Whether attempt ``attempt + 1`` may start ``wait`` seconds from now."""
+        if attempt >= self.max_attempts:
+            return False
+        return self.deadline is None or elapsed + wait < self.deadline
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, backoff_base={self.backoff_base}, "
+            f"backoff_cap={self.backoff_cap}, jitter={self.jitter}, "
+            f"retry_statuses={sorted(self.retry_statuses)}, deadline={self.deadline})"
+        )
+
+
+def _describe_attempts(attempts: Iterable[Mapping[str, Any]]) -> str:
+    """One line per attempt, for the message of an error raised after retries."""
+    lines = []
+    for a in attempts:
+        line = f"  {a['attempt']}. {a['error']} after {a['elapsed']:.2f}s"
+        if a["wait"]:
+            line += f", retried after {a['wait']:.2f}s"
+        lines.append(line)
+    return "Attempts:\n" + "\n".join(lines)
+
+
+# Process-wide governor shared by every RSS entry point (sync, async, batches)
+_rss_governor = RateGovernor()
+
+
+def get_rss_governor() -> RateGovernor:
+    """Get the process-wide RSS rate governor."""
+    return _rss_governor
+
+
+def get_rss_governor_stats() -> Dict[str, Any]:
+    """
+    Get the state of the RSS rate governor.
+
+    Returns:
+        Dict with 'state' ('healthy', 'recovering' after a 429/403, or
+        'paused' while honoring a Retry-After), the current 'rate'
+        (requests/second) and 'concurrency' cap, 'in_flight', 'paused_for'
+        (seconds), and 'successes' / 'throttles' counters.
+    """
+    return _rss_governor.stats()
+
+
+def configure_rss_governor(
+    rate: float = 10.0,
+    min_rate: float = 0.1,
+    max_rate: float = 50.0,
+    concurrency: int = 10,
+    max_concurrency: int = 20,
+    enabled: bool = True,
+) -> None:
+    """
+    Reconfigure the process-wide RSS rate governor (and reset its state).
+
+    Args:
+        rate: Starting rate in requests/second
+        min_rate: Lowest rate it backs off to on 429/403
+        max_rate: Highest rate it grows to while responses are healthy
+        concurrency: Starting number of requests in flight
+        max_concurrency: Highest concurrency cap it grows to
+        enabled: False turns throttling off (stats are still kept)
+
+    Raises:
+        InvalidParameterError: If the limits are inconsistent
+    """
+    global _rss_governor
+    _rss_governor = RateGovernor(
+        rate=rate,
+        min_rate=min_rate,
+        max_rate=max_rate,
+        concurrency=concurrency,
+        max_concurrency=max_concurrency,
+        enabled=enabled,
+    )
+
 
 def get_rss_cache() -> TTLCache:
     """Get the global RSS cache instance."""
     return _rss_cache
 
 
+def get_rss_validator_cache() -> TTLCache:
+    """Get the global RSS revalidation store (validators + last parsed trends)."""
+    return _rss_validator_cache
+
+
+def get_rss_disk_l1() -> TTLCache:
+    """Get the in-process L1 kept in front of the RSS disk cache."""
+    return _rss_disk_l1
+
+
 def clear_rss_cache() -> None:
-    """Clear the global RSS cache."""
+    """Clear the global RSS cache (the validators kept for revalidation and the
+    disk cache's in-process L1 too; the disk rows themselves are left alone)."""
     _rss_cache.clear()
+    _rss_validator_cache.clear()
+    _rss_disk_l1.clear()
 
 
 def get_rss_cache_stats() -> Dict[str, Any]:
@@ -188,6 +794,55 @@ def set_rss_cache_ttl(ttl: float) -> None:
     _rss_cache.ttl = ttl
 
 
+def configure_rss_cache(
+    stale_while_revalidate: Optional[float] = None,
+    stale_if_error: Optional[float] = None,
+    max_bytes: Optional[int] = None,
+) -> None:
+    """
+    Tune the in-process RSS caches: stale serving and a memory ceiling.
+
+    The stale windows apply to ``cache=True`` and ``cache='disk'``; both count
+    from the moment an entry expires and are off (0) by default. Arguments
+    left as None keep their current value.
+
+    Args:
+        stale_while_revalidate: Seconds during which an expired feed is
+            returned at once while a background fetch refreshes it
+        stale_if_error: Seconds during which an expired feed is returned, with
+            a StaleDataWarning, when fetching a fresh one fails
+        max_bytes: Approximate memory budget for each in-process RSS cache
+            (responses, the revalidation store and the disk cache's L1), with
+            least recently used feeds evicted to stay under it. 0 removes the
+            budget (the default: entry count only).
+
+    Raises:
+        InvalidParameterError: If a window is negative or not a number, or
+            max_bytes is not an integer >= 0
+
+    Example:
+        >>> configure_rss_cache(stale_while_revalidate=60, stale_if_error=3600)
+        >>> configure_rss_cache(max_bytes=32 * 1024 * 1024)  # ~32 MB per cache
+    """
+    if max_bytes is not None and (
+        isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes < 0
+    ):
+        raise InvalidParameterError(f"max_bytes must be an integer >= 0, got {max_bytes!r}")
+    windows = {"stale_while_revalidate": stale_while_revalidate, "stale_if_error": stale_if_error}
+    for name, value in windows.items():
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0
+        ):
+            raise InvalidParameterError(f"{name} must be a number >= 0, got {value!r}")
+    if stale_while_revalidate is not None:
+        _rss_cache.stale_while_revalidate = float(stale_while_revalidate)
+    if stale_if_error is not None:
+        _rss_cache.stale_if_error = float(stale_if_error)
+    if max_bytes is not None:
+        for cache in (_rss_cache, _rss_validator_cache, _rss_disk_l1):
+            cache.max_bytes = max_bytes or None
+
+
 def get_timestamp() -> str:
     """Get current timestamp in YYYYMMDD-HHMMSS format."""
     return datetime.now().strftime("%Y%m%d-%H%M%S")